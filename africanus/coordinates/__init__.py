@@ -3,4 +3,6 @@ from __future__ import division
 from __future__ import print_function
 
 from .coordinates import (radec_to_lmn, radec_to_lm,
-                          lmn_to_radec, lm_to_radec)
+                          lmn_to_radec, lm_to_radec,
+                          radec_to_lmn_batch, radec_to_lm_batch,
+                          lmn_to_radec_batch, lm_to_radec_batch)
@@ -169,6 +169,128 @@ if not on_rtd():
     radec_to_lm = jitter(radec_to_lm)
 
 
+def _radec_trig(radec):
+    """
+    Returns :code:`(sin(ra), cos(ra), sin(dec), cos(dec))`
+    of each ``radec`` coordinate in an array of shape :code:`(coord, 4)`
+    """
+    if radec.ndim != 2 or radec.shape[1] != 2:
+        raise ValueError("radec must have shape (coord, 2)")
+
+    ra = radec[:, 0]
+    dec = radec[:, 1]
+    return np.stack([np.sin(ra), np.cos(ra), np.sin(dec), np.cos(dec)],
+                    axis=1)
+
+
+@numba.jit(nopython=True, nogil=True, cache=True, parallel=True)
+def _trig_to_lm(source_trig, centre_trig, lm):
+    """
+    Computes the lm or lmn coordinates of each source relative to
+    each phase centre into ``lm`` of shape :code:`(centre, source, comp)`,
+    from the precomputed trigonometry of the sources and phase centres.
+    """
+    ncentres, nsources, ncomps = lm.shape
+
+    for s in numba.prange(nsources):
+        sin_a = source_trig[s, 0]
+        cos_a = source_trig[s, 1]
+        sin_d = source_trig[s, 2]
+        cos_d = source_trig[s, 3]
+
+        for c in range(ncentres):
+            sin_a0 = centre_trig[c, 0]
+            cos_a0 = centre_trig[c, 1]
+            sin_d0 = centre_trig[c, 2]
+            cos_d0 = centre_trig[c, 3]
+
+            # Angle difference identities for the RA offset
+            sin_da = sin_a*cos_a0 - cos_a*sin_a0
+            cos_da = cos_a*cos_a0 + sin_a*sin_a0
+
+            lm[c, s, 0] = l = cos_d*sin_da
+            lm[c, s, 1] = m = sin_d*cos_d0 - cos_d*sin_d0*cos_da
+
+            if ncomps == 3:
+                lm[c, s, 2] = np.sqrt(1.0 - l**2 - m**2)
+
+    return lm
+
+
+@numba.jit(nopython=True, nogil=True, cache=True, parallel=True)
+def _lm_to_radec_batch(lm, phase_centres, radec):
+    """
+    Computes the radec coordinates of the lm or lmn coordinates
+    ``lm`` of shape :code:`(centre, source, comp)`,
+    relative to each phase centre
+    """
+    ncentres, nsources, ncomps = lm.shape
+
+    sin_d0 = np.sin(phase_centres[:, 1])
+    cos_d0 = np.cos(phase_centres[:, 1])
+
+    for s in numba.prange(nsources):
+        for c in range(ncentres):
+            l = lm[c, s, 0]
+            m = lm[c, s, 1]
+
+            if ncomps == 3:
+                n = lm[c, s, 2]
+            else:
+                n = np.sqrt(1.0 - l**2 - m**2)
+
+            radec[c, s, 1] = np.arcsin(m*cos_d0[c] + n*sin_d0[c])
+            radec[c, s, 0] = (phase_centres[c, 0] +
+                              np.arctan(l / (n*cos_d0[c] - m*sin_d0[c])))
+
+    return radec
+
+
+def _check_phase_centres(phase_centres):
+    if phase_centres.ndim != 2 or phase_centres.shape[1] != 2:
+        raise ValueError("phase_centres must have shape (centre, 2)")
+
+
+def _radec_to_lm_batch(radec, phase_centres, ncomps):
+    _check_phase_centres(phase_centres)
+    source_trig = _radec_trig(radec)
+    centre_trig = _radec_trig(phase_centres)
+    dtype = np.result_type(radec, phase_centres)
+    lm = np.empty((phase_centres.shape[0], radec.shape[0], ncomps),
+                  dtype=dtype)
+
+    return _trig_to_lm(source_trig, centre_trig, lm)
+
+
+def radec_to_lmn_batch(radec, phase_centres):
+    return _radec_to_lm_batch(radec, phase_centres, 3)
+
+
+def radec_to_lm_batch(radec, phase_centres):
+    return _radec_to_lm_batch(radec, phase_centres, 2)
+
+
+def _lm_to_radec(lm, phase_centres, ncomps):
+    _check_phase_centres(phase_centres)
+
+    if (lm.ndim != 3 or lm.shape[0] != phase_centres.shape[0] or
+            lm.shape[2] != ncomps):
+        raise ValueError("lm must have shape (centre, source, %d)" % ncomps)
+
+    dtype = np.result_type(lm, phase_centres)
+    radec = np.empty(lm.shape[:2] + (2,), dtype=dtype)
+
+    return _lm_to_radec_batch(lm, phase_centres, radec)
+
+
+def lmn_to_radec_batch(lmn, phase_centres):
+    return _lm_to_radec(lmn, phase_centres, 3)
+
+
+def lm_to_radec_batch(lm, phase_centres):
+    return _lm_to_radec(lm, phase_centres, 2)
+
+
 RADEC_TO_LMN_DOCS = DocstringTemplate(r"""
 Converts Right-Ascension/Declination coordinates in radians
 to a Direction Cosine lm coordinates, relative to the Phase Centre.
@@ -239,6 +361,59 @@ $(array_type)
 
 """)
 
+RADEC_TO_LMN_BATCH_DOCS = DocstringTemplate(r"""
+Converts Right-Ascension/Declination coordinates in radians to
+Direction Cosine lm coordinates, relative to each of a number of
+Phase Centres, for example the pointings of a mosaic or facet centres.
+
+Equivalent to calling :func:`~africanus.coordinates.$(single)`
+for each Phase Centre, but the sines and cosines of each coordinate
+and Phase Centre are only computed once and the
+coordinates are converted in parallel.
+
+Parameters
+----------
+radec : $(array_type)
+    radec coordinates of shape :code:`(source, 2)`
+    where Right-Ascension and Declination are in the
+    last 2 components, respectively.
+phase_centres : $(array_type)
+    radec coordinates of the Phase Centres.
+    Shape :code:`(centre, 2)`
+
+Returns
+-------
+$(array_type)
+    lm Direction Cosines of shape
+    :code:`(centre, source, $(lm_components))`
+""")
+
+
+LMN_TO_RADEC_BATCH_DOCS = DocstringTemplate(r"""
+Converts Direction Cosine lm coordinates, relative to each of a number
+of Phase Centres, to Right Ascension/Declination coordinates in radians.
+
+Equivalent to calling :func:`~africanus.coordinates.$(single)`
+for each Phase Centre, but the coordinates are converted in parallel.
+
+Parameters
+----------
+$(lm_name) : $(array_type)
+    lm Direction Cosines of shape
+    :code:`(centre, source, $(lm_components))`
+phase_centres : $(array_type)
+    radec coordinates of the Phase Centres.
+    Shape :code:`(centre, 2)`
+
+Returns
+-------
+$(array_type)
+    radec coordinates of shape :code:`(centre, source, 2)`
+    where Right-Ascension and Declination are in the
+    last 2 components, respectively.
+""")
+
+
 try:
     radec_to_lmn.__doc__ = RADEC_TO_LMN_DOCS.substitute(
                                 lm_components="3",
@@ -252,6 +427,20 @@ try:
     lm_to_radec.__doc__ = LMN_TO_RADEC_DOCS.substitute(
                                 lm_name="lm", lm_components="2",
                                 array_type=":class:`numpy.ndarray`")
+    radec_to_lmn_batch.__doc__ = RADEC_TO_LMN_BATCH_DOCS.substitute(
+                                single="radec_to_lmn", lm_components="3",
+                                array_type=":class:`numpy.ndarray`")
+    radec_to_lm_batch.__doc__ = RADEC_TO_LMN_BATCH_DOCS.substitute(
+                                single="radec_to_lm", lm_components="2",
+                                array_type=":class:`numpy.ndarray`")
+    lmn_to_radec_batch.__doc__ = LMN_TO_RADEC_BATCH_DOCS.substitute(
+                                single="lmn_to_radec",
+                                lm_name="lmn", lm_components="3",
+                                array_type=":class:`numpy.ndarray`")
+    lm_to_radec_batch.__doc__ = LMN_TO_RADEC_BATCH_DOCS.substitute(
+                                single="lm_to_radec",
+                                lm_name="lm", lm_components="2",
+                                array_type=":class:`numpy.ndarray`")
 
 except AttributeError:
     pass
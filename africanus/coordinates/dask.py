@@ -20,8 +20,11 @@ from .coordinates import (radec_to_lmn as np_radec_to_lmn,
                           radec_to_lm as np_radec_to_lm,
                           lmn_to_radec as np_lmn_to_radec,
                           lm_to_radec as np_lm_to_radec,
+                          _radec_trig, _trig_to_lm, _lm_to_radec_batch,
                           RADEC_TO_LMN_DOCS,
-                          LMN_TO_RADEC_DOCS)
+                          LMN_TO_RADEC_DOCS,
+                          RADEC_TO_LMN_BATCH_DOCS,
+                          LMN_TO_RADEC_BATCH_DOCS)
 
 
 @wraps(np_radec_to_lmn)
@@ -88,6 +91,72 @@ def lm_to_radec(lm, phase_centre=None):
                         dtype=lm.dtype)
 
 
+def _dask_trig(radec, dim):
+    """ Trigonometry of each radec coordinate, computed once per chunk """
+    return da.core.atop(_radec_trig, (dim, "trig"),
+                        radec, (dim, "radec"),
+                        new_axes={"trig": 4},
+                        concatenate=True,
+                        dtype=radec.dtype)
+
+
+def _lm_batch(source_trig, centre_trig, ncomps):
+    dtype = np.result_type(source_trig, centre_trig)
+    lm = np.empty((centre_trig.shape[0], source_trig.shape[0], ncomps),
+                  dtype=dtype)
+    return _trig_to_lm(source_trig, centre_trig, lm)
+
+
+def _radec_to_lm_batch(radec, phase_centres, ncomps):
+    # The trigonometry of each source and phase centre chunk
+    # is computed once and shared by all (centre, source) chunk pairs
+    source_trig = _dask_trig(radec, "source")
+    centre_trig = _dask_trig(phase_centres, "centre")
+
+    return da.core.atop(_lm_batch, ("centre", "source", "lm"),
+                        source_trig, ("source", "trig"),
+                        centre_trig, ("centre", "trig"),
+                        new_axes={"lm": ncomps},
+                        concatenate=True,
+                        ncomps=ncomps,
+                        dtype=np.result_type(radec, phase_centres))
+
+
+@requires_optional('dask.array')
+def radec_to_lmn_batch(radec, phase_centres):
+    return _radec_to_lm_batch(radec, phase_centres, 3)
+
+
+@requires_optional('dask.array')
+def radec_to_lm_batch(radec, phase_centres):
+    return _radec_to_lm_batch(radec, phase_centres, 2)
+
+
+def _radec_batch(lm, phase_centres):
+    dtype = np.result_type(lm, phase_centres)
+    radec = np.empty(lm.shape[:2] + (2,), dtype=dtype)
+    return _lm_to_radec_batch(lm, phase_centres, radec)
+
+
+def _lm_to_radec_batch_wrapper(lm, phase_centres):
+    return da.core.atop(_radec_batch, ("centre", "source", "radec"),
+                        lm, ("centre", "source", "lm"),
+                        phase_centres, ("centre", "pc"),
+                        new_axes={"radec": 2},
+                        concatenate=True,
+                        dtype=np.result_type(lm, phase_centres))
+
+
+@requires_optional('dask.array')
+def lmn_to_radec_batch(lmn, phase_centres):
+    return _lm_to_radec_batch_wrapper(lmn, phase_centres)
+
+
+@requires_optional('dask.array')
+def lm_to_radec_batch(lm, phase_centres):
+    return _lm_to_radec_batch_wrapper(lm, phase_centres)
+
+
 try:
     radec_to_lmn.__doc__ = RADEC_TO_LMN_DOCS.substitute(
                                 lm_components="3",
@@ -101,6 +170,20 @@ try:
     lm_to_radec.__doc__ = LMN_TO_RADEC_DOCS.substitute(
                                 lm_name="lm", lm_components="2",
                                 array_type=":class:`dask.array.Array`")
+    radec_to_lmn_batch.__doc__ = RADEC_TO_LMN_BATCH_DOCS.substitute(
+                                single="radec_to_lmn", lm_components="3",
+                                array_type=":class:`dask.array.Array`")
+    radec_to_lm_batch.__doc__ = RADEC_TO_LMN_BATCH_DOCS.substitute(
+                                single="radec_to_lm", lm_components="2",
+                                array_type=":class:`dask.array.Array`")
+    lmn_to_radec_batch.__doc__ = LMN_TO_RADEC_BATCH_DOCS.substitute(
+                                single="lmn_to_radec",
+                                lm_name="lmn", lm_components="3",
+                                array_type=":class:`dask.array.Array`")
+    lm_to_radec_batch.__doc__ = LMN_TO_RADEC_BATCH_DOCS.substitute(
+                                single="lm_to_radec",
+                                lm_name="lm", lm_components="2",
+                                array_type=":class:`dask.array.Array`")
 
 
 except AttributeError:
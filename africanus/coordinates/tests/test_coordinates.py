@@ -96,3 +96,76 @@ def test_dask_radec_to_lmn():
     assert da.all(da_radec_to_lm(da_radec) == da_radec_to_lm(da_radec, zpc)).compute()    # noqa
     assert da.all(da_lmn_to_radec(da_lmn) == da_lmn_to_radec(da_lmn, zpc)).compute()      # noqa
     assert da.all(da_lm_to_radec(da_lm) == da_lm_to_radec(da_lm, zpc)).compute()          # noqa
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_radec_to_lmn_batch(dtype):
+    from africanus.coordinates import (radec_to_lmn_batch,
+                                       radec_to_lm_batch,
+                                       lmn_to_radec_batch,
+                                       lm_to_radec_batch)
+
+    radec = (np.random.random((10, 2))*np.pi).astype(dtype)
+    phase_centres = (np.random.random((3, 2))*np.pi).astype(dtype)
+
+    lmn = radec_to_lmn_batch(radec, phase_centres)
+    lm = radec_to_lm_batch(radec, phase_centres)
+    assert lmn.shape == (3, 10, 3) and lm.shape == (3, 10, 2)
+    assert lmn.dtype == lm.dtype == dtype
+
+    rtol = 1e-4 if dtype == np.float32 else 1e-7
+
+    for c, pc in enumerate(phase_centres):
+        expected = np_radec_to_lmn(radec, pc)
+        assert np.allclose(lmn[c], expected, rtol=rtol, atol=rtol)
+        assert np.all(lm[c] == lmn[c, :, :2])
+
+    radec_1 = lmn_to_radec_batch(lmn, phase_centres)
+    radec_2 = lm_to_radec_batch(lm, phase_centres)
+    assert radec_1.shape == radec_2.shape == (3, 10, 2)
+
+    for c, pc in enumerate(phase_centres):
+        expected = np_lmn_to_radec(lmn[c], pc)
+        assert np.allclose(radec_1[c], expected, rtol=rtol, atol=rtol)
+        assert np.allclose(radec_2[c], expected, rtol=rtol, atol=rtol)
+
+    with pytest.raises(ValueError):
+        radec_to_lmn_batch(radec, phase_centres[0])
+
+    with pytest.raises(ValueError):
+        lm_to_radec_batch(lmn, phase_centres)
+
+
+def test_dask_radec_to_lmn_batch():
+    da = pytest.importorskip("dask.array")
+
+    from africanus.coordinates import (radec_to_lmn_batch,
+                                       lmn_to_radec_batch)
+    from africanus.coordinates.dask import (
+        radec_to_lmn_batch as da_radec_to_lmn_batch,
+        radec_to_lm_batch as da_radec_to_lm_batch,
+        lmn_to_radec_batch as da_lmn_to_radec_batch,
+        lm_to_radec_batch as da_lm_to_radec_batch)
+
+    source_chunks = (5, 5, 5)
+    centre_chunks = (2, 1)
+
+    radec = np.random.random((sum(source_chunks), 2))*np.pi
+    phase_centres = np.random.random((sum(centre_chunks), 2))*np.pi
+
+    da_radec = da.from_array(radec, chunks=(source_chunks, 2))
+    da_phase_centres = da.from_array(phase_centres, chunks=(centre_chunks, 2))
+
+    np_lmn = radec_to_lmn_batch(radec, phase_centres)
+    da_lmn = da_radec_to_lmn_batch(da_radec, da_phase_centres)
+    assert da_lmn.chunks == (centre_chunks, source_chunks, (3,))
+    assert np.all(da_lmn.compute() == np_lmn)
+
+    da_lm = da_radec_to_lm_batch(da_radec, da_phase_centres)
+    assert np.all(da_lm.compute() == np_lmn[:, :, :2])
+
+    np_radec = lmn_to_radec_batch(np_lmn, phase_centres)
+    assert np.all(da_lmn_to_radec_batch(da_lmn, da_phase_centres).compute()
+                  == np_radec)
+    assert np.allclose(da_lm_to_radec_batch(da_lm, da_phase_centres),
+                       np_radec)
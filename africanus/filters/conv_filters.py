@@ -10,11 +10,16 @@ import numpy as np
 
 from .kaiser_bessel_filter import (kaiser_bessel_with_sinc,
                                    estimate_kaiser_bessel_beta)
+from ..util.code import memoize_on_key
+
+# Maximum number of cached Convolution Filters
+_FILTER_CACHE_SIZE = 16
 
 ConvolutionFilter = collections.namedtuple("ConvolutionFilter",
                                            ['half_sup', 'oversample',
                                             'full_sup_wo_padding', 'full_sup',
-                                            'no_taps', 'filter_taps'])
+                                            'no_taps', 'filter_taps',
+                                            'phase_taps'])
 """
 :class:`collections.namedtuple` containing attributes
 defining a 2D Convolution Filter. A namedtuple is used
@@ -44,6 +49,15 @@ because they're easier to use when using
 .. attribute:: filter_taps
 
     2D filter taps with shape (v, u)
+
+.. attribute:: phase_taps
+
+    1D filter taps of each oversampled phase, with shape
+    :code:`(oversample, full_sup)`. The filter is separable, so
+    :code:`filter_taps[v, u] == taps[v] * taps[u]`, where
+    :code:`taps[k*oversample + p] == phase_taps[p, k]`.
+    Each phase is contiguous in memory, so that a visibility
+    reads one row of taps for each axis.
 """
 
 
@@ -51,6 +65,19 @@ class AsymmetricKernel(Exception):
     pass
 
 
+def _filter_key(half_support, oversampling_factor, filter_type, **kwargs):
+    """ Produces a unique key for :func:`convolution_filter` """
+    if filter_type == 'kaiser-bessel':
+        full_sup = half_support * 2 + 3
+        beta = kwargs.get('beta', estimate_kaiser_bessel_beta(full_sup))
+        normalise = kwargs.get('normalise', True)
+        return (filter_type, half_support, oversampling_factor,
+                float(beta), bool(normalise))
+
+    return (filter_type, half_support, oversampling_factor)
+
+
+@memoize_on_key(_filter_key, maxsize=_FILTER_CACHE_SIZE)
 def convolution_filter(half_support, oversampling_factor,
                        filter_type, **kwargs):
     r"""
@@ -80,6 +107,13 @@ def convolution_filter(half_support, oversampling_factor,
     -------
     :class:`ConvolutionFilter`
         namedtuple containing filter attributes
+
+    Notes
+    -----
+    Filters are cached on ``(filter_type, half_support,
+    oversampling_factor, beta, normalise)``, so that repeated calls
+    return the same read-only filter. The least recently used
+    filter is evicted when more than 16 filters are cached.
     """
     full_sup_wo_padding = (half_support * 2 + 1)
     full_sup = full_sup_wo_padding + 2  # + padding
@@ -105,12 +139,22 @@ def convolution_filter(half_support, oversampling_factor,
     else:
         raise ValueError("Expected one of {'kaiser-bessel', 'sinc'}")
 
+    # Lay out the taps of each oversampled phase contiguously,
+    # zero padding taps beyond the end of the filter
+    padded = np.zeros(full_sup * oversampling_factor, dtype=filter_taps.dtype)
+    padded[:no_taps] = filter_taps
+    phase_taps = padded.reshape(full_sup, oversampling_factor).T.copy()
+
     # Expand filter taps to 2D
     filter_taps = np.outer(filter_taps, filter_taps)
 
     if not np.all(filter_taps == filter_taps.T):
         raise AsymmetricKernel("Kernel is asymmetric")
 
+    # Shared between callers by the cache
+    filter_taps.flags.writeable = False
+    phase_taps.flags.writeable = False
+
     return ConvolutionFilter(half_support, oversampling_factor,
                              full_sup_wo_padding, full_sup,
-                             no_taps, filter_taps)
+                             no_taps, filter_taps, phase_taps)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+from collections import namedtuple
+import itertools
+import logging
+import timeit
+
+import numpy as np
+
+from .conv_filters import convolution_filter
+from .filter_tapers import taper
+from ..constants import c as lightspeed
+from ..dft.kernels import im_to_vis
+from ..gridding.simple.gridding import numba_grid, numba_degrid
+from ..util.cmdline import parse_python_assigns
+
+FilterAccuracy = namedtuple("FilterAccuracy",
+                            ["filter_type", "half_support", "oversample",
+                             "dynamic_range", "grid_time", "degrid_time"])
+"""
+:class:`collections.namedtuple` describing the accuracy and
+cost of a Convolution Filter, as measured by
+:func:`filter_accuracy`.
+
+.. attribute:: filter_type
+
+    Filter type
+
+.. attribute:: half_support
+
+    Half support of the filter
+
+.. attribute:: oversample
+
+    Oversampling factor of the filter
+
+.. attribute:: dynamic_range
+
+    Total flux of the test image divided by the maximum
+    absolute difference between the degridded and DFT visibilities
+
+.. attribute:: grid_time
+
+    Best time in seconds taken to grid the test visibilities
+
+.. attribute:: degrid_time
+
+    Best time in seconds taken to degrid the test visibilities
+"""
+
+_AccuracyProblem = namedtuple("_AccuracyProblem",
+                              ["image", "uvw", "wavelengths",
+                               "cell_size", "vis", "flux"])
+
+# Reference frequency of the test problem
+_FREQUENCY = 1e9
+
+
+def _accuracy_problem(ny, nx, max_half_support, nsources, nrows, fov, seed):
+    """
+    Creates a test image of ``nsources`` point sources within the central
+    ``fov`` fraction of a ``(ny, nx)`` image, random UVW coordinates
+    that keep the filter within the grid and the DFT visibilities.
+    """
+    rs = np.random.RandomState(seed)
+
+    # Cell size keeps the image within 0.1 radians of the phase centre
+    cell_rad = 0.1 / max(ny, nx)
+    cell_size = np.rad2deg(cell_rad) * 3600.0
+    wavelengths = np.array([lightspeed / _FREQUENCY])
+
+    # Point sources within the field of view
+    y = ny // 2 + rs.randint(-int(fov*ny) // 2, int(fov*ny) // 2 + 1,
+                             size=nsources)
+    x = nx // 2 + rs.randint(-int(fov*nx) // 2, int(fov*nx) // 2 + 1,
+                             size=nsources)
+    flux = rs.random_sample(nsources)
+    image = np.zeros((ny, nx), dtype=np.float64)
+    np.add.at(image, (y, x), flux)
+
+    # UVW coordinates in metres. In grid units,
+    # the filter should never fall outside the grid
+    uvw = np.zeros((nrows, 3), dtype=np.float64)
+    extent = np.array([nx, ny]) // 2 - max_half_support - 2
+    grid_uv = (rs.random_sample((nrows, 2))*2 - 1) * extent
+    uvw[:, :2] = grid_uv * wavelengths[0] / (cell_rad * np.array([nx, ny]))
+
+    lm = np.stack([(x - nx // 2) * cell_rad,
+                   (y - ny // 2) * cell_rad], axis=1)
+    vis = im_to_vis(flux[:, None], uvw, lm, np.array([_FREQUENCY]))
+
+    return _AccuracyProblem(image, uvw, wavelengths, cell_size,
+                            vis[:, 0], flux.sum())
+
+
+def _best_time(fn, repeat=3):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def _measure(problem, filter_type, half_support, oversample, **kwargs):
+    """ Measures filter accuracy and cost on ``problem`` """
+    cf = convolution_filter(half_support, oversample,
+                            filter_type, **kwargs)
+    ny, nx = problem.image.shape
+    taper_y, taper_x = taper(filter_type, ny, nx, cf,
+                             separable=True, **kwargs)
+    corrected = problem.image / taper_y[:, None] / taper_x[None, :]
+    grid = np.fft.fftshift(np.fft.fft2(np.fft.ifftshift(corrected)))
+    grid = grid[:, :, None]
+
+    nrows = problem.uvw.shape[0]
+    vis = np.zeros((nrows, 1, 1), dtype=np.complex128)
+    weights = np.ones((nrows, 1, 1), dtype=np.float64)
+    flags = np.zeros((nrows, 1, 1), dtype=np.uint8)
+
+    def _degrid():
+        vis.fill(0)
+        numba_degrid(grid, problem.uvw, weights, problem.wavelengths,
+                     cf, problem.cell_size, vis)
+
+    def _grid():
+        numba_grid(vis, problem.uvw, flags, weights, problem.wavelengths,
+                   cf, problem.cell_size, np.zeros_like(grid))
+
+    degrid_time = _best_time(_degrid)
+    grid_time = _best_time(_grid)
+    error = np.abs(vis[:, 0, 0] - problem.vis).max()
+
+    return FilterAccuracy(filter_type, half_support, oversample,
+                          problem.flux / error if error > 0 else np.inf,
+                          grid_time, degrid_time)
+
+
+def filter_accuracy(ny, nx, half_supports, oversamples,
+                    filter_type="kaiser-bessel",
+                    nsources=10, nrows=10000, fov=0.5, seed=42,
+                    **kwargs):
+    """
+    Measures the accuracy and cost of Convolution Filters
+    over a sweep of ``half_supports`` and ``oversamples``.
+
+    A ``(ny, nx)`` test image of ``nsources`` point sources
+    in the central ``fov`` fraction of the image is corrected by the
+    filter :func:`~africanus.filters.taper`, Fourier transformed
+    and degridded at ``nrows`` random UVW coordinates.
+    The degridded visibilities are compared against the visibilities
+    computed by :func:`~africanus.dft.im_to_vis`.
+    The cost is measured by timing the gridder and degridder.
+
+    Parameters
+    ----------
+    ny : int
+        Number of pixels in the v dimension.
+    nx : int
+        Number of pixels in the u dimension.
+    half_supports : iterable of int
+        Half supports of the filters
+    oversamples : iterable of int
+        Oversampling factors of the filters
+    filter_type : {'kaiser-bessel', 'sinc'}, optional
+        Filter type. Defaults to ``'kaiser-bessel'``.
+    nsources : int, optional
+        Number of point sources in the test image
+    nrows : int, optional
+        Number of visibilities to degrid
+    fov : float, optional
+        Fraction of the image containing point sources
+    seed : int, optional
+        Random seed for the test problem
+    **kwargs : optional
+        Extra keyword arguments passed to
+        :func:`~africanus.filters.convolution_filter`
+        and :func:`~africanus.filters.taper`.
+
+    Returns
+    -------
+    list of :class:`FilterAccuracy`
+        Accuracy and cost of each filter
+    """
+    half_supports = list(half_supports)
+    oversamples = list(oversamples)
+
+    problem = _accuracy_problem(ny, nx, max(half_supports),
+                                nsources, nrows, fov, seed)
+
+    return [_measure(problem, filter_type, hs, os, **kwargs)
+            for hs, os in itertools.product(half_supports, oversamples)]
+
+
+def recommend_filter(accuracies, dynamic_range):
+    """
+    Recommends the filter with the smallest half support, and then
+    the smallest oversampling factor, that achieves ``dynamic_range``.
+
+    Parameters
+    ----------
+    accuracies : list of :class:`FilterAccuracy`
+        Filter accuracies produced by :func:`filter_accuracy`
+    dynamic_range : float
+        Target dynamic range
+
+    Returns
+    -------
+    :class:`FilterAccuracy` or None
+        The recommended filter, or ``None``
+        if no filter achieves ``dynamic_range``.
+    """
+    candidates = [a for a in accuracies if a.dynamic_range >= dynamic_range]
+
+    if len(candidates) == 0:
+        return None
+
+    return min(candidates, key=lambda a: (a.half_support, a.oversample))
+
+
+def _int_list(arg):
+    return [int(a) for a in arg.split(",")]
+
+
+def create_parser():
+    p = argparse.ArgumentParser()
+    p.add_argument("filter", choices=['kaiser-bessel', 'sinc'],
+                   default='kaiser-bessel')
+    p.add_argument("-ny", default=1024, type=int)
+    p.add_argument("-nx", default=1024, type=int)
+    p.add_argument("-dr", "--dynamic-range", default=1e2, type=float,
+                   help="Target dynamic range")
+    p.add_argument("-hs", "--half-supports", default="1,2,3,4,5,6,7,8",
+                   type=_int_list,
+                   help="Comma separated list of half supports")
+    p.add_argument("-os", "--oversamples", default="7,15,31,63,127",
+                   type=_int_list,
+                   help="Comma separated list of oversampling factors")
+    p.add_argument("-r", "--rows", default=10000, type=int,
+                   help="Number of visibilities to degrid")
+    p.add_argument("-s", "--sources", default=10, type=int,
+                   help="Number of point sources in the test image")
+    p.add_argument("--fov", default=0.5, type=float,
+                   help="Fraction of the image containing point sources")
+    p.add_argument("-k", "--kwargs", default="", type=parse_python_assigns,
+                   help="Extra keywords arguments used to create the filter. "
+                        "For example 'beta=2.3' to specify a beta shape "
+                        "parameter for the Kaiser Bessel")
+
+    return p
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    args = create_parser().parse_args()
+
+    accuracies = filter_accuracy(args.ny, args.nx,
+                                 args.half_supports, args.oversamples,
+                                 filter_type=args.filter,
+                                 nsources=args.sources, nrows=args.rows,
+                                 fov=args.fov, **args.kwargs)
+
+    logging.info("%12s %10s %14s %12s %12s" %
+                 ("half_support", "oversample", "dynamic_range",
+                  "grid (s)", "degrid (s)"))
+
+    for a in accuracies:
+        logging.info("%12d %10d %14.4g %12.4g %12.4g" %
+                     (a.half_support, a.oversample, a.dynamic_range,
+                      a.grid_time, a.degrid_time))
+
+    best = recommend_filter(accuracies, args.dynamic_range)
+
+    if best is None:
+        logging.info("No filter achieves a dynamic range of %g" %
+                     args.dynamic_range)
+    else:
+        logging.info("Recommended %s filter with half support %d and "
+                     "oversampling %d (dynamic range %.4g)" %
+                     (best.filter_type, best.half_support,
+                      best.oversample, best.dynamic_range))
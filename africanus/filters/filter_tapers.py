@@ -8,10 +8,71 @@ import numpy as np
 
 from .kaiser_bessel_filter import (kaiser_bessel_with_sinc,
                                    estimate_kaiser_bessel_beta)
+from ..util.code import memoize_on_key
 
+# Maximum number of cached tapers
+_TAPER_CACHE_SIZE = 4
 
+
+def _taper_key(filter_type, ny, nx, conv_filter, **kwargs):
+    """ Produces a unique key for :func:`taper` """
+    cf = conv_filter
+    separable = bool(kwargs.get('separable', False))
+
+    if filter_type == "kaiser-bessel":
+        beta = kwargs.get('beta', estimate_kaiser_bessel_beta(cf.full_sup))
+        return (filter_type, ny, nx, cf.full_sup, cf.no_taps,
+                cf.oversample, float(beta), separable)
+
+    return (filter_type, ny, nx, separable)
+
+
+# Number of pixels for which the taper is evaluated at once
+_PIXEL_BLOCK = 1024
+
+
+def _direct_taper_1d(npix, taps, filter_taps, oversample):
+    """
+    Evaluates the Fourier response of the symmetric 1D ``filter_taps``,
+    sampled at ``taps``, at each of ``npix`` image pixels.
+
+    Equivalent to zero-padding the filter into a buffer of
+    ``npix * oversample`` elements and taking the inverse FFT,
+    but the cosine sum is evaluated directly at the image pixels.
+    This requires ``O(npix * no_taps)`` operations and memory
+    bounded by the pixel blocks, rather than an FFT of
+    ``npix * oversample`` elements.
+    """
+    # The filter is symmetric about the centre tap,
+    # so sum each tap pair in the positive half
+    centre = taps.size // 2
+    weights = 2.0 * filter_taps[centre:]
+    weights[0] = filter_taps[centre]
+    weights /= oversample
+    freqs = (2.0 * np.pi / npix) * taps[centre:]
+
+    # The taper is symmetric about the centre pixel
+    half = npix // 2
+    response = np.empty(half + 1, dtype=weights.dtype)
+
+    for start in range(0, half + 1, _PIXEL_BLOCK):
+        pixels = np.arange(start, min(start + _PIXEL_BLOCK, half + 1))
+        response[pixels] = np.cos(np.outer(pixels, freqs)).dot(weights)
+
+    return response[np.abs(np.arange(npix) - half)]
+
+
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+@memoize_on_key(_taper_key, maxsize=_TAPER_CACHE_SIZE)
 def taper(filter_type, ny, nx, conv_filter, **kwargs):
     r"""
+    Computes the taper associated with ``conv_filter``,
+    which corrects the image for the gridding filter's response.
+
     Parameters
     ----------
     filter_type : {"kaiser-bessel"}
@@ -22,57 +83,56 @@ def taper(filter_type, ny, nx, conv_filter, **kwargs):
         Number of pixels in the u dimension.
     conv_filter : :class:`africanus.filters.ConvolutionFilter`
         Associated Convolution Filter.
+    beta : float, optional
+        Beta shape parameter for
+        `Kaiser Bessel <kaiser-bessel-filter_>`_ filters.
+    separable : {False, True}
+        Return the taper as a pair of 1D tapers,
+        rather than their :code:`(ny, nx)` outer product.
+        Defaults to ``False``.
 
     Returns
     -------
-    :class:`numpy.ndarray`
-        Taper of shape :code:`(ny, nx)`
+    :class:`numpy.ndarray` or tuple of :class:`numpy.ndarray`
+        Taper of shape :code:`(ny, nx)`, or if ``separable``
+        is ``True``, tapers of shape :code:`(ny,)` and :code:`(nx,)`
+        which should be applied to each image axis:
+
+        .. code-block:: python
+
+            taper_y, taper_x = taper("kaiser-bessel", ny, nx,
+                                     conv_filter, separable=True)
+            image /= taper_y[:, None]
+            image /= taper_x[None, :]
+
+    Notes
+    -----
+    Tapers are cached on ``(filter_type, ny, nx, support,
+    oversample, beta, separable)``, so that repeated calls return
+    the same read-only taper. The least recently used taper is
+    evicted when more than 4 tapers are cached.
     """
     cf = conv_filter
+    separable = kwargs.pop('separable', False)
 
     if filter_type == "sinc":
-        return np.ones((ny, nx))
+        taper_y, taper_x = np.ones(ny), np.ones(nx)
     elif filter_type == "kaiser-bessel":
         try:
             beta = kwargs.pop('beta')
         except KeyError:
             beta = estimate_kaiser_bessel_beta(cf.full_sup)
 
-        # What would Andre Offringa do?
-        # He would compute the numeric solution
         taps = np.arange(cf.no_taps) / cf.oversample - cf.full_sup // 2
         kb = kaiser_bessel_with_sinc(taps, cf.full_sup, cf.oversample, beta)
-        kbshift = np.fft.fftshift(kb)
-
-        width = nx * cf.oversample
-        height = ny * cf.oversample
-
-        # Put the first and last halves of the shifted Kaiser Bessel
-        # at each end of the output buffer, then FFT
-        buf = np.zeros(width, dtype=kb.dtype)
-        buf[:kbshift.size // 2] = kbshift[:kbshift.size // 2]
-        buf[-kbshift.size // 2:] = kbshift[-kbshift.size // 2:]
-        x = np.fft.ifft(buf).real
-
-        buf = np.zeros(height, dtype=kb.dtype)
-        buf[:kbshift.size // 2] = kbshift[:kbshift.size // 2]
-        buf[-kbshift.size // 2:] = kbshift[-kbshift.size // 2:]
-        y = np.fft.ifft(buf).real
-
-        # First quarter of the taper
-        quarter = y[:ny // 2, None] * x[None, :nx // 2]
-
-        # Create the taper by copying
-        # the quarter into the appropriate bits
-        taper = np.empty((ny, nx), dtype=kb.dtype)
-        taper[:ny // 2, :nx // 2] = quarter[::-1, ::-1]
-        taper[ny // 2:, :nx // 2] = quarter[:, ::-1]
-        taper[:ny // 2, nx // 2:] = quarter[::-1, :]
-        taper[ny // 2:, nx // 2:] = quarter[:, :]
-
-        # Normalise by oversampling factor
-        taper *= cf.oversample**2
-
-        return taper
+
+        taper_y = _direct_taper_1d(ny, taps, kb, cf.oversample)
+        taper_x = (taper_y if nx == ny else
+                   _direct_taper_1d(nx, taps, kb, cf.oversample))
     else:
         raise ValueError("Invalid filter_type '%s'" % filter_type)
+
+    if separable:
+        return _readonly(taper_y), _readonly(taper_x)
+
+    return _readonly(np.outer(taper_y, taper_x))
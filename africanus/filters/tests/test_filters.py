@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `codex-africanus` package."""
+
+import numpy as np
+
+import pytest
+
+
+@pytest.mark.parametrize("half_support", [3, 7])
+@pytest.mark.parametrize("oversample", [15, 63])
+@pytest.mark.parametrize("ny, nx", [(128, 130), (129, 65)])
+def test_kaiser_bessel_taper(half_support, oversample, ny, nx):
+    from africanus.filters import convolution_filter, taper
+
+    cf = convolution_filter(half_support, oversample, "kaiser-bessel")
+    data = taper("kaiser-bessel", ny, nx, cf)
+
+    assert data.shape == (ny, nx)
+
+    # Fourier response of the filter at the image pixels
+    taps = np.arange(cf.no_taps) / cf.oversample - cf.full_sup // 2
+    filter_1d = cf.filter_taps[cf.no_taps // 2]
+    filter_1d = filter_1d / filter_1d.sum()
+
+    def _response(npix):
+        x = (np.arange(npix) - npix // 2) / npix
+        return np.cos(2*np.pi*x[:, None]*taps[None, :]).dot(filter_1d)
+
+    expected = np.outer(_response(ny), _response(nx))
+    assert np.allclose(data, expected, rtol=1e-5, atol=1e-10)
+    assert np.allclose(data[ny // 2, nx // 2], 1.0)
+
+
+@pytest.mark.parametrize("half_support, oversample", [(3, 15), (7, 63)])
+@pytest.mark.parametrize("npix", [32, 128, 129, 2500])
+def test_direct_taper_matches_fft(half_support, oversample, npix):
+    from africanus.filters import convolution_filter
+    from africanus.filters.filter_tapers import _direct_taper_1d
+    from africanus.filters.kaiser_bessel_filter import (
+        kaiser_bessel_with_sinc, estimate_kaiser_bessel_beta)
+
+    cf = convolution_filter(half_support, oversample, "kaiser-bessel")
+    taps = np.arange(cf.no_taps) / cf.oversample - cf.full_sup // 2
+    kb = kaiser_bessel_with_sinc(taps, cf.full_sup, cf.oversample,
+                                 estimate_kaiser_bessel_beta(cf.full_sup))
+
+    # Zero-pad the centred filter into an oversampled buffer and FFT
+    kbshift = np.fft.ifftshift(kb)
+    hi = kbshift.size // 2 + 1
+    lo = kbshift.size - hi
+    buf = np.zeros(npix * oversample, dtype=kb.dtype)
+    buf[:hi] = kbshift[:hi]
+    buf[buf.size - lo:] = kbshift[hi:]
+    response = np.fft.ifft(buf).real * npix
+    expected = response[np.abs(np.arange(npix) - npix // 2)]
+
+    taper = _direct_taper_1d(npix, taps, kb, oversample)
+    assert np.allclose(taper, expected, rtol=0, atol=1e-10)
+
+
+def test_filter_accuracy():
+    from africanus.filters.filter_accuracy import (filter_accuracy,
+                                                   recommend_filter)
+
+    accuracies = filter_accuracy(64, 64, [2, 3], [3, 31],
+                                 nsources=5, nrows=500)
+
+    assert [(a.half_support, a.oversample) for a in accuracies] == [
+        (2, 3), (2, 31), (3, 3), (3, 31)]
+    assert all(a.grid_time > 0 and a.degrid_time > 0 for a in accuracies)
+
+    # Oversampling improves accuracy
+    assert accuracies[1].dynamic_range > accuracies[0].dynamic_range
+    assert accuracies[3].dynamic_range > accuracies[2].dynamic_range
+
+    # Least support and oversampling achieving the dynamic range
+    dynamic_range = min(accuracies[1].dynamic_range,
+                        accuracies[3].dynamic_range)
+    best = recommend_filter(accuracies, dynamic_range)
+    assert (best.half_support, best.oversample) in [(2, 31), (3, 31)]
+    assert best.half_support == min(a.half_support for a in accuracies
+                                    if a.dynamic_range >= dynamic_range)
+
+    assert recommend_filter(accuracies, np.inf) is None
+
+
+@pytest.mark.parametrize("filter_type", ["kaiser-bessel", "sinc"])
+def test_filter_and_taper_cache(filter_type):
+    from africanus.filters import convolution_filter, taper
+
+    cf = convolution_filter(3, 15, filter_type)
+    assert cf is convolution_filter(3, 15, filter_type)
+    assert cf is not convolution_filter(3, 31, filter_type)
+    assert not cf.filter_taps.flags.writeable
+
+    if filter_type == "kaiser-bessel":
+        # Explicit and estimated beta produce the same filter
+        assert cf is convolution_filter(3, 15, filter_type, beta=2.34*9)
+        assert cf is not convolution_filter(3, 15, filter_type, beta=2.3)
+
+    data = taper(filter_type, 64, 32, cf)
+    assert data is taper(filter_type, 64, 32, cf)
+    assert not data.flags.writeable
+
+    # Separable tapers
+    taper_y, taper_x = taper(filter_type, 64, 32, cf, separable=True)
+    assert taper_y.shape == (64,) and taper_x.shape == (32,)
+    assert np.all(np.outer(taper_y, taper_x) == data)
+
+
+@pytest.mark.parametrize("oversample", [1, 2, 7, 8, 63])
+def test_phase_taps(oversample):
+    from africanus.filters import convolution_filter
+    from africanus.gridding.simple.gridding import _phase_tap
+
+    cf = convolution_filter(3, oversample, "kaiser-bessel")
+    assert cf.phase_taps.shape == (oversample, cf.full_sup)
+
+    conv = np.arange(-cf.half_sup, cf.half_sup + 1)
+
+    # Fractional offsets produced by the gridder
+    base_frac = np.linspace(-0.5, 0.5, 1001)
+    fracs = np.unique(np.round(base_frac*oversample).astype(np.int64))
+
+    for frac in fracs:
+        # Interleaved tap indices
+        idx = (conv + 1 + cf.half_sup)*oversample + frac
+        phase, tap = _phase_tap(frac, oversample)
+        taps = cf.phase_taps[phase, tap:tap + cf.full_sup_wo_padding]
+        assert np.all(np.outer(taps, taps) ==
+                      cf.filter_taps[idx[:, None], idx[None, :]])
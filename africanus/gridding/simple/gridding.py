@@ -19,6 +19,21 @@ import numpy as np
 _ARCSEC2RAD = np.deg2rad(1.0/(60*60))
 
 
+@numba.jit(nopython=True, nogil=True, cache=True)
+def _phase_tap(frac, oversample):
+    """
+    Returns the oversampled phase and first filter tap
+    in :attr:`ConvolutionFilter.phase_taps` for a fractional offset,
+    equivalent to the tap indices
+    :code:`(conv + one_half_sup)*oversample + frac`
+    for :code:`conv` in :code:`[-half_sup, half_sup]`.
+    """
+    if frac < 0:
+        return frac + oversample, 0
+
+    return frac, 1
+
+
 @numba.jit(nopython=True, nogil=True, cache=True)
 def numba_grid(vis, uvw, flags, weights, ref_wave,
                convolution_filter, cell_size, grid):
@@ -52,7 +67,7 @@ def numba_grid(vis, uvw, flags, weights, ref_wave,
     fflags = flags.reshape((nrow, nchan, flat_corrs))
     fweights = weights.reshape((nrow, nchan, flat_corrs))
 
-    filter_index = np.arange(-cf.half_sup, cf.half_sup+1)
+    full_sup = cf.full_sup_wo_padding
 
     half_x = nx // 2
     half_y = ny // 2
@@ -77,9 +92,6 @@ def numba_grid(vis, uvw, flags, weights, ref_wave,
                     extent_u - cf.half_sup < 0):
                 continue
 
-            # One plus half support (our kernels have 1 pixel of extra padding)
-            one_half_sup = 1 + cf.half_sup
-
             # Compute fractional u and v
             base_frac_u = disc_u - exact_u
             base_frac_v = disc_v - exact_v
@@ -87,16 +99,21 @@ def numba_grid(vis, uvw, flags, weights, ref_wave,
             frac_u = int(np.round(base_frac_u*cf.oversample))
             frac_v = int(np.round(base_frac_v*cf.oversample))
 
+            # Contiguous filter taps for this phase
+            phase_v, tap_v = _phase_tap(frac_v, cf.oversample)
+            phase_u, tap_u = _phase_tap(frac_u, cf.oversample)
+            taps_v = cf.phase_taps[phase_v, tap_v:tap_v + full_sup]
+            taps_u = cf.phase_taps[phase_u, tap_u:tap_u + full_sup]
+
             # Iterate over v/y
-            for conv_v in filter_index:
-                v_idx = (conv_v + one_half_sup)*cf.oversample + frac_v
-                grid_v = disc_v + conv_v + half_y
+            for conv_v in range(full_sup):
+                weight_v = taps_v[conv_v]
+                grid_v = disc_v + conv_v - cf.half_sup + half_y
 
                 # Iterate over u/x
-                for conv_u in filter_index:
-                    u_idx = (conv_u + one_half_sup)*cf.oversample + frac_u
-                    conv_weight = cf.filter_taps[v_idx, u_idx]
-                    grid_u = disc_u + conv_u + half_x
+                for conv_u in range(full_sup):
+                    conv_weight = weight_v * taps_u[conv_u]
+                    grid_u = disc_u + conv_u - cf.half_sup + half_x
 
                     for c in range(flat_corrs):      # correlation
                         # Ignore flagged correlations
@@ -200,7 +217,7 @@ def numba_degrid(grid, uvw, weights, ref_wave,
     u_scale = _ARCSEC2RAD * cell_size * nx
     v_scale = _ARCSEC2RAD * cell_size * ny
 
-    filter_index = np.arange(-cf.half_sup, cf.half_sup+1)
+    full_sup = cf.full_sup_wo_padding
 
     half_x = nx // 2
     half_y = ny // 2
@@ -223,9 +240,6 @@ def numba_degrid(grid, uvw, weights, ref_wave,
                     extent_u - cf.half_sup < 0):
                 continue
 
-            # One plus half support
-            one_half_sup = 1 + cf.half_sup
-
             # Compute fractional u and v
             base_frac_u = disc_u - exact_u
             base_frac_v = disc_v - exact_v
@@ -233,16 +247,21 @@ def numba_degrid(grid, uvw, weights, ref_wave,
             frac_u = int(np.round(base_frac_u*cf.oversample))
             frac_v = int(np.round(base_frac_v*cf.oversample))
 
+            # Contiguous filter taps for this phase
+            phase_v, tap_v = _phase_tap(frac_v, cf.oversample)
+            phase_u, tap_u = _phase_tap(frac_u, cf.oversample)
+            taps_v = cf.phase_taps[phase_v, tap_v:tap_v + full_sup]
+            taps_u = cf.phase_taps[phase_u, tap_u:tap_u + full_sup]
+
             # Iterate over v/y
-            for conv_v in filter_index:
-                v_idx = (conv_v + one_half_sup)*cf.oversample + frac_v
-                grid_v = disc_v + conv_v + half_y
+            for conv_v in range(full_sup):
+                weight_v = taps_v[conv_v]
+                grid_v = disc_v + conv_v - cf.half_sup + half_y
 
                 # Iterate over u/x
-                for conv_u in filter_index:
-                    u_idx = (conv_u + one_half_sup)*cf.oversample + frac_u
-                    conv_weight = cf.filter_taps[v_idx, u_idx]
-                    grid_u = disc_u + conv_u + half_x
+                for conv_u in range(full_sup):
+                    conv_weight = weight_v * taps_u[conv_u]
+                    grid_u = disc_u + conv_u - cf.half_sup + half_x
 
                     # Correlation
                     for c in range(flat_corrs):
@@ -1,8 +1,19 @@
 
-from .phase import phase_delay
-from .feeds import feed_rotation
-from .transform import transform_sources
-from .beam_cubes import beam_cube_dde
-from .parangles import parallactic_angles
-from .zernike import zernike_dde
-from .predict import predict_vis
+from ..util.lazy import lazy_module
+
+# Submodules import numba, scipy and optional backends such as
+# astropy and pyrap, so defer importing them until first use
+lazy_module(__name__, {
+    'phase_delay': '.phase',
+    'feed_rotation': '.feeds',
+    'transform_sources': '.transform',
+    'beam_cube_dde': '.beam_cubes',
+    'transformed_beam_cube_dde': '.beam_cubes',
+    'BeamCube': '.beam_cubes',
+    'cached_beam_cube': '.beam_cubes',
+    'parallactic_angles': '.parangles',
+    'zernike_dde': '.zernike',
+    'predict_vis': '.predict',
+    'warmup': '.warmup',
+    'PredictSignature': '.warmup',
+})
@@ -6,8 +6,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from itertools import product
+import hashlib
+import math
 
+import numba
 import numpy as np
 
 try:
@@ -16,9 +18,362 @@ try:
 except ImportError:
     pass
 
+from ..util.beams import beam_grids
+from ..util.code import memoize_on_key
+from .transform import transform_sources
 from ..util.requirements import requires_optional
 
 
+def _grid_increasing(grid, name, allow_decreasing=True):
+    """
+    Validates that ``grid`` is monotonic, returning
+    True if it is increasing and False if it is decreasing.
+    """
+    diff = np.diff(grid)
+    inc = np.all(diff > 0)
+    dec = np.all(diff < 0)
+
+    if allow_decreasing and not (inc or dec):
+        raise ValueError("%s is not monotonically "
+                         "increasing/decreasing" % name)
+    elif not allow_decreasing and not inc:
+        raise ValueError("%s is not monotonically increasing" % name)
+
+    return inc
+
+
+def _grid_interpolator(grid, name, allow_decreasing=True):
+    """
+    Returns a linear interpolator mapping values in ``grid``
+    to (fractional) grid positions, extrapolating outside the grid.
+    """
+    inc = _grid_increasing(grid, name, allow_decreasing=allow_decreasing)
+
+    # interp1d works on monotically increasing/decreasing values
+    #
+    # .. code-block:: python
+    #
+    #    values = np.asarray([1.0, 0.7, 0.2, 0.0, -0.4, -1.0])
+    #    values = np.flipud(values)
+    #    grid = np.arange(values.size)
+    #
+    #    initial = np.stack((values, grid))
+    #    interp = interp1d(values, grid, bounds_error=False,
+    #                                    fill_value='extrapolate')
+    #    assert np.all(initial == np.stack((values,interp(values))))
+    return interpolate.interp1d(grid, np.arange(grid.size),
+                                'linear', bounds_error=False,
+                                fill_value='extrapolate',
+                                assume_sorted=inc)
+
+
+# Padding applied before prefiltering for modes whose boundary
+# conditions scipy's spline filter only approximates,
+# as in scipy.ndimage's _prepad_for_spline_filter
+_PREFILTER_PAD = 12
+_PREFILTER_PAD_MODES = {'nearest': 'edge', 'grid-constant': 'constant'}
+
+
+def _spline_coefficients(values, order, mode):
+    """
+    Prefilters ``values`` for sampling with ``order`` and ``mode``,
+    as :func:`scipy.ndimage.interpolation.map_coordinates`
+    does when ``prefilter=True``.
+
+    Returns
+    -------
+    tuple
+        ``(coefficients, pad)`` where ``pad`` is the number of
+        elements padding each side of each axis of ``coefficients``.
+    """
+    if order <= 1:
+        return values, 0
+
+    if mode in _PREFILTER_PAD_MODES:
+        pad = _PREFILTER_PAD
+        padded = np.pad(values, pad, mode=_PREFILTER_PAD_MODES[mode])
+    else:
+        pad = 0
+        padded = values
+
+    try:
+        return interpolation.spline_filter(padded, order=order,
+                                           mode=mode), pad
+    except TypeError:
+        # scipy < 1.6 only prefilters with mirror boundaries,
+        # independently of the sampling mode
+        return interpolation.spline_filter(values, order=order), 0
+
+
+class BeamCube(object):
+    """
+    A complex beam cube prepared for repeated sampling.
+
+    Grid interpolators are constructed once and, for
+    ``spline_order > 1``, the spline prefilter is applied once to the
+    real and imaginary components of each correlation, so that
+    :meth:`sample` only needs to evaluate the spline at the
+    requested coordinates.
+
+    Instances are usually obtained through :func:`cached_beam_cube`,
+    which shares them between calls (and dask tasks) with the same
+    beam and parameters.
+
+    Parameters
+    ----------
+    beam : :class:`numpy.ndarray`
+        complex beam cube of shape
+        :code:`(beam_lw, beam_mh, beam_nud, corr_1, corr_2)`.
+        Either ``corr_1`` or both ``corr_1`` and ``corr_2`` may be
+        present, representing 1, 2 or 2x2 correlations respectively.
+    l_grid : :class:`numpy.ndarray`
+        Monotonically *increasing* or *decreasing* grid values for
+        the l axis, with shape :code:`(beam_lw,)`.
+    m_grid : :class:`numpy.ndarray`
+        Monotonically *increasing* or *decreasing* grid values for
+        the m axis, with shape :code:`(beam_mh,)`
+    freq_grid : :class:`numpy.ndarray`
+        Monotonically increasing grid values for the frequency axis,
+        with shape :code:`(beam_nud,)`
+    spline_order : int, optional
+        Spline order to use in
+        :func:`scipy.ndimage.interpolation.map_coordinates`.
+        Defaults to 1 ('linear')
+    mode : str, optional
+        Border mode to use in
+        :func:`scipy.ndimage.interpolation.map_coordinates`
+        Defaults to 'nearest'
+    """
+
+    @requires_optional("scipy")
+    def __init__(self, beam, l_grid, m_grid, freq_grid,
+                 spline_order=1, mode='nearest'):
+        if not np.iscomplexobj(beam):
+            raise ValueError("beam is not complex")
+
+        if not beam.shape[:3] == (l_grid.size, m_grid.size, freq_grid.size):
+            raise ValueError("beam shape %s does not match grid shapes "
+                             "(%d, %d, %d)" % (beam.shape, l_grid.size,
+                                               m_grid.size, freq_grid.size))
+
+        self._l_interp = _grid_interpolator(l_grid, "l_grid")
+        self._m_interp = _grid_interpolator(m_grid, "m_grid")
+        self._freq_interp = _grid_interpolator(freq_grid, "freq_grid",
+                                               allow_decreasing=False)
+
+        self._l_grid = l_grid
+        self._m_grid = m_grid
+        self._freq_grid = freq_grid
+        self._spline_order = spline_order
+        self._mode = mode
+        self._dtype = beam.dtype
+        self._corr_shape = beam.shape[3:]
+
+        # Flatten correlations
+        fbeam = beam.reshape(beam.shape[:3] + (-1,))
+        self._coeffs = []
+        self._pad = 0
+
+        for c in range(fbeam.shape[3]):
+            # Spline coefficients only differ from the
+            # beam values for orders above linear
+            re, self._pad = _spline_coefficients(fbeam[..., c].real,
+                                                 spline_order, mode)
+            im, self._pad = _spline_coefficients(fbeam[..., c].imag,
+                                                 spline_order, mode)
+
+            self._coeffs.append((re, im))
+
+    @classmethod
+    def from_header(cls, beam, header, spline_order=1, mode='nearest'):
+        """
+        Creates a :class:`BeamCube` from a ``beam`` whose grids
+        are described by a FITS ``header``.
+        See :func:`~africanus.util.beams.beam_grids`.
+        """
+        (_, l_grid), (_, m_grid), (_, freq_grid) = beam_grids(header)
+        return cls(beam, l_grid, m_grid, freq_grid,
+                   spline_order=spline_order, mode=mode)
+
+    @property
+    def l_grid(self):
+        return self._l_grid
+
+    @property
+    def m_grid(self):
+        return self._m_grid
+
+    @property
+    def freq_grid(self):
+        return self._freq_grid
+
+    @property
+    def spline_order(self):
+        return self._spline_order
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def corr_shape(self):
+        return self._corr_shape
+
+    def grid_coordinates(self, coords):
+        """
+        Converts flattened beam coordinates of shape :code:`(3, n)`
+        into fractional grid positions of shape :code:`(3, n)`.
+        """
+        freq_grid = self._freq_grid
+        freq = coords[2]
+
+        # LM coordinates must be scaled if
+        # they lie outside the beam cube.
+        # Check for frequency coordinates that lie below or above
+        scale = np.ones(freq.shape, dtype=np.float64)
+        below = freq < freq_grid[0]
+        above = freq > freq_grid[-1]
+        scale[below] = freq[below] / freq_grid[0]
+        scale[above] = freq[above] / freq_grid[-1]
+
+        grid_coords = np.empty(coords.shape, dtype=np.float64)
+        grid_coords[0, :] = self._l_interp(coords[0] * scale)
+        grid_coords[1, :] = self._m_interp(coords[1] * scale)
+        grid_coords[2, :] = self._freq_interp(freq)
+
+        return grid_coords
+
+    def sample(self, coords):
+        """
+        Samples the beam cube at ``coords``.
+
+        Parameters
+        ----------
+        coords : :class:`numpy.ndarray`
+            beam cube coordinates of shape :code:`(coords, dim_1, ..., dim_n)`
+            where ``coord`` always has size 3 and refers to
+            `(l,m,frequency)`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Sampled complex beam values at the specified coordinates with
+            shape :code:`(dim_1, ..., dim_n, corr_1, corr_2)`
+        """
+        head, tail = coords.shape[0], coords.shape[1:]
+
+        if not head == 3:
+            raise ValueError("coord axis must have size 3 "
+                             "representing l, m and frequency")
+
+        grid_coords = self.grid_coordinates(coords.reshape(head, -1))
+
+        # Offset coordinates into any prefilter padding
+        if self._pad > 0:
+            grid_coords += self._pad
+
+        # Allocate output array, flattening correlations
+        result = np.empty(tail + self._corr_shape, dtype=self._dtype)
+        fresult = result.reshape((-1, len(self._coeffs)))
+
+        # For each correlation
+        for c, (re_coeffs, im_coeffs) in enumerate(self._coeffs):
+            # Interpolate real and imaginary beams.
+            # Any prefiltering has already been performed
+            re = interpolation.map_coordinates(re_coeffs, grid_coords,
+                                               order=self._spline_order,
+                                               prefilter=False,
+                                               mode=self._mode)
+            im = interpolation.map_coordinates(im_coeffs, grid_coords,
+                                               order=self._spline_order,
+                                               prefilter=False,
+                                               mode=self._mode)
+
+            # This computes a mean of circular quantities
+            # and the following should hold
+            #
+            # .. code-block:: python
+            #
+            #   phase = np.arctan2(re, im)
+            #   re == np.cos(phase)
+            #   im == np.sin(phase)
+
+            # Compute the amplitude
+            amplitude = np.sqrt(re**2 + im**2)
+            # Handle divide by zero when normalising
+            amplitude[amplitude == 0.0] = 1.0
+
+            # Normalise real and imaginary components
+            fresult[:, c].real = re / amplitude
+            fresult[:, c].imag = im / amplitude
+
+        return result
+
+
+# Number of prepared beam cubes held in each process
+_BEAM_CUBE_CACHE_SIZE = 4
+
+
+def _array_token(*arrays):
+    """ Hashes the shape, dtype and contents of ``arrays`` """
+    sha = hashlib.sha1()
+
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        sha.update(("%s%s" % (a.dtype.str, a.shape)).encode("ascii"))
+        sha.update(a.view(np.uint8).ravel())
+
+    return sha.hexdigest()
+
+
+def _beam_cube_key(beam, l_grid, m_grid, freq_grid,
+                   spline_order=1, mode='nearest', token=None):
+    if token is None:
+        token = _array_token(beam, l_grid, m_grid, freq_grid)
+
+    return (token, spline_order, mode)
+
+
+@memoize_on_key(_beam_cube_key, maxsize=_BEAM_CUBE_CACHE_SIZE)
+def cached_beam_cube(beam, l_grid, m_grid, freq_grid,
+                     spline_order=1, mode='nearest', token=None):
+    """
+    Returns a :class:`BeamCube`, shared between all calls
+    with the same beam, grids, ``spline_order`` and ``mode``.
+    Only the most recently used beam cubes are retained.
+
+    Parameters
+    ----------
+    beam : :class:`numpy.ndarray`
+        complex beam cube. See :class:`BeamCube`.
+    l_grid : :class:`numpy.ndarray`
+        l axis grid values.
+    m_grid : :class:`numpy.ndarray`
+        m axis grid values.
+    freq_grid : :class:`numpy.ndarray`
+        frequency axis grid values.
+    spline_order : int, optional
+        Spline order. Defaults to 1 ('linear')
+    mode : str, optional
+        Border mode. Defaults to 'nearest'
+    token : str, optional
+        A key uniquely identifying ``beam`` and the grids,
+        such as a dask token. If ``None``, the array contents
+        are hashed on every call, which is costly for large beams.
+        Supply a ``token`` to avoid this.
+
+    Returns
+    -------
+    :class:`BeamCube`
+    """
+    return BeamCube(beam, l_grid, m_grid, freq_grid,
+                    spline_order=spline_order, mode=mode)
+
+
 @requires_optional("scipy")
 def beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
                   spline_order=1, mode='nearest'):
@@ -35,6 +390,11 @@ def beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
     ``l_grid``, ``m_grid`` and ``freq_grid`` can be obtained from
     :func:`~africanus.util.beams.beam_grids`.
 
+    When sampling the same beam repeatedly, particularly
+    with ``spline_order > 1``, prefer :func:`cached_beam_cube`
+    and :meth:`BeamCube.sample` which compute the spline
+    coefficients only once.
+
     Parameters
     ----------
     beam : :class:`numpy.ndarray`
@@ -51,7 +411,6 @@ def beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
     l_grid : :class:`numpy.ndarray`
         Monotonically *increasing* or *decreasing* grid values for
         the l axis, with shape :code:`(beam_lw,)`.
-        If decreasing, the
     m_grid : :class:`numpy.ndarray`
         Monotonically *increasing* or *decreasing* grid values for
         the m axis, with shape :code:`(beam_mh,)`
@@ -73,140 +432,260 @@ def beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
         Sampled complex beam values at the specified coordinates with
         shape :code:`(dim_1, ..., dim_n, corr_1, corr_2)`
     """
-    if not np.iscomplexobj(beam):
-        raise ValueError("beam is not complex")
+    beam_cube = BeamCube(beam, l_grid, m_grid, freq_grid,
+                         spline_order=spline_order, mode=mode)
 
-    l_diff = np.diff(l_grid)
-    l_inc = np.all(l_diff > 0)
-    l_dec = np.all(l_diff < 0)
+    return beam_cube.sample(coords)
 
-    if not (l_inc or l_dec):
-        raise ValueError("l_grid is not monotonically increasing/decreasing")
 
-    m_diff = np.diff(m_grid)
-    m_inc = np.all(m_diff > 0)
-    m_dec = np.all(m_diff < 0)
+@numba.jit(nopython=True, nogil=True, cache=True)
+def _nb_grid_position(grid, value):
+    """
+    Fractional position of ``value`` in the monotonically
+    increasing ``grid``, linearly extrapolated outside the grid.
+    """
+    n = grid.shape[0]
 
-    if not (m_inc or m_dec):
-        raise ValueError("m_grid is not monotonically increasing/decreasing")
+    if n == 1:
+        return 0.0
 
-    freq_diff = np.diff(freq_grid)
-    freq_inc = np.all(freq_diff > 0)
+    i = np.searchsorted(grid, value) - 1
+    i = min(max(i, 0), n - 2)
 
-    if not freq_inc:
-        raise ValueError("freq_grid is not monotonically increasing")
+    return i + (value - grid[i]) / (grid[i + 1] - grid[i])
 
-    # interp1d works on monotically increasing/decreasing values
-    #
-    # .. code-block:: python
-    #
-    #    values = np.asarray([1.0, 0.7, 0.2, 0.0, -0.4, -1.0])
-    #    values = np.flipud(values)
-    #    grid = np.arange(values.size)
-    #
-    #    initial = np.stack((values, grid))
-    #    interp = interp1d(values, grid, bounds_error=False,
-    #                                    fill_value='extrapolate')
-    #    assert np.all(initial == np.stack((values,interp(values))))
 
-    l_interp = interpolate.interp1d(l_grid, np.arange(l_grid.size),
-                                    'linear', bounds_error=False,
-                                    fill_value='extrapolate',
-                                    assume_sorted=l_inc)
-
-    m_interp = interpolate.interp1d(m_grid, np.arange(m_grid.size),
-                                    'linear', bounds_error=False,
-                                    fill_value='extrapolate',
-                                    assume_sorted=m_inc)
-
-    freq_interp = interpolate.interp1d(freq_grid, np.arange(freq_grid.size),
-                                       'linear', bounds_error=False,
-                                       fill_value='extrapolate',
-                                       assume_sorted=True)
-
-    head, tail = coords.shape[0], coords.shape[1:]
-
-    if not head == 3:
-        raise ValueError("coord axis must have size 3 "
-                         "representing l, m and frequency")
-
-    # Flatten coordinates
-    coords = coords.reshape(head, -1)
-
-    # TODO(sjperkins)
-    # This scaling code might actually be more suited
-    # to transform_sources.
-
-    # LM coordinates must be scaled if
-    # they lie outside the beam cube.
-    # Check for frequency coordinates (index 2)
-    # that lie below or above
-    below = coords[2, :] < freq_grid[0]
-    above = coords[2, :] > freq_grid[-1]
-
-    # Scaling factors for frequencies above and below
-    below_scale = coords[2, below] / freq_grid[0]
-    above_scale = coords[2, above] / freq_grid[-1]
-
-    # Now scale L and M (0 and 1) by frequency scaling
-    coords[0:2, below] *= below_scale
-    coords[0:2, above] *= above_scale
-
-    # Convert to grid coordinates
-    grid_coords = np.empty_like(coords)
-    grid_coords[0, :] = l_interp(coords[0, :])
-    grid_coords[1, :] = m_interp(coords[1, :])
-    grid_coords[2, :] = freq_interp(coords[2, :])
-
-    # Create beam and result indices
-    corr_dims = beam.shape[3:]
-    all_ = slice(None)
-    result_all = tuple(all_ for _ in range(len(tail)))
-
-    corr_indices = list(product(*(range(d) for d in corr_dims)))
-    if len(corr_indices) > 0:
-        beam_indices = tuple((all_,) + cp for cp in corr_indices)
-        result_indices = tuple(result_all + cp for cp in corr_indices)
-    else:
-        beam_indices = ((all_,),)
-        result_indices = ((result_all,),)
-
-    # Allocate output array
-    result = np.empty(tail + corr_dims, dtype=beam.dtype)
-
-    prefilter = spline_order == 1
-
-    # For each correlation
-    for bi, ri in zip(beam_indices, result_indices):
-        re = result[ri].real
-        im = result[ri].imag
-
-        # Interpolate real and imaginary beams
-        re.flat[:] = interpolation.map_coordinates(beam[bi].real, grid_coords,
-                                                   order=spline_order,
-                                                   prefilter=prefilter,
-                                                   mode=mode)
-        im.flat[:] = interpolation.map_coordinates(beam[bi].imag, grid_coords,
-                                                   order=spline_order,
-                                                   prefilter=prefilter,
-                                                   mode=mode)
-
-        # This computes a mean of circular quantities
-        # and the following should hold
-        #
-        # .. code-block:: python
-        #
-        #   phase = np.arctan2(re, im)
-        #   re == np.cos(phase)
-        #   im == np.sin(phase)
-
-        # Compute the amplitude
-        amplitude = np.sqrt(re**2 + im**2)
-        # Handle divide by zero when normalising
-        amplitude[amplitude == 0.0] = 1.0
-
-        # Normalise real and imaginary components
-        re /= amplitude
-        im /= amplitude
-
-    return result
+@numba.jit(nopython=True, nogil=True, cache=True)
+def _nb_linear_bounds(pos, n):
+    """
+    Lower and upper indices and the upper weight for linear
+    interpolation at ``pos``, clamping to the grid edges
+    (``mode='nearest'``).
+    """
+    pos = min(max(pos, 0.0), n - 1.0)
+    lower = min(int(math.floor(pos)), n - 1)
+    upper = min(lower + 1, n - 1)
+    return lower, upper, pos - lower
+
+
+@numba.jit(nopython=True, nogil=True, cache=True)
+def _nb_transformed_beam_cube(beam, lm, parallactic_angles, pointing_errors,
+                              antenna_scaling, frequency,
+                              l_grid, l_flip, m_grid, m_flip, freq_grid,
+                              out):
+    """
+    Linearly samples ``beam`` at coordinates transformed on the fly.
+    Grids are supplied in increasing order, with ``l_flip`` and
+    ``m_flip`` indicating that the beam axis is in decreasing order.
+    """
+    nsrc, ntime, na, nchan, ncorr = out.shape
+    beam_lw, beam_mh, beam_nud = beam.shape[:3]
+
+    # Frequency grid positions and lm scaling factors
+    # are independent of the source coordinates
+    freq_lower = np.empty(nchan, dtype=np.intp)
+    freq_upper = np.empty(nchan, dtype=np.intp)
+    freq_weight = np.empty(nchan, dtype=np.float64)
+    freq_scale = np.empty(nchan, dtype=np.float64)
+
+    for c in range(nchan):
+        freq = frequency[c]
+
+        # LM coordinates must be scaled if
+        # they lie outside the beam cube.
+        if freq < freq_grid[0]:
+            freq_scale[c] = freq / freq_grid[0]
+        elif freq > freq_grid[-1]:
+            freq_scale[c] = freq / freq_grid[-1]
+        else:
+            freq_scale[c] = 1.0
+
+        pos = _nb_grid_position(freq_grid, freq)
+        lower, upper, weight = _nb_linear_bounds(pos, beam_nud)
+        freq_lower[c] = lower
+        freq_upper[c] = upper
+        freq_weight[c] = weight
+
+    for t in range(ntime):
+        for a in range(na):
+            pa_sin = math.sin(parallactic_angles[t, a])
+            pa_cos = math.cos(parallactic_angles[t, a])
+
+            for s in range(nsrc):
+                l = lm[s, 0]
+                m = lm[s, 1]
+
+                # Rotate source coordinate by parallactic angle
+                # and add pointing errors
+                tl = l*pa_cos - m*pa_sin + pointing_errors[t, a, 0]
+                tm = l*pa_sin + m*pa_cos + pointing_errors[t, a, 1]
+
+                for c in range(nchan):
+                    # Scale by antenna and frequency scaling factors
+                    scale = antenna_scaling[a, c]
+                    sl = (tl*scale)*freq_scale[c]
+                    sm = (tm*scale)*freq_scale[c]
+
+                    lpos = _nb_grid_position(l_grid, sl)
+                    mpos = _nb_grid_position(m_grid, sm)
+
+                    if l_flip:
+                        lpos = beam_lw - 1 - lpos
+
+                    if m_flip:
+                        mpos = beam_mh - 1 - mpos
+
+                    l0, l1, lw = _nb_linear_bounds(lpos, beam_lw)
+                    m0, m1, mw = _nb_linear_bounds(mpos, beam_mh)
+                    f0 = freq_lower[c]
+                    f1 = freq_upper[c]
+                    fw = freq_weight[c]
+
+                    for corr in range(ncorr):
+                        # Trilinear interpolation of real
+                        # and imaginary components
+                        v = ((beam[l0, m0, f0, corr]*(1 - fw) +
+                              beam[l0, m0, f1, corr]*fw)*(1 - mw) +
+                             (beam[l0, m1, f0, corr]*(1 - fw) +
+                              beam[l0, m1, f1, corr]*fw)*mw)*(1 - lw)
+                        v += ((beam[l1, m0, f0, corr]*(1 - fw) +
+                               beam[l1, m0, f1, corr]*fw)*(1 - mw) +
+                              (beam[l1, m1, f0, corr]*(1 - fw) +
+                               beam[l1, m1, f1, corr]*fw)*mw)*lw
+
+                        # Normalise to form a mean of circular quantities
+                        amplitude = np.abs(v)
+
+                        if amplitude == 0.0:
+                            out[s, t, a, c, corr] = v
+                        else:
+                            out[s, t, a, c, corr] = v / amplitude
+
+    return out
+
+
+@requires_optional("scipy")
+def transformed_beam_cube_dde(beam, lm, parallactic_angles, pointing_errors,
+                              antenna_scaling, frequency,
+                              l_grid, m_grid, freq_grid,
+                              spline_order=1, mode='nearest',
+                              beam_token=None):
+    """
+    Computes Direction Dependent Effects (E) by sampling
+    complex values in ``beam`` at the source coordinates
+    transformed by :func:`~africanus.rime.transform_sources`.
+
+    This is equivalent to
+
+    .. code-block:: python
+
+        coords = transform_sources(lm, parallactic_angles, pointing_errors,
+                                   antenna_scaling, frequency)
+        ddes = beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
+                             spline_order=spline_order, mode=mode)
+
+    but does not create the :code:`(3, src, time, ant, chan)`
+    coordinate array. With the default ``spline_order=1`` and
+    ``mode='nearest'``, coordinates are transformed and the beam
+    sampled in a single kernel. Otherwise, coordinates are created
+    for one timestep at a time.
+
+    Parameters
+    ----------
+    beam : :class:`numpy.ndarray`
+        complex beam cube of shape
+        :code:`(beam_lw, beam_mh, beam_nud, corr_1, corr_2)`.
+        See :func:`~africanus.rime.beam_cube_dde`.
+    lm : :class:`numpy.ndarray`
+        LM coordinates of shape :code:`(src,2)` in radians
+        offset from the phase centre.
+    parallactic_angles : :class:`numpy.ndarray`
+        parallactic angles of shape :code:`(time, antenna)`
+        in radians.
+    pointing_errors : :class:`numpy.ndarray`
+        LM pointing errors for each antenna at
+        each timestep in radians.
+        Has shape :code:`(time, antenna, 2)`
+    antenna_scaling : :class:`numpy.ndarray`
+        antenna scaling factor for each channel and
+        each antenna. Has shape :code:`(antenna, chan)`
+    frequency : :class:`numpy.ndarray`
+        frequencies for each channel. Has shape :code:`(chan,)`
+    l_grid : :class:`numpy.ndarray`
+        Monotonically *increasing* or *decreasing* grid values for
+        the l axis, with shape :code:`(beam_lw,)`.
+    m_grid : :class:`numpy.ndarray`
+        Monotonically *increasing* or *decreasing* grid values for
+        the m axis, with shape :code:`(beam_mh,)`
+    freq_grid : :class:`numpy.ndarray`
+        Monotonically increasing grid values for the frequency axis,
+        with shape :code:`(beam_nud,)`
+    spline_order : int
+        Spline order to use in
+        :func:`scipy.ndimage.interpolation.map_coordinates`.
+        Defaults to 1 ('linear')
+    mode : str
+        Border mode to use in
+        :func:`scipy.ndimage.interpolation.map_coordinates`
+        Defaults to 'nearest'
+    beam_token : str, optional
+        Key identifying ``beam`` and the grids, with which the
+        prefiltered beam cube is shared between calls.
+        See the ``token`` argument of :func:`cached_beam_cube`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Sampled complex beam values with shape
+        :code:`(src, time, antenna, chan, corr_1, corr_2)`
+    """
+    ntime, na = parallactic_angles.shape
+    nsrc = lm.shape[0]
+    assert (ntime, na, 2) == pointing_errors.shape
+    nchan = antenna_scaling.shape[1]
+    assert nchan == frequency.shape[0]
+
+    corr_shape = beam.shape[3:]
+
+    if not (spline_order == 1 and mode == 'nearest'):
+        # Share the (prefiltered) beam cube between calls
+        beam_cube = cached_beam_cube(beam, l_grid, m_grid, freq_grid,
+                                     spline_order=spline_order, mode=mode,
+                                     token=beam_token)
+
+        out = np.empty((nsrc, ntime, na, nchan) + corr_shape,
+                       dtype=beam.dtype)
+
+        for t in range(ntime):
+            coords = transform_sources(lm,
+                                       parallactic_angles[t:t + 1],
+                                       pointing_errors[t:t + 1],
+                                       antenna_scaling, frequency)
+            out[:, t:t + 1] = beam_cube.sample(coords)
+
+        return out
+
+    if not np.iscomplexobj(beam):
+        raise ValueError("beam is not complex")
+
+    if not beam.shape[:3] == (l_grid.size, m_grid.size, freq_grid.size):
+        raise ValueError("beam shape %s does not match grid shapes "
+                         "(%d, %d, %d)" % (beam.shape, l_grid.size,
+                                           m_grid.size, freq_grid.size))
+
+    l_inc = _grid_increasing(l_grid, "l_grid")
+    m_inc = _grid_increasing(m_grid, "m_grid")
+    _grid_increasing(freq_grid, "freq_grid", allow_decreasing=False)
+
+    # Flatten correlations
+    fbeam = beam.reshape(beam.shape[:3] + (-1,))
+    out = np.empty((nsrc, ntime, na, nchan, fbeam.shape[3]),
+                   dtype=beam.dtype)
+
+    _nb_transformed_beam_cube(fbeam, lm, parallactic_angles, pointing_errors,
+                              antenna_scaling, frequency,
+                              l_grid if l_inc else l_grid[::-1], not l_inc,
+                              m_grid if m_inc else m_grid[::-1], not m_inc,
+                              freq_grid, out)
+
+    return out.reshape((nsrc, ntime, na, nchan) + corr_shape)
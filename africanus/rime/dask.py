@@ -11,9 +11,11 @@ from .phase import phase_delay as np_phase_delay, PHASE_DELAY_DOCS
 from .parangles import parallactic_angles as np_parangles
 from .feeds import feed_rotation as np_feed_rotation
 from .transform import transform_sources as np_transform_sources
-from .beam_cubes import beam_cube_dde as np_beam_cude_dde
+from .beam_cubes import (beam_cube_dde as np_beam_cude_dde,
+                         transformed_beam_cube_dde as np_xform_beam_dde,
+                         cached_beam_cube)
 from .predict import PREDICT_DOCS
-from .predict import predict_vis as np_predict_vis
+from .predict import predict_vis as np_predict_vis, output_corr_shape
 from .zernike import zernike_dde as np_zernike_dde
 
 
@@ -70,9 +72,8 @@ def parallactic_angles(times, antenna_positions, field_centre, **kwargs):
 
 
 @requires_optional('dask.array')
-def feed_rotation(parallactic_angles, feed_type):
+def feed_rotation(parallactic_angles, feed_type='linear', compact=False):
     pa_dims = tuple("pa-%d" % i for i in range(parallactic_angles.ndim))
-    corr_dims = ('corr-1', 'corr-2')
 
     if parallactic_angles.dtype == np.float32:
         dtype = np.complex64
@@ -82,24 +83,35 @@ def feed_rotation(parallactic_angles, feed_type):
         raise ValueError("parallactic_angles have "
                          "non-floating point dtype")
 
+    if compact:
+        corr_dims = ('corr-1',)
+        # Linear feed rotations are real
+        if feed_type == 'linear':
+            dtype = parallactic_angles.dtype
+    else:
+        corr_dims = ('corr-1', 'corr-2')
+
     return da.core.atop(np_feed_rotation, pa_dims + corr_dims,
                         parallactic_angles, pa_dims,
                         feed_type=feed_type,
-                        new_axes={'corr-1': 2, 'corr-2': 2},
+                        compact=compact,
+                        new_axes={c: 2 for c in corr_dims},
                         dtype=dtype)
 
 
 @wraps(np_transform_sources)
 def _xform_wrap(lm, parallactic_angles, pointing_errors,
-                antenna_scaling, frequency, dtype_):
+                antenna_scaling, frequency, dtype_, frequency_plane):
     return np_transform_sources(lm[0], parallactic_angles,
                                 pointing_errors[0], antenna_scaling,
-                                frequency, dtype=dtype_)
+                                frequency, dtype=dtype_,
+                                frequency_plane=frequency_plane)
 
 
 @requires_optional('dask.array')
 def transform_sources(lm, parallactic_angles, pointing_errors,
-                      antenna_scaling, frequency, dtype=None):
+                      antenna_scaling, frequency, dtype=None,
+                      frequency_plane=True):
 
     if dtype is None:
         dtype = np.float64
@@ -110,17 +122,22 @@ def transform_sources(lm, parallactic_angles, pointing_errors,
                         pointing_errors, ("time", "ant", "lm"),
                         antenna_scaling, ("ant", "chan"),
                         frequency, ("chan",),
-                        new_axes={"comp": 3},
+                        new_axes={"comp": 3 if frequency_plane else 2},
                         dtype=dtype,
-                        dtype_=dtype)
+                        dtype_=dtype,
+                        frequency_plane=frequency_plane)
 
 
 @wraps(np_beam_cude_dde)
 def _beam_wrapper(beam, coords, l_grid, m_grid, freq_grid,
-                  spline_order=1, mode='nearest'):
-    return np_beam_cude_dde(beam[0][0][0], coords[0],
-                            l_grid[0], m_grid[0], freq_grid[0],
-                            spline_order=spline_order, mode=mode)
+                  spline_order=1, mode='nearest', beam_token=None):
+    # Share the (prefiltered) beam cube between tasks
+    beam_cube = cached_beam_cube(beam[0][0][0],
+                                 l_grid[0], m_grid[0], freq_grid[0],
+                                 spline_order=spline_order, mode=mode,
+                                 token=beam_token)
+
+    return beam_cube.sample(coords[0])
 
 
 @requires_optional('dask.array')
@@ -134,6 +151,9 @@ def beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
 
     beam_dims = ("beam_lw", "beam_mh", "beam_nud") + corr_dims
 
+    # Identifies the beam cube in the cache shared by all tasks
+    beam_token = da.core.tokenize(beam, l_grid, m_grid, freq_grid)
+
     return da.core.atop(_beam_wrapper, coord_dims + corr_dims,
                         beam, beam_dims,
                         coords, ("coords",) + coord_dims,
@@ -142,6 +162,48 @@ def beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
                         freq_grid, ("beam_nud",),
                         spline_order=spline_order,
                         mode=mode,
+                        beam_token=beam_token,
+                        dtype=beam.dtype)
+
+
+@wraps(np_xform_beam_dde)
+def _xform_beam_wrapper(beam, lm, parallactic_angles, pointing_errors,
+                        antenna_scaling, frequency,
+                        l_grid, m_grid, freq_grid,
+                        spline_order=1, mode='nearest', beam_token=None):
+    return np_xform_beam_dde(beam[0][0][0], lm[0],
+                             parallactic_angles, pointing_errors[0],
+                             antenna_scaling, frequency,
+                             l_grid[0], m_grid[0], freq_grid[0],
+                             spline_order=spline_order, mode=mode,
+                             beam_token=beam_token)
+
+
+@requires_optional('dask.array')
+def transformed_beam_cube_dde(beam, lm, parallactic_angles, pointing_errors,
+                              antenna_scaling, frequency,
+                              l_grid, m_grid, freq_grid,
+                              spline_order=1, mode='nearest'):
+
+    corr_shapes = beam.shape[3:]
+    corr_dims = tuple("corr-%d" % i for i in range(len(corr_shapes)))
+    beam_dims = ("beam_lw", "beam_mh", "beam_nud") + corr_dims
+    beam_token = da.core.tokenize(beam, l_grid, m_grid, freq_grid)
+
+    return da.core.atop(_xform_beam_wrapper,
+                        ("src", "time", "ant", "chan") + corr_dims,
+                        beam, beam_dims,
+                        lm, ("src", "lm"),
+                        parallactic_angles, ("time", "ant"),
+                        pointing_errors, ("time", "ant", "lm"),
+                        antenna_scaling, ("ant", "chan"),
+                        frequency, ("chan",),
+                        l_grid, ("beam_lw",),
+                        m_grid, ("beam_mh",),
+                        freq_grid, ("beam_nud",),
+                        spline_order=spline_order,
+                        mode=mode,
+                        beam_token=beam_token,
                         dtype=beam.dtype)
 
 
@@ -169,56 +231,172 @@ def zernike_dde(coords, coeffs, noll_index):
                         dtype=coeffs.dtype)
 
 
-@wraps(np_predict_vis)
-def _predict_coh_wrapper(time_index, antenna1, antenna2,
-                         dde1_jones, source_coh, dde2_jones,
-                         die1_jones, base_vis, die2_jones):
-
-    return (np_predict_vis(time_index, antenna1, antenna2,
-                           # dde1_jones loses the 'ant' dim
-                           dde1_jones[0] if dde1_jones else None,
-                           # source_coh loses the 'source' dim
-                           source_coh,
-                           # dde2_jones loses the 'source' and 'ant' dims
-                           dde2_jones[0] if dde2_jones else None,
-                           # die1_jones loses the 'ant' dim
-                           die1_jones[0] if die1_jones else None,
-                           base_vis,
-                           # die2_jones loses the 'ant' dim
-                           die2_jones[0] if die2_jones else None)
-            # Introduce an extra dimension (source dim reduced to 1)
-            [None, ...])
-
-
-@wraps(np_predict_vis)
-def _predict_dies_wrapper(time_index, antenna1, antenna2,
-                          dde1_jones, source_coh, dde2_jones,
-                          die1_jones, base_vis, die2_jones):
+def _corr_shape(jones, ndim):
+    """ Correlation shape of ``jones``, of which ``ndim`` are leading dims """
+    if jones is None:
+        return ()
+
+    corr_chunks = jones.chunks[ndim:]
+
+    if not all(len(c) == 1 for c in corr_chunks):
+        raise ValueError("Subdivision of correlation dimensions "
+                         "into multiple chunks is not supported.")
+
+    return jones.shape[ndim:]
+
+
+def _block_key(array, *index):
+    """
+    Key of the ``array`` block at ``index``, which is
+    extended with the single correlation block.
+    """
+    if array is None:
+        return None
+
+    return (array.name,) + index + (0,) * (array.ndim - len(index))
+
+
+def _antenna_blocks(array, ant_dim, antennas=None):
+    """
+    Returns the indices and :code:`(lower, upper)` antenna bounds
+    of the ``array`` blocks along the antenna dimension ``ant_dim``
+    that contain ``antennas``, or of all blocks if ``antennas`` is None.
+    """
+    if array is None:
+        return None
+
+    bounds = np.cumsum((0,) + array.chunks[ant_dim])
+    nants = bounds[-1]
+
+    if antennas is None:
+        blocks = range(len(array.chunks[ant_dim]))
+    else:
+        antennas = np.asarray(antennas)
+
+        if np.any((antennas < 0) | (antennas >= nants)):
+            raise ValueError("row_antennas contains antennas outside "
+                             "the %d antennas of the Jones terms" % nants)
+
+        blocks = np.unique(np.searchsorted(bounds, antennas,
+                                           side='right') - 1).tolist()
+
+    return [(b, (int(bounds[b]), int(bounds[b + 1]))) for b in blocks]
+
+
+def _antenna_keys(array, index, ant_dim, blocks):
+    """
+    Keys of the ``array`` antenna ``blocks`` along the antenna
+    dimension ``ant_dim``, at the block ``index`` of the
+    remaining dimensions.
+    """
+    if array is None:
+        return None
+
+    return [_block_key(array, *(index[:ant_dim] + (b,) + index[ant_dim:]))
+            for b, _ in blocks]
+
+
+def _antenna_bounds(blocks):
+    """ Antenna bounds of the antenna ``blocks`` """
+    if blocks is None:
+        return None
+
+    return tuple(bounds for _, bounds in blocks)
+
+
+def _missing_antennas(ants):
+    return ValueError("Antennas %s referenced by antenna1 and antenna2 "
+                      "are not in the antenna blocks of this row chunk. "
+                      "Check row_antennas." % ants)
+
+
+def _gather_antennas(ants, blocks, bounds, ant_dim):
+    """
+    Gathers the antennas in ``ants`` from a list of antenna ``blocks``
+    with the :code:`(lower, upper)` antenna ``bounds``.
+    """
+    if blocks is None:
+        return None
+
+    pieces = []
+    gathered = 0
+
+    for block, (lower, upper) in zip(blocks, bounds):
+        ant_sel = ants[(ants >= lower) & (ants < upper)] - lower
+
+        if ant_sel.size > 0:
+            pieces.append(block.take(ant_sel, axis=ant_dim))
+            gathered += ant_sel.size
+
+    if gathered != ants.size:
+        raise _missing_antennas(ants)
+
+    return np.concatenate(pieces, axis=ant_dim)
+
+
+def _predict_block(dde_bounds, die_bounds,
+                   time_index, antenna1, antenna2,
+                   dde1_jones, source_coh, dde2_jones,
+                   die1_jones, base_vis, die2_jones):
+    """
+    Predicts a block of visibilities from lists of antenna blocks
+    of the direction dependent and independent Jones terms, whose
+    :code:`(lower, upper)` antenna ranges are ``dde_bounds``
+    and ``die_bounds``.
+
+    If each term has a single antenna block, starting at the same
+    antenna, the antenna indices are offset into the blocks.
+    Otherwise, only the antennas referenced by ``antenna1`` and
+    ``antenna2`` are gathered from the blocks and the antenna
+    indices are remapped onto the gathered antennas.
+    """
+    bounds = [b for b in (dde_bounds, die_bounds) if b is not None]
+    lowers = set(b[0][0] for b in bounds)
+
+    if all(len(b) == 1 for b in bounds) and len(lowers) <= 1:
+        lower = lowers.pop() if len(lowers) > 0 else 0
+        upper = min(b[0][1] for b in bounds) if len(bounds) > 0 else 0
+
+        if len(bounds) > 0 and antenna1.size > 0:
+            amin = min(antenna1.min(), antenna2.min())
+            amax = max(antenna1.max(), antenna2.max())
+
+            if amin < lower or amax >= upper:
+                raise _missing_antennas(np.unique(np.concatenate(
+                    [antenna1, antenna2])))
+
+        if lower > 0:
+            antenna1 = antenna1 - lower
+            antenna2 = antenna2 - lower
+
+        dde1_jones = dde1_jones[0] if dde1_jones else None
+        dde2_jones = dde2_jones[0] if dde2_jones else None
+        die1_jones = die1_jones[0] if die1_jones else None
+        die2_jones = die2_jones[0] if die2_jones else None
+    else:
+        ants = np.unique(np.concatenate([antenna1, antenna2]))
+        antenna1 = np.searchsorted(ants, antenna1)
+        antenna2 = np.searchsorted(ants, antenna2)
+        dde1_jones = _gather_antennas(ants, dde1_jones, dde_bounds, 2)
+        dde2_jones = _gather_antennas(ants, dde2_jones, dde_bounds, 2)
+        die1_jones = _gather_antennas(ants, die1_jones, die_bounds, 1)
+        die2_jones = _gather_antennas(ants, die2_jones, die_bounds, 1)
 
     return np_predict_vis(time_index, antenna1, antenna2,
-                          # dde1_jones loses the 'source' and 'ant' dims
-                          dde1_jones[0][0] if dde1_jones else None,
-                          # source_coh loses the 'source' dim
-                          source_coh[0] if source_coh else None,
-                          # dde2_jones loses the 'source' and 'ant' dims
-                          dde2_jones[0][0] if dde2_jones else None,
-                          # die1_jones loses the 'ant' dim
-                          die1_jones[0] if die1_jones else None,
-                          base_vis,
-                          # die2_jones loses the 'ant' dim
-                          die2_jones[0] if die2_jones else None)
+                          dde1_jones, source_coh, dde2_jones,
+                          die1_jones, base_vis, die2_jones)
 
 
 @requires_optional('dask.array')
 def predict_vis(time_index, antenna1, antenna2,
                 dde1_jones=None, source_coh=None, dde2_jones=None,
-                die1_jones=None, base_vis=None, die2_jones=None):
+                die1_jones=None, base_vis=None, die2_jones=None,
+                row_antennas=None):
 
     have_a1 = dde1_jones is not None
     have_a2 = dde2_jones is not None
     have_bl = source_coh is not None
     have_g1 = die1_jones is not None
-    have_coh = base_vis is not None
     have_g2 = die2_jones is not None
 
     if have_a1 ^ have_a2:
@@ -228,15 +406,8 @@ def predict_vis(time_index, antenna1, antenna2,
     have_ants = have_a1 and have_a2
 
     if have_ants:
-        if dde1_jones.shape[2] != dde1_jones.chunks[2][0]:
-            raise ValueError("Subdivision of antenna dimension into "
-                             "multiple chunks is not supported.")
-
-        if dde2_jones.shape[2] != dde2_jones.chunks[2][0]:
-            raise ValueError("Subdivision of antenna dimension into "
-                             "multiple chunks is not supported.")
-
-        if dde1_jones.chunks != dde2_jones.chunks:
+        # Correlation shapes may differ between scalar and diagonal terms
+        if dde1_jones.chunks[:4] != dde2_jones.chunks[:4]:
             raise ValueError("dde1_jones.chunks != dde2_jones.chunks")
 
         if len(dde1_jones.chunks[1]) != len(time_index.chunks[0]):
@@ -251,15 +422,7 @@ def predict_vis(time_index, antenna1, antenna2,
     have_dies = have_g1 and have_g2
 
     if have_dies:
-        if die1_jones.shape[1] != die1_jones.chunks[1][0]:
-            raise ValueError("Subdivision of antenna dimension into "
-                             "multiple chunks is not supported.")
-
-        if die2_jones.shape[1] != die2_jones.chunks[1][0]:
-            raise ValueError("Subdivision of antenna dimension into "
-                             "multiple chunks is not supported.")
-
-        if die1_jones.chunks != die2_jones.chunks:
+        if die1_jones.chunks[:3] != die2_jones.chunks[:3]:
             raise ValueError("die1_jones.chunks != die2_jones.chunks")
 
         if len(die1_jones.chunks[0]) != len(time_index.chunks[0]):
@@ -267,18 +430,45 @@ def predict_vis(time_index, antenna1, antenna2,
                              "number of time chunks (%s)." %
                              (time_index.chunks[0], die1_jones.chunks[1]))
 
-    # Generate strings for the correlation dimensions
+    if not (have_ants or have_bl or have_dies):
+        raise ValueError("Missing both antenna and baseline jones terms")
+
+    # Source chunks must agree between the direction dependent terms
+    if have_ants and have_bl and dde1_jones.chunks[0] != source_coh.chunks[0]:
+        raise ValueError("Source chunks of dde1_jones (%s) and "
+                         "source_coh (%s) do not match" %
+                         (dde1_jones.chunks[0], source_coh.chunks[0]))
+
     if have_ants:
-        cdims = tuple("corr-%d" % i for i in range(len(dde1_jones.shape[4:])))
+        nsrc_blocks = len(dde1_jones.chunks[0])
     elif have_bl:
-        cdims = tuple("corr-%d" % i for i in range(len(source_coh.shape[3:])))
-    elif have_dies:
-        cdims = tuple("corr-%d" % i for i in range(len(die1_jones.shape[3:])))
+        nsrc_blocks = len(source_coh.chunks[0])
     else:
-        raise ValueError("Missing both antenna and baseline jones terms")
+        nsrc_blocks = 0
+
+    # Channel chunks must agree between all terms
+    chan_chunks = set(a.chunks[chan_dim] for a, chan_dim
+                      in ((dde1_jones, 3), (source_coh, 2),
+                          (die1_jones, 2), (base_vis, 1))
+                      if a is not None)
+
+    if len(chan_chunks) != 1:
+        raise ValueError("Channel chunks of the inputs "
+                         "do not match %s" % chan_chunks)
+
+    chan_chunks = chan_chunks.pop()
+
+    # Infer the output correlation shape. Scalar, diagonal
+    # and full Jones terms may be mixed, as in the numpy version
+    corr_shapes = [_corr_shape(dde1_jones, 4), _corr_shape(source_coh, 3),
+                   _corr_shape(dde2_jones, 4), _corr_shape(die1_jones, 3),
+                   _corr_shape(base_vis, 2), _corr_shape(die2_jones, 3)]
+
+    out_corrs = output_corr_shape(corr_shapes)
 
     # Infer the output dtype
-    dtype_arrays = [dde1_jones, source_coh, dde2_jones, die1_jones, die2_jones]
+    dtype_arrays = [dde1_jones, source_coh, dde2_jones,
+                    die1_jones, base_vis, die2_jones]
     out_dtype = np.result_type(*(np.dtype(a.dtype.name)
                                  for a in dtype_arrays if a is not None))
 
@@ -287,135 +477,86 @@ def predict_vis(time_index, antenna1, antenna2,
     # are related to a contiguous series of timesteps.
     # This means that the number of chunks of these
     # two dimensions must match even though the chunk sizes may not.
-    # da.core.atop insists on matching chunk sizes.
-    # For this reason, we use the lower level da.core.top and
-    # substitute "row" for "time" in arrays such as dde1_jones
-    # and die1_jones.
-    token = da.core.tokenize(time_index, antenna1, antenna2,
-                             dde1_jones, source_coh, dde2_jones, base_vis)
-
-    ajones_dims = ("src", "row", "ant", "chan") + cdims
-    gjones_dims = ("row", "ant", "chan") + cdims
-
-    # Setup
-    # 1. Optional top arguments
-    # 2. Optional numblocks kwarg
-    # 3. dask graph inputs
-    array_dsk = ShareDict()
-    top_args = [time_index.name, ("row",),
-                antenna1.name, ("row",),
-                antenna2.name, ("row",)]
-    numblocks = {
-        time_index.name: time_index.numblocks,
-        antenna1.name: antenna1.numblocks,
-        antenna2.name: antenna2.numblocks
-    }
-
-    # Merge input graphs into the top graph
-    array_dsk.update(time_index.__dask_graph__())
-    array_dsk.update(antenna1.__dask_graph__())
-    array_dsk.update(antenna2.__dask_graph__())
-
-    # Handle presence/absence of dde1_jones
-    if have_ants:
-        top_args.extend([dde1_jones.name, ajones_dims])
-        numblocks[dde1_jones.name] = dde1_jones.numblocks
-        array_dsk.update(dde1_jones.__dask_graph__())
-        other_chunks = dde1_jones.chunks[3:]
-        src_chunks = dde1_jones.chunks[0]
-    else:
-        top_args.extend([None, None])
-
-    # Handle presence/absence of source_coh
-    if have_bl:
-        top_args.extend([source_coh.name, ("src", "row", "chan") + cdims])
-        numblocks[source_coh.name] = source_coh.numblocks
-        other_chunks = source_coh.chunks[2:]
-        src_chunks = source_coh.chunks[0]
-        array_dsk.update(source_coh.__dask_graph__())
-    else:
-        top_args.extend([None, None])
-
-    # Handle presence/absence of dde2_jones
-    if have_ants:
-        top_args.extend([dde2_jones.name, ajones_dims])
-        numblocks[dde2_jones.name] = dde2_jones.numblocks
-        other_chunks = dde1_jones.chunks[3:]
-        array_dsk.update(dde2_jones.__dask_graph__())
-        other_chunks = dde2_jones.chunks[3:]
-        src_chunks = dde1_jones.chunks[0]
-    else:
-        top_args.extend([None, None])
-
-    # die1_jones, base_vis and die2_jones absent for this part of the graph
-    top_args.extend([None, None, None, None, None, None])
-
-    assert len(top_args) // 2 == 9, len(top_args) // 2
+    # Row block r is therefore associated with time block r
+    # in arrays such as dde1_jones and die1_jones.
+    #
+    # Rather than producing a partial visibility block per
+    # source chunk and summing them afterwards, the source chunks
+    # of each (row, chan) block are accumulated in order by a chain
+    # of tasks. Each task receives the previous partial sum as its
+    # base visibilities, so that only O(1) visibility blocks
+    # are live per (row, chan) block. The base visibilities
+    # enter the chain in the first task, while
+    # the direction independent effects are applied in the last.
+    nrow_blocks = len(time_index.chunks[0])
+
+    if row_antennas is not None and len(row_antennas) != nrow_blocks:
+        raise ValueError("row_antennas must contain the antennas of "
+                         "each of the %d row chunks" % nrow_blocks)
 
+    token = da.core.tokenize(time_index, antenna1, antenna2,
+                             dde1_jones, source_coh, dde2_jones,
+                             die1_jones, base_vis, die2_jones,
+                             row_antennas)
     name = "-".join(("predict_vis", token))
-    dsk = da.core.top(_predict_coh_wrapper,
-                      name, ("src", "row", "chan") + cdims,
-                      *top_args,
-                      numblocks=numblocks)
-
-    array_dsk.update(dsk)
+    sum_name = "-".join(("predict_vis-sum", token))
+
+    dsk = {}
+
+    for r in range(nrow_blocks):
+        row_keys = ((time_index.name, r),
+                    (antenna1.name, r),
+                    (antenna2.name, r))
+
+        # Antenna blocks of the Jones terms referenced by this row chunk.
+        # All antenna blocks are inputs if row_antennas isn't supplied
+        ants = None if row_antennas is None else row_antennas[r]
+        dde_blocks = _antenna_blocks(dde1_jones, 2, ants)
+        die_blocks = _antenna_blocks(die1_jones, 1, ants)
+        bounds = (_antenna_bounds(dde_blocks), _antenna_bounds(die_blocks))
+
+        for c in range(len(chan_chunks)):
+            prev_key = _block_key(base_vis, r, c)
+
+            for s in range(nsrc_blocks):
+                last = s == nsrc_blocks - 1
+                key = (name, r, c) + (0,)*len(out_corrs) if last \
+                    else (sum_name, s, r, c)
+
+                dsk[key] = ((_predict_block,) + bounds + row_keys + (
+                            _antenna_keys(dde1_jones, (s, r, c), 2,
+                                          dde_blocks),
+                            _block_key(source_coh, s, r, c),
+                            _antenna_keys(dde2_jones, (s, r, c), 2,
+                                          dde_blocks),
+                            _antenna_keys(die1_jones, (r, c), 1, die_blocks)
+                            if last else None,
+                            prev_key,
+                            _antenna_keys(die2_jones, (r, c), 1, die_blocks)
+                            if last else None))
+
+                prev_key = key
+
+            # Only direction independent effects are present
+            if nsrc_blocks == 0:
+                dsk[(name, r, c) + (0,)*len(out_corrs)] = (
+                            (_predict_block,) + bounds + row_keys +
+                            (None, None, None,
+                             _antenna_keys(die1_jones, (r, c), 1,
+                                           die_blocks),
+                             prev_key,
+                             _antenna_keys(die2_jones, (r, c), 1,
+                                           die_blocks)))
 
-    # We can infer output chunk sizes from source_coh
-    chunks = ((1,)*len(src_chunks), time_index.chunks[0],) + other_chunks
-
-    sum_coherencies = da.Array(array_dsk, name, chunks, dtype=out_dtype)
-    sum_coherencies = sum_coherencies.sum(axis=0)
-
-    if have_coh:
-        sum_coherencies += base_vis
-
-    if not have_dies:
-        return sum_coherencies
-
-    # Now apply any Direction Independent Effect Terms
-
-    # Setup
-    # 1. Optional top arguments
-    # 2. Optional numblocks kwarg
-    # 3. dask graph inputs
     array_dsk = ShareDict()
-    top_args = [time_index.name, ("row",),
-                antenna1.name, ("row",),
-                antenna2.name, ("row",)]
-    numblocks = {
-        time_index.name: time_index.numblocks,
-        antenna1.name: antenna1.numblocks,
-        antenna2.name: antenna2.numblocks
-    }
-
-    array_dsk.update(time_index.__dask_graph__())
-    array_dsk.update(antenna1.__dask_graph__())
-    array_dsk.update(antenna2.__dask_graph__())
-
-    # dde1_jones, source_coh  and dde2_jones not present
-    top_args.extend([None, None, None, None, None, None])
-
-    top_args.extend([die1_jones.name, gjones_dims])
-    top_args.extend([sum_coherencies.name, ("row", "chan") + cdims])
-    top_args.extend([die2_jones.name, gjones_dims])
-    numblocks[die1_jones.name] = die1_jones.numblocks
-    numblocks[sum_coherencies.name] = sum_coherencies.numblocks
-    numblocks[die2_jones.name] = die2_jones.numblocks
-    array_dsk.update(die1_jones.__dask_graph__())
-    array_dsk.update(sum_coherencies.__dask_graph__())
-    array_dsk.update(die2_jones.__dask_graph__())
-
-    assert len(top_args) // 2 == 9
+    array_dsk.update_with_key(dsk, key=name)
 
-    token = da.core.tokenize(time_index, antenna1, antenna2,
-                             die1_jones, sum_coherencies, die2_jones)
-    name = '-'.join(("predict_vis", token))
-    dsk = da.core.top(_predict_dies_wrapper,
-                      name, ("row", "chan") + cdims,
-                      *top_args, numblocks=numblocks)
-    array_dsk.update(dsk)
+    for a in [time_index, antenna1, antenna2] + dtype_arrays:
+        if a is not None:
+            array_dsk.update(a.__dask_graph__())
 
-    chunks = (time_index.chunks[0],) + other_chunks
+    chunks = ((time_index.chunks[0], chan_chunks) +
+              tuple((c,) for c in out_corrs))
 
     return da.Array(array_dsk, name, chunks, dtype=out_dtype)
 
@@ -428,7 +569,13 @@ parallactic_angles.__doc__ = mod_docs(np_parangles.__doc__,
                                         ":class:`dask.array.Array`")])
 
 feed_rotation.__doc__ = mod_docs(np_feed_rotation.__doc__,
-                                 [(":class:`numpy.ndarray`",
+                                 [("    out : :class:`numpy.ndarray`, "
+                                   "optional\n"
+                                   "        C-contiguous array of the shape "
+                                   "and dtype of the result,\n"
+                                   "        into which the feed rotation "
+                                   "is written.\n", ""),
+                                  (":class:`numpy.ndarray`",
                                    ":class:`dask.array.Array`")])
 
 transform_sources.__doc__ = mod_docs(np_transform_sources.__doc__,
@@ -439,15 +586,36 @@ beam_cube_dde.__doc__ = mod_docs(np_beam_cude_dde.__doc__,
                                  [(":class:`numpy.ndarray`",
                                    ":class:`dask.array.Array`")])
 
+transformed_beam_cube_dde.__doc__ = mod_docs(np_xform_beam_dde.__doc__,
+                                             [(":class:`numpy.ndarray`",
+                                               ":class:`dask.array.Array`")])
+
 zernike_dde.__doc__ = mod_docs(np_zernike_dde.__doc__,
                                [(":class:`numpy.ndarray`",
                                    ":class:`dask.array.Array`")])
 
 
+EXTRA_DASK_PARAMS = """row_antennas : list of :class:`numpy.ndarray`, optional
+    Antenna indices referenced by ``antenna1`` and ``antenna2``
+    in each ``row`` chunk. If supplied, each task only depends on
+    the antenna chunks of the Jones terms containing these antennas.
+"""
+
 EXTRA_DASK_NOTES = """
-* The ``ant`` dimension should only contain a single chunk equal
-  to the number of antenna. Since each ``row`` can contain
-  any antenna, random access must be preserved along this dimension.
+* Source chunks are accumulated in order for each
+  ``row`` and ``chan`` chunk of the output, so that memory usage
+  does not grow with the number of source chunks.
+* The ``ant`` dimension may be chunked. The antenna indices are
+  lazy, so by default every antenna chunk associated with a
+  ``row`` chunk's timesteps is an input to the task predicting it.
+  Supply ``row_antennas`` so that each task only depends on the
+  antenna chunks referenced by its ``row`` chunk:
+
+  .. code-block:: python
+
+      bounds = np.cumsum((0,) + row_chunks)
+      row_antennas = [np.unique(np.concatenate([ant1[s:e], ant2[s:e]]))
+                      for s, e in zip(bounds[:-1], bounds[1:])]
 * The chunks in the ``row`` and ``time`` dimension **must** align.
   This subtle point **must be understood otherwise
   invalid results will be produced** by the chunking scheme.
@@ -508,6 +676,7 @@ EXTRA_DASK_NOTES = """
 try:
     predict_vis.__doc__ = PREDICT_DOCS.substitute(
                                 array_type=":class:`dask.array.Array`",
-                                extra_notes=EXTRA_DASK_NOTES)
+                                extra_notes=EXTRA_DASK_NOTES,
+                                extra_params=EXTRA_DASK_PARAMS)
 except AttributeError:
     pass
@@ -4,72 +4,100 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from operator import mul
-try:
-    from functools import reduce
-except ImportError:
-    pass
-
 import numba
 import numpy as np
 
 
-@numba.njit(nogil=True, cache=True)
+@numba.njit(nogil=True, cache=True, parallel=True)
 def _nb_feed_rotation(parallactic_angles, feed_type, feed_rotation):
-    shape = parallactic_angles.shape
-    parangles = parallactic_angles.flat
+    """
+    Computes the 2x2 feed rotation matrices of the flattened
+    ``parallactic_angles`` in parallel, into ``feed_rotation``
+    of shape :code:`(pa, 2, 2)`.
+    """
+    npa = parallactic_angles.shape[0]
+
+    if feed_type != 0 and feed_type != 1:
+        raise ValueError("Invalid feed_type")
 
     # Linear feeds
     if feed_type == 0:
-        for i, pa in enumerate(parangles):
-            pa_cos = np.cos(pa)
-            pa_sin = np.sin(pa)
-
-            feed_rotation.real[i, 0, 0] = pa_cos
-            feed_rotation.imag[i, 0, 0] = 0.0
-            feed_rotation.real[i, 0, 1] = pa_sin
-            feed_rotation.imag[i, 0, 1] = 0.0
-            feed_rotation.real[i, 1, 0] = -pa_sin
-            feed_rotation.imag[i, 1, 0] = 0.0
-            feed_rotation.real[i, 1, 1] = pa_cos
-            feed_rotation.imag[i, 1, 1] = 0.0
+        for i in numba.prange(npa):
+            pa_cos = np.cos(parallactic_angles[i])
+            pa_sin = np.sin(parallactic_angles[i])
+
+            feed_rotation[i, 0, 0] = pa_cos
+            feed_rotation[i, 0, 1] = pa_sin
+            feed_rotation[i, 1, 0] = -pa_sin
+            feed_rotation[i, 1, 1] = pa_cos
 
     # Circular feeds
-    elif feed_type == 1:
-        for i, pa in enumerate(parangles):
-            pa_cos = np.cos(pa)
-            pa_sin = np.sin(pa)
-
-            feed_rotation.real[i, 0, 0] = pa_cos
-            feed_rotation.imag[i, 0, 0] = -pa_sin
-            feed_rotation[i, 0, 1] = 0.0 + 0.0*1j
-            feed_rotation[i, 1, 0] = 0.0 + 0.0*1j
-            feed_rotation.real[i, 1, 1] = pa_cos
-            feed_rotation.imag[i, 1, 1] = pa_sin
     else:
-        raise ValueError("Invalid feed_type")
+        for i in numba.prange(npa):
+            pa_cos = np.cos(parallactic_angles[i])
+            pa_sin = np.sin(parallactic_angles[i])
+
+            feed_rotation[i, 0, 0] = pa_cos - pa_sin*1j
+            feed_rotation[i, 0, 1] = 0.0
+            feed_rotation[i, 1, 0] = 0.0
+            feed_rotation[i, 1, 1] = pa_cos + pa_sin*1j
 
-    return feed_rotation.reshape(shape + (2, 2))
+    return feed_rotation
 
 
-def feed_rotation(parallactic_angles, feed_type='linear'):
+@numba.njit(nogil=True, cache=True, parallel=True)
+def _nb_linear_compact_feed_rotation(parallactic_angles, feed_rotation):
+    """
+    Computes the real :code:`(cos(pa), sin(pa))` pairs of the
+    flattened ``parallactic_angles`` in parallel, into
+    ``feed_rotation`` of shape :code:`(pa, 2)`.
     """
+    for i in numba.prange(parallactic_angles.shape[0]):
+        feed_rotation[i, 0] = np.cos(parallactic_angles[i])
+        feed_rotation[i, 1] = np.sin(parallactic_angles[i])
+
+    return feed_rotation
+
+
+@numba.njit(nogil=True, cache=True, parallel=True)
+def _nb_circular_compact_feed_rotation(parallactic_angles, feed_rotation):
+    """
+    Computes the complex diagonal feed rotation of the
+    flattened ``parallactic_angles`` in parallel, into
+    ``feed_rotation`` of shape :code:`(pa, 2)`.
+    """
+    for i in numba.prange(parallactic_angles.shape[0]):
+        pa_cos = np.cos(parallactic_angles[i])
+        pa_sin = np.sin(parallactic_angles[i])
+
+        feed_rotation[i, 0] = pa_cos - pa_sin*1j
+        feed_rotation[i, 1] = pa_cos + pa_sin*1j
+
+    return feed_rotation
+
+
+def feed_rotation(parallactic_angles, feed_type='linear',
+                  compact=False, out=None):
+    r"""
     Computes the 2x2 feed rotation (L) matrix
     from the ``parallactic_angles``.
 
     .. math::
 
-        \\textrm{linear}
-        \\begin{bmatrix}
-        cos(pa) & sin(pa) \\\\
+        \textrm{linear}
+        \begin{bmatrix}
+        cos(pa) & sin(pa) \\
         -sin(pa) & cos(pa)
-        \\end{bmatrix}
-        \\qquad
-        \\textrm{circular}
-        \\begin{bmatrix}
-        e^{-i pa} & 0 \\\\
+        \end{bmatrix}
+        \qquad
+        \textrm{circular}
+        \begin{bmatrix}
+        e^{-i pa} & 0 \\
         0 & e^{i pa}
-        \\end{bmatrix}
+        \end{bmatrix}
+
+    Single precision ``parallactic_angles`` are rotated
+    in single precision.
 
     Parameters
     ----------
@@ -78,11 +106,23 @@ def feed_rotation(parallactic_angles, feed_type='linear'):
         :code:`(pa0, pa1, ..., pan)`.
     feed_type : {'linear', 'circular'}
         The type of feed
+    compact : bool, optional
+        If True, returns a compact representation of shape
+        :code:`(pa0, pa1, ..., pan, 2)`.
+        For linear feeds, this is the real
+        :math:`(cos(pa), sin(pa))` pair.
+        For circular feeds, this is the complex diagonal
+        :math:`(e^{-i pa}, e^{i pa})`, which may be used directly as a
+        diagonal Jones term. Defaults to False.
+    out : :class:`numpy.ndarray`, optional
+        C-contiguous array of the shape and dtype of the result,
+        into which the feed rotation is written.
 
     Returns
     -------
     :class:`numpy.ndarray`
-        Feed rotation matrix of shape :code:`(pa0, pa1,...,pan,2,2)`
+        Feed rotation matrix of shape :code:`(pa0, pa1,...,pan,2,2)`,
+        or :code:`(pa0, pa1,...,pan,2)` if ``compact`` is True.
     """
     if feed_type == 'linear':
         poltype = 0
@@ -100,8 +140,35 @@ def feed_rotation(parallactic_angles, feed_type='linear'):
                          "none-floating point type %s"
                          % parallactic_angles.dtype)
 
-    # Create result array with flattened parangles
-    shape = (reduce(mul, parallactic_angles.shape),) + (2, 2)
-    result = np.empty(shape, dtype=dtype)
+    if compact:
+        corr_shape = (2,)
+        # Linear feed rotations are real
+        if poltype == 0:
+            dtype = parallactic_angles.dtype
+    else:
+        corr_shape = (2, 2)
+
+    shape = parallactic_angles.shape + corr_shape
+
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape or out.dtype != dtype:
+        raise ValueError("out has shape %s and dtype %s but "
+                         "shape %s and dtype %s are required" %
+                         (out.shape, out.dtype, shape, np.dtype(dtype)))
+    elif not out.flags.c_contiguous:
+        raise ValueError("out is not C contiguous")
+
+    # Flatten parallactic angles and output.
+    # Reshaping the contiguous output produces a view
+    parangles = parallactic_angles.ravel()
+    result = out.reshape((parangles.shape[0],) + corr_shape)
+
+    if compact and poltype == 0:
+        _nb_linear_compact_feed_rotation(parangles, result)
+    elif compact:
+        _nb_circular_compact_feed_rotation(parangles, result)
+    else:
+        _nb_feed_rotation(parangles, poltype, result)
 
-    return _nb_feed_rotation(parallactic_angles, poltype, result)
+    return out
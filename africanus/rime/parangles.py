@@ -6,12 +6,15 @@ from __future__ import print_function
 
 import warnings
 
+import numpy as np
+
 from .parangles_astropy import (have_astropy_parangles,
                                 astropy_parallactic_angles)
 from .parangles_casa import (have_casa_parangles,
                              casa_parallactic_angles)
+from .parangles_numpy import numpy_parallactic_angles
 
-_discovered_backends = []
+_discovered_backends = ['numpy']
 
 if have_astropy_parangles:
     _discovered_backends.append('astropy')
@@ -20,11 +23,69 @@ if have_casa_parangles:
     _discovered_backends.append('casa')
 
 
-_standard_backends = set(['casa', 'astropy', 'test'])
+_standard_backends = set(['casa', 'astropy', 'numpy', 'test'])
+
+
+def _wrap_angles(angles):
+    """ Wraps ``angles`` into the [-pi, pi) interval """
+    return (angles + np.pi) % (2*np.pi) - np.pi
+
+
+def _interpolated_parallactic_angles(parangle_fn, times, antenna_positions,
+                                     field_centre, max_error):
+    """
+    Evaluates ``parangle_fn`` on a coarse, regular grid of times
+    and linearly interpolates the parallactic angles onto ``times``.
+
+    The grid is repeatedly refined by evaluating angles at the midpoints
+    of the grid until the difference between the evaluated and
+    interpolated midpoint angles is less than ``max_error``.
+    Angles are evaluated directly if the grid would
+    contain more points than there are unique ``times``.
+    """
+    def _parangles(t):
+        return np.asarray(parangle_fn(t, antenna_positions, field_centre))
+
+    utime, inverse = np.unique(times, return_inverse=True)
+
+    grid = np.linspace(utime[0], utime[-1], 3)
+
+    if grid.size >= utime.size:
+        return _parangles(times)
+
+    grid_pa = np.unwrap(_parangles(grid), axis=0)
+
+    while True:
+        if 2*grid.size - 1 >= utime.size:
+            return _parangles(times)
+
+        mid = 0.5*(grid[1:] + grid[:-1])
+        interp_pa = 0.5*(grid_pa[1:] + grid_pa[:-1])
+        diff = _wrap_angles(_parangles(mid) - interp_pa)
+
+        # Merge midpoints into the grid
+        new_grid = np.empty(2*grid.size - 1, dtype=grid.dtype)
+        new_grid[0::2] = grid
+        new_grid[1::2] = mid
+        new_pa = np.empty((new_grid.size,) + grid_pa.shape[1:],
+                          dtype=grid_pa.dtype)
+        new_pa[0::2] = grid_pa
+        new_pa[1::2] = interp_pa + diff
+        grid, grid_pa = new_grid, new_pa
+
+        if np.abs(diff).max() <= max_error:
+            break
+
+    pa = np.empty((utime.size, grid_pa.shape[1]), dtype=grid_pa.dtype)
+
+    for a in range(grid_pa.shape[1]):
+        pa[:, a] = np.interp(utime, grid, grid_pa[:, a])
+
+    return _wrap_angles(pa)[inverse]
 
 
 def parallactic_angles(times, antenna_positions, field_centre,
-                       backend='casa'):
+                       backend='casa', max_error=None):
     """
     Computes parallactic angles per timestep for the given
     reference antenna position and field centre.
@@ -39,15 +100,30 @@ def parallactic_angles(times, antenna_positions, field_centre,
         in *metres* in the *ITRF* frame.
     field_centre : :class:`numpy.ndarray`
         Field centre of shape :code:`(2,)` in *radians*
-    backend : {'casa', 'test'}, optional
+    backend : {'casa', 'numpy', 'astropy', 'test'}, optional
         Backend to use for calculating the parallactic angles.
 
         * ``casa`` defers to an implementation
           depending on ``python-casacore``.
           This backend should be used by default.
+        * ``numpy`` analytically computes parallactic angles
+          from the hour angle, declination and antenna latitude,
+          relative to J2000 north. It has no optional dependencies.
+          Away from the zenith, it agrees with the closed form
+          parallactic angle, using first order precession of the
+          field centre, to within 30 arcseconds.
+        * ``astropy`` defers to an implementation
+          depending on ``astropy``.
         * ``test`` creates parallactic angles
           by multiplying the ``times`` and ``antenna_position``
           arrays. It exist solely for testing.
+    max_error : float, optional
+        If supplied, parallactic angles are computed on
+        a coarse grid of times and linearly interpolated.
+        The grid is refined until the interpolation error, estimated
+        at the grid midpoints, is less than ``max_error`` radians.
+        Defaults to None, in which case angles are computed
+        at every timestep.
 
     Returns
     -------
@@ -65,14 +141,19 @@ def parallactic_angles(times, antenna_positions, field_centre,
 
     if backend == 'astropy':
         warnings.warn('astropy backend currently returns the incorrect values')
-        return astropy_parallactic_angles(times,
-                                          antenna_positions,
-                                          field_centre)
+        parangle_fn = astropy_parallactic_angles
     elif backend == 'casa':
-        return casa_parallactic_angles(times,
-                                       antenna_positions,
-                                       field_centre)
+        parangle_fn = casa_parallactic_angles
+    elif backend == 'numpy':
+        parangle_fn = numpy_parallactic_angles
     elif backend == 'test':
         return times[:, None]*(antenna_positions.sum(axis=1)[None, :])
     else:
         raise ValueError("Invalid backend %s" % backend)
+
+    if max_error is None:
+        return parangle_fn(times, antenna_positions, field_centre)
+
+    return _interpolated_parallactic_angles(parangle_fn, times,
+                                            antenna_positions,
+                                            field_centre, max_error)
@@ -6,11 +6,10 @@ from __future__ import print_function
 
 from ..util.requirements import requires_optional
 
+# astropy.coordinates is slow to import, so
+# only check for astropy until the backend is used
 try:
-    from astropy.coordinates import (EarthLocation, SkyCoord,
-                                     AltAz, CIRS)
-    from astropy.time import Time
-    from astropy import units
+    import astropy  # noqa: F401
 except ImportError:
     have_astropy_parangles = False
 else:
@@ -23,6 +22,11 @@ def astropy_parallactic_angles(times, antenna_positions, field_centre):
     Computes parallactic angles per timestep for the given
     reference antenna position and field centre.
     """
+    from astropy.coordinates import (EarthLocation, SkyCoord,
+                                     AltAz, CIRS)
+    from astropy.time import Time
+    from astropy import units
+
     ap = antenna_positions
     fc = field_centre
 
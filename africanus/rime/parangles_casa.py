@@ -16,8 +16,16 @@ except ImportError:
 else:
     have_casa_parangles = True
 
-    # Create a measures server
-    meas_serv = pyrap.measures.measures()
+
+_meas_serv = []
+
+
+def _measures_server():
+    """ Creates a measures server on first use """
+    if len(_meas_serv) == 0:
+        _meas_serv.append(pyrap.measures.measures())
+
+    return _meas_serv[0]
 
 
 @requires_optional('pyrap.measures', 'pyrap.quanta')
@@ -27,6 +35,7 @@ def casa_parallactic_angles(times, antenna_positions, field_centre,
     Computes parallactic angles per timestep for the given
     reference antenna position and field centre.
     """
+    meas_serv = _measures_server()
 
     # Create direction measure for the zenith
     zenith = meas_serv.direction(zenith_frame, '0deg', '90deg')
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+# Arcseconds to radians
+_ARCSEC = np.pi / (180.0 * 3600.0)
+
+# WGS84 ellipsoid
+_WGS84_A = 6378137.0
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+
+# Julian Date of the J2000 epoch and of MJD 0
+_J2000 = 2451545.0
+_MJD_OFFSET = 2400000.5
+
+
+def _geodetic(antenna_positions):
+    """
+    Converts ITRF antenna positions in metres into
+    WGS84 geodetic longitude and latitude in radians.
+    """
+    x = antenna_positions[:, 0]
+    y = antenna_positions[:, 1]
+    z = antenna_positions[:, 2]
+
+    lon = np.arctan2(y, x)
+    p = np.sqrt(x**2 + y**2)
+
+    # Iterate on the latitude, starting from the geocentric value
+    lat = np.arctan2(z, p * (1.0 - _WGS84_E2))
+
+    for _ in range(5):
+        sin_lat = np.sin(lat)
+        n = _WGS84_A / np.sqrt(1.0 - _WGS84_E2 * sin_lat**2)
+        lat = np.arctan2(z + _WGS84_E2 * n * sin_lat, p)
+
+    return lon, lat
+
+
+def _rotation(axis, angle):
+    """
+    Rotation matrices of shape :code:`(time, 3, 3)` about ``axis``
+    through ``angle``, following the SOFA ``iauRx`` conventions.
+    """
+    c = np.cos(angle)
+    s = np.sin(angle)
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+
+    r = np.zeros(angle.shape + (3, 3))
+    r[..., axis, axis] = 1.0
+    r[..., i, i] = c
+    r[..., j, j] = c
+    r[..., i, j] = s
+    r[..., j, i] = -s
+
+    return r
+
+
+def _precession_matrix(t):
+    """
+    IAU 1976 precession matrix from J2000 to the
+    mean equator and equinox of date.
+    ``t`` is in Julian centuries since J2000.
+    """
+    zeta = (2306.2181 + (0.30188 + 0.017998 * t) * t) * t * _ARCSEC
+    z = (2306.2181 + (1.09468 + 0.018203 * t) * t) * t * _ARCSEC
+    theta = (2004.3109 - (0.42665 + 0.041833 * t) * t) * t * _ARCSEC
+
+    return np.matmul(np.matmul(_rotation(2, -z), _rotation(1, theta)),
+                     _rotation(2, -zeta))
+
+
+def _nutation(t):
+    """
+    Nutation in longitude, nutation in obliquity and the mean
+    obliquity of the ecliptic, in radians, from the dominant
+    terms of the IAU 1980 nutation series.
+    ``t`` is in Julian centuries since J2000.
+    """
+    # Mean longitudes of the Moon's ascending node,
+    # the Sun and the Moon
+    omega = np.deg2rad(125.04452 - 1934.136261 * t)
+    lsun = np.deg2rad(280.4665 + 36000.7698 * t)
+    lmoon = np.deg2rad(218.3165 + 481267.8813 * t)
+
+    dpsi = (-17.20 * np.sin(omega) - 1.32 * np.sin(2 * lsun) -
+            0.23 * np.sin(2 * lmoon) + 0.21 * np.sin(2 * omega)) * _ARCSEC
+    deps = (9.20 * np.cos(omega) + 0.57 * np.cos(2 * lsun) +
+            0.10 * np.cos(2 * lmoon) - 0.09 * np.cos(2 * omega)) * _ARCSEC
+    eps = (84381.448 - (46.8150 + (0.00059 - 0.001813 * t) * t) * t)
+
+    return dpsi, deps, eps * _ARCSEC
+
+
+def _apparent_sidereal_time(jd, t):
+    """
+    Greenwich apparent sidereal time in radians from the
+    IAU 1982 mean sidereal time and the equation of the equinoxes.
+    UT1 is approximated by UTC.
+    """
+    d = jd - _J2000
+    gmst = (280.46061837 + 360.98564736629 * d +
+            (0.000387933 - t / 38710000.0) * t**2)
+    dpsi, _, eps = _nutation(t)
+
+    return np.deg2rad(gmst % 360.0) + dpsi * np.cos(eps)
+
+
+def numpy_parallactic_angles(times, antenna_positions, field_centre):
+    """
+    Computes parallactic angles per timestep for the given
+    reference antenna position and field centre.
+
+    The zenith of each antenna, at its WGS84 geodetic latitude and
+    local apparent sidereal time, is rotated from the true
+    equator and equinox of date into J2000 (IAU 1976 precession
+    and the dominant IAU 1980 nutation terms). The parallactic angle
+    is the position angle of the zenith relative to the J2000
+    field centre. Polar motion, aberration and the difference
+    between UT1 and UTC are ignored.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    antenna_positions = np.asarray(antenna_positions, dtype=np.float64)
+
+    # Convert from MJD seconds to Julian Date and centuries since J2000
+    jd = times / 86400.0 + _MJD_OFFSET
+    t = (jd - _J2000) / 36525.0
+
+    # J2000 to true equator and equinox of date
+    dpsi, deps, eps = _nutation(t)
+    nutation = np.matmul(np.matmul(_rotation(0, -(eps + deps)),
+                                   _rotation(2, -dpsi)),
+                         _rotation(0, eps))
+    rotation = np.matmul(nutation, _precession_matrix(t))
+
+    # Apparent zenith directions of shape (time, ant, 3)
+    lon, lat = _geodetic(antenna_positions)
+    zenith_ra = _apparent_sidereal_time(jd, t)[:, None] + lon[None, :]
+    zenith = np.empty(zenith_ra.shape + (3,))
+    zenith[..., 0] = np.cos(lat) * np.cos(zenith_ra)
+    zenith[..., 1] = np.cos(lat) * np.sin(zenith_ra)
+    zenith[..., 2] = np.sin(lat)
+
+    # Rotate zenith directions into J2000
+    zenith = np.einsum("tji,taj->tai", rotation, zenith)
+    zenith_ra = np.arctan2(zenith[..., 1], zenith[..., 0])
+    zenith_dec = np.arcsin(np.clip(zenith[..., 2], -1.0, 1.0))
+
+    # Position angle of the zenith at the field centre
+    ra, dec = field_centre[0], field_centre[1]
+    dra = zenith_ra - ra
+
+    return np.arctan2(np.sin(dra) * np.cos(zenith_dec),
+                      np.cos(dec) * np.sin(zenith_dec) -
+                      np.sin(dec) * np.cos(zenith_dec) * np.cos(dra))
@@ -25,7 +25,7 @@ def _get_jones_types(name, numba_ndarray_type, corr_1_dims, corr_2_dims):
     Determine which of the following three cases are valid:
 
     1. The array is not present (None) and therefore no Jones Matrices
-    2. single (1,) or (2,) dual correlation
+    2. single (1,) scalar or (2,) diagonal correlations
     3. (2, 2) full correlation
 
     Parameters
@@ -62,168 +62,289 @@ def _get_jones_types(name, numba_ndarray_type, corr_1_dims, corr_2_dims):
                          (name, corr_1_dims, corr_2_dims))
 
 
-def jones_mul_factory(have_ants, have_bl, jones_type, accumulate):
+def _jit_source(source, name):
+    """ Compiles function ``name`` defined in ``source`` with numba """
+    namespace = {'np': np}
+    code = compile(source, "<generated %s>" % name, "exec")
+    exec(code, namespace)
+    return njit(nogil=True)(namespace[name])
+
+
+def _load_jones(var, arg, jones_type, conj=False):
+    """
+    Generates statements loading the (optionally conjugated)
+    elements of Jones term ``arg`` into local variables
+    prefixed by ``var``.
+
+    Returns a tuple of statements and a 2x2 nested list of
+    variable names. Elements known to be zero are None.
+    Scalar (1,) and diagonal (2,) terms are both loaded as a diagonal,
+    the second element being indexed by :code:`shape[0] - 1`.
+    """
+    if jones_type == JONES_1_OR_2:
+        index = [["0", None], [None, "%s.shape[0] - 1" % arg]]
+    elif jones_type == JONES_2X2:
+        index = [["%d, %d" % (i, j) for j in range(2)] for i in range(2)]
+    else:
+        raise ValueError("Invalid Jones Type %s" % jones_type)
+
+    if conj:
+        template = "%s_%d%d = np.conj(%s[%s])"
+    else:
+        template = "%s_%d%d = %s[%s]"
+
+    stmts = []
+    names = [[None, None], [None, None]]
+
+    for i in range(2):
+        for j in range(2):
+            if index[i][j] is not None:
+                stmts.append(template % (var, i, j, arg, index[i][j]))
+                names[i][j] = "%s_%d%d" % (var, i, j)
+
+    return stmts, names
+
+
+def _matmul_jones(var, lhs, rhs):
+    """
+    Generates statements multiplying the 2x2 ``lhs`` and ``rhs``
+    variable names, skipping products with zero elements.
+    """
+    stmts = []
+    names = [[None, None], [None, None]]
+
+    for i in range(2):
+        for j in range(2):
+            terms = ["%s * %s" % (lhs[i][k], rhs[k][j]) for k in range(2)
+                     if lhs[i][k] is not None and rhs[k][j] is not None]
+
+            if len(terms) > 0:
+                stmts.append("%s_%d%d = %s" % (var, i, j, " + ".join(terms)))
+                names[i][j] = "%s_%d%d" % (var, i, j)
+
+    return stmts, names
+
+
+def _store_jones(names, out_type, accumulate):
+    """ Generates statements storing ``names`` in ``out`` """
+    op = "+=" if accumulate else "="
+    stmts = []
+
+    if out_type == JONES_2X2:
+        for i in range(2):
+            for j in range(2):
+                if names[i][j] is not None:
+                    stmts.append("out[%d, %d] %s %s" %
+                                 (i, j, op, names[i][j]))
+                elif not accumulate:
+                    stmts.append("out[%d, %d] = 0" % (i, j))
+    elif out_type == JONES_1_OR_2:
+        if names[0][1] is not None or names[1][0] is not None:
+            raise ValueError("Off-diagonal terms can't be stored "
+                             "in scalar or diagonal Jones terms")
+
+        # Scalar outputs only contain the first diagonal
+        stmts.append("out[0] %s %s" % (op, names[0][0] or "0"))
+        stmts.append("if out.shape[0] == 2:")
+        stmts.append("    out[1] %s %s" % (op, names[1][1] or "0"))
+    else:
+        raise ValueError("Invalid Jones Type %s" % out_type)
+
+    return stmts
+
+
+def jones_mul_factory(a1_type, bl_type, a2_type, out_type, accumulate):
     """
     Outputs a function that multiplies some combination of
     (dde1_jones, baseline_jones, dde2_jones) together.
 
+    The function is generated for the specific combination of
+    scalar/diagonal and full Jones terms, so that multiplications
+    by zero off-diagonal elements are elided.
+
     Parameters
     ----------
-    have_ants : boolean
-        If True, indicates that antenna jones terms are present
-    have_bl : boolean
-        If True, indicates that baseline jones terms are present
-    jones_type : int
-        Type of Jones matrix
+    a1_type : int
+        Type of the first antenna Jones matrix
+    bl_type : int
+        Type of the baseline Jones matrix
+    a2_type : int
+        Type of the second antenna Jones matrix
+    out_type : int
+        Type of the output Jones matrix
     accumulate : boolean
         If True, the result of the multiplication is accumulated
         into the output, otherwise, it is assigned
 
-    Notes
-    -----
-    ``accumulate`` is treated by LLVM as a compile-time constant,
-    according to https://numba.pydata.org/numba-doc/latest/glossary.html.
-
-    Therefore in principle, the conditional checks
-    involving ``accumulate`` inside the functions should
-    be elided by the compiler.
-
-
     Returns
     -------
     callable
         jitted numba function performing the Jones Multiply
     """
-    ex = ValueError("Invalid Jones Type %s" % jones_type)
-
-    if have_bl and have_ants:
-        if jones_type == JONES_1_OR_2:
-            def jones_mul(a1j, blj, a2j, out):
-                for c in range(out.shape[0]):
-                    if accumulate:
-                        out[c] += a1j[c] * blj[c] * np.conj(a2j[c])
-                    else:
-                        out[c] = a1j[c] * blj[c] * np.conj(a2j[c])
-
-        elif jones_type == JONES_2X2:
-            def jones_mul(a1j, blj, a2j, out):
-                a2_xx_H = np.conj(a2j[0, 0])
-                a2_xy_H = np.conj(a2j[0, 1])
-                a2_yx_H = np.conj(a2j[1, 0])
-                a2_yy_H = np.conj(a2j[1, 1])
-
-                xx = blj[0, 0] * a2_xx_H + blj[0, 1] * a2_yx_H
-                xy = blj[0, 0] * a2_xy_H + blj[0, 1] * a2_yy_H
-                yx = blj[1, 0] * a2_xx_H + blj[1, 1] * a2_yx_H
-                yy = blj[1, 0] * a2_xy_H + blj[1, 1] * a2_yy_H
-
-                if accumulate:
-                    out[0, 0] += a1j[0, 0] * xx + a1j[0, 1] * yx
-                    out[0, 1] += a1j[0, 0] * xy + a1j[0, 1] * yy
-                    out[1, 0] += a1j[1, 0] * xx + a1j[1, 1] * yx
-                    out[1, 1] += a1j[1, 0] * xy + a1j[1, 1] * yy
-                else:
-                    out[0, 0] = a1j[0, 0] * xx + a1j[0, 1] * yx
-                    out[0, 1] = a1j[0, 0] * xy + a1j[0, 1] * yy
-                    out[1, 0] = a1j[1, 0] * xx + a1j[1, 1] * yx
-                    out[1, 1] = a1j[1, 0] * xy + a1j[1, 1] * yy
+    have_ants = (a1_type != JONES_NOT_PRESENT and
+                 a2_type != JONES_NOT_PRESENT)
+    have_bl = bl_type != JONES_NOT_PRESENT
 
-        else:
-            raise ex
-    elif have_ants and not have_bl:
-        if jones_type == JONES_1_OR_2:
-            def jones_mul(a1j, a2j, out):
-                for c in range(out.shape[0]):
-                    if accumulate:
-                        out[c] += a1j[c] * np.conj(a2j[c])
-                    else:
-                        out[c] = a1j[c] * np.conj(a2j[c])
-
-        elif jones_type == JONES_2X2:
-            def jones_mul(a1j, a2j, out):
-                a2_xx_H = np.conj(a2j[0, 0])
-                a2_xy_H = np.conj(a2j[0, 1])
-                a2_yx_H = np.conj(a2j[1, 0])
-                a2_yy_H = np.conj(a2j[1, 1])
-
-                if accumulate:
-                    out[0, 0] += a1j[0, 0] * a2_xx_H + a1j[0, 1] * a2_yx_H
-                    out[0, 1] += a1j[0, 0] * a2_xy_H + a1j[0, 1] * a2_yy_H
-                    out[1, 0] += a1j[1, 0] * a2_xx_H + a1j[1, 1] * a2_yx_H
-                    out[1, 1] += a1j[1, 0] * a2_xy_H + a1j[1, 1] * a2_yy_H
-                else:
-                    out[0, 0] += a1j[0, 0] * a2_xx_H + a1j[0, 1] * a2_yx_H
-                    out[0, 1] += a1j[0, 0] * a2_xy_H + a1j[0, 1] * a2_yy_H
-                    out[1, 0] += a1j[1, 0] * a2_xx_H + a1j[1, 1] * a2_yx_H
-                    out[1, 1] += a1j[1, 0] * a2_xy_H + a1j[1, 1] * a2_yy_H
-        else:
-            raise ex
-    elif not have_ants and have_bl:
-        if jones_type == JONES_1_OR_2:
-            def jones_mul(blj, out):
-                for c in range(out.shape[0]):
-                    if accumulate:
-                        out[c] += blj[c]
-                    elif id(blj) == id(out):
-                        pass
-                    else:
-                        out[c] = blj[c]
-
-        elif jones_type == JONES_2X2:
-            def jones_mul(blj, out):
-                if accumulate:
-                    out[0, 0] += blj[0, 0]
-                    out[0, 1] += blj[0, 1]
-                    out[1, 0] += blj[1, 0]
-                    out[1, 1] += blj[1, 1]
-                elif id(blj) == id(out):
-                    pass
-                else:
-                    out[0, 0] = blj[0, 0]
-                    out[0, 1] = blj[0, 1]
-                    out[1, 0] = blj[1, 0]
-                    out[1, 1] = blj[1, 1]
-        else:
-            raise ex
-    else:
+    if not have_ants and not have_bl:
         # noop
         def jones_mul():
             pass
 
-    return njit(nogil=True)(jones_mul)
+        return njit(nogil=True)(jones_mul)
 
+    args = []
+    body = []
 
-def sum_coherencies_factory(have_ants, have_bl, jones_type):
-    """ Factory function generating a function that sums coherencies """
-    jones_mul = jones_mul_factory(have_ants, have_bl, jones_type, True)
+    if have_ants:
+        args.append("a1j")
+        stmts, a1 = _load_jones("a1", "a1j", a1_type)
+        body.extend(stmts)
+
+    if have_bl:
+        args.append("blj")
+        stmts, bl = _load_jones("bl", "blj", bl_type)
+        body.extend(stmts)
+
+    if have_ants:
+        args.append("a2j")
+        stmts, a2 = _load_jones("a2", "a2j", a2_type, conj=True)
+        body.extend(stmts)
+
+        if have_bl:
+            stmts, result = _matmul_jones("t", bl, a2)
+            body.extend(stmts)
+        else:
+            result = a2
+
+        stmts, result = _matmul_jones("r", a1, result)
+        body.extend(stmts)
+    else:
+        result = bl
+
+    # All products are computed before storing, so that
+    # the output may also be an input
+    body.extend(_store_jones(result, out_type, accumulate))
+
+    # Name the function after its specialisation. Functions loaded
+    # from numba's cache are linked by name, so differing functions
+    # accepting the same argument types must not share one
+    name = "jones_mul_%d%d%d_%d%s" % (a1_type, bl_type, a2_type, out_type,
+                                      "_acc" if accumulate else "")
+
+    source = "\n".join(["def %s(%s):" % (name, ", ".join(args + ["out"]))] +
+                       ["    " + stmt for stmt in body])
+
+    return _jit_source(source, name)
+
+
+# Number of channels of antenna Jones terms staged at once
+_CHAN_BLOCK = 32
+
+
+@njit(nogil=True, cache=True)
+def _time_runs(time):
+    """
+    Returns the start and end rows of each run of rows
+    with the same time index.
+    """
+    starts = [0]
+    ends = [0]
+    starts.pop()
+    ends.pop()
+
+    r = 0
+    nrow = time.shape[0]
+
+    while r < nrow:
+        start = r
+
+        while r < nrow and time[r] == time[start]:
+            r += 1
+
+        starts.append(start)
+        ends.append(r)
+
+    return starts, ends
+
+
+def sum_coherencies_factory(a1_type, bl_type, a2_type, out_type):
+    """
+    Factory function generating a function that sums coherencies.
+
+    Rows are processed in runs with the same time index, so that the
+    visibilities of a run remain cache resident while they are summed
+    over sources. If a run contains at least as many rows as there
+    are antennas, the antenna Jones terms of the run's timestep are
+    staged in a small contiguous buffer, one block of channels at a
+    time, before the baselines of the run are iterated over.
+    """
+    have_ants = (a1_type != JONES_NOT_PRESENT and
+                 a2_type != JONES_NOT_PRESENT)
+    have_bl = bl_type != JONES_NOT_PRESENT
+
+    jones_mul = jones_mul_factory(a1_type, bl_type, a2_type, out_type, True)
+
+    if have_ants:
+        if have_bl:
+            def bl_mul(a1j, blj, s, r, f, a2j, out):
+                jones_mul(a1j, blj[s, r, f], a2j, out)
+        else:
+            def bl_mul(a1j, blj, s, r, f, a2j, out):
+                jones_mul(a1j, a2j, out)
+
+        bl_mul = njit(nogil=True)(bl_mul)
 
-    if have_ants and have_bl:
-        def sum_coh_fn(time, ant1, ant2, a1j, blj, a2j, tmin, out):
-            for s in range(a1j.shape[0]):
-                for r, (ti, a1, a2) in enumerate(zip(time, ant1, ant2)):
-                    ti -= tmin
-                    for f in range(a1j.shape[3]):
-                        jones_mul(a1j[s, ti, a1, f],
-                                  blj[s, r, f],
-                                  a2j[s, ti, a2, f],
-                                  out[r, f])
-
-    elif have_ants and not have_bl:
         def sum_coh_fn(time, ant1, ant2, a1j, blj, a2j, tmin, out):
-            for s in range(a1j.shape[0]):
-                for r, (ti, a1, a2) in enumerate(zip(time, ant1, ant2)):
-                    ti -= tmin
-                    for f in range(a1j.shape[3]):
-                        jones_mul(a1j[s, ti, a1, f],
-                                  a2j[s, ti, a2, f],
-                                  out[r, f])
+            nsrc, _, nant, nchan = a1j.shape[:4]
+            starts, ends = _time_runs(time)
+
+            # Staging buffers for a block of channels
+            nfb = min(nchan, _CHAN_BLOCK)
+            a1_buf = np.empty_like(a1j[0, 0, :, :nfb])
+            a2_buf = np.empty_like(a2j[0, 0, :, :nfb])
+
+            for run in range(len(starts)):
+                start = starts[run]
+                end = ends[run]
+                ti = time[start] - tmin
+
+                if end - start < nant:
+                    # Too few baselines to justify staging
+                    for s in range(nsrc):
+                        for r in range(start, end):
+                            a1 = ant1[r]
+                            a2 = ant2[r]
+
+                            for f in range(nchan):
+                                bl_mul(a1j[s, ti, a1, f], blj, s, r, f,
+                                       a2j[s, ti, a2, f],
+                                       out[r, f])
+
+                    continue
+
+                for s in range(nsrc):
+                    for fs in range(0, nchan, nfb):
+                        fe = min(fs + nfb, nchan)
+
+                        # Stage this timestep's antenna jones
+                        a1_buf[:, :fe - fs] = a1j[s, ti, :, fs:fe]
+                        a2_buf[:, :fe - fs] = a2j[s, ti, :, fs:fe]
+
+                        for r in range(start, end):
+                            a1 = ant1[r]
+                            a2 = ant2[r]
+
+                            for f in range(fs, fe):
+                                bl_mul(a1_buf[a1, f - fs], blj, s, r, f,
+                                       a2_buf[a2, f - fs],
+                                       out[r, f])
 
     elif not have_ants and have_bl:
         def sum_coh_fn(time, ant1, ant2, a1j, blj, a2j, tmin, out):
             for s in range(blj.shape[0]):
                 for r in range(blj.shape[1]):
                     for f in range(blj.shape[2]):
-                        out[r, f] += blj[s, r, f]
+                        jones_mul(blj[s, r, f], out[r, f])
     else:
         # noop
         def sum_coh_fn(time, ant1, ant2, a1j, blj, a2j, tmin, out):
@@ -232,40 +353,78 @@ def sum_coherencies_factory(have_ants, have_bl, jones_type):
     return njit(nogil=True)(sum_coh_fn)
 
 
-def output_factory(have_ants, have_bl, have_dies, out_dtype):
+@numba.jit(nopython=True, nogil=True, cache=True)
+def _scalar_corrs(dde1, coh, dde2, die1, bvis, die2):
+    """
+    Number of scalar or diagonal output correlations, given the number
+    of correlations in each term, or zero if the term is absent
+    """
+    return max(max(max(dde1, coh), max(dde2, die1)), max(bvis, die2))
+
+
+def output_corr_shape(corr_shapes):
+    """
+    Returns the output correlation shape of :func:`predict_vis`,
+    given the correlation shapes of ``dde1_jones``, ``source_coh``,
+    ``dde2_jones``, ``die1_jones``, ``base_vis`` and ``die2_jones``,
+    which are empty if the term is absent.
+    """
+    if any(len(c) == 2 for c in corr_shapes):
+        return (2, 2)
+
+    return (_scalar_corrs(*(c[0] if len(c) > 0 else 0
+                            for c in corr_shapes)),)
+
+
+def output_factory(have_ants, have_bl, have_dies, out_type, out_dtype):
     """ Factory function generating a function that creates function output """
     if have_ants:
-        def output(time_index, dde1_jones, source_coh, dde2_jones,
-                   die1_jones, die2_jones):
-            row = time_index.shape[0]
-            chan = dde1_jones.shape[3]
-            corrs = dde1_jones.shape[4:]
-            return np.zeros((row, chan) + corrs, dtype=out_dtype)
+        chan = "dde1_jones.shape[3]"
     elif have_bl:
-        def output(time_index, dde1_jones, source_coh, dde2_jones,
-                   die1_jones, die2_jones):
-            row = time_index.shape[0]
-            chan = source_coh.shape[2]
-            corrs = source_coh.shape[3:]
-            return np.zeros((row, chan) + corrs, dtype=out_dtype)
+        chan = "source_coh.shape[2]"
     elif have_dies:
-        def output(time_index, dde1_jones, source_coh, dde2_jones,
-                   die1_jones, die2_jones):
-            row = time_index.shape[0]
-            chan = die1_jones.shape[2]
-            corrs = die1_jones.shape[3:]
-            return np.zeros((row, chan) + corrs, dtype=out_dtype)
+        chan = "die1_jones.shape[2]"
     else:
         raise ValueError("Insufficient inputs were supplied "
                          "for determining the output shape")
 
-    return njit(nogil=True)(output)
-
-
-def add_coh_factory(have_coh):
-    if have_coh:
+    if out_type == JONES_2X2:
+        corrs = "2, 2"
+    else:
+        # The largest number of scalar or diagonal correlations
+        corrs = ("_scalar_corrs(_corr_count(dde1_jones), "
+                 "_corr_count(source_coh), _corr_count(dde2_jones), "
+                 "_corr_count(die1_jones), _corr_count(base_vis), "
+                 "_corr_count(die2_jones))")
+
+    source = "\n".join([
+        "def output(time_index, dde1_jones, source_coh, dde2_jones,",
+        "           die1_jones, base_vis, die2_jones):",
+        "    row = time_index.shape[0]",
+        "    chan = %s" % chan,
+        "    corrs = %s" % corrs,
+        "    return np.zeros((row, chan, corrs), dtype=out_dtype)"
+        if out_type != JONES_2X2 else
+        "    return np.zeros((row, chan, 2, 2), dtype=out_dtype)"])
+
+    namespace = {'np': np, 'out_dtype': out_dtype,
+                 '_corr_count': _corr_count, '_scalar_corrs': _scalar_corrs}
+    exec(compile(source, "<generated output>", "exec"), namespace)
+    return njit(nogil=True)(namespace["output"])
+
+
+def add_coh_factory(coh_type, out_type):
+    if coh_type == out_type:
         def add_coh(base_vis, out):
             out += base_vis
+    elif coh_type != JONES_NOT_PRESENT:
+        jones_mul = jones_mul_factory(JONES_NOT_PRESENT, coh_type,
+                                      JONES_NOT_PRESENT, out_type, True)
+
+        def add_coh(base_vis, out):
+            for r in range(base_vis.shape[0]):
+                for f in range(base_vis.shape[1]):
+                    jones_mul(base_vis[r, f], out[r, f])
     else:
         # noop
         def add_coh(base_vis, out):
@@ -274,16 +433,19 @@ def add_coh_factory(have_coh):
     return njit(nogil=True)(add_coh)
 
 
-def apply_dies_factory(have_dies, have_coh, jones_type):
+def apply_dies_factory(g1_type, g2_type, out_type):
     """
     Factory function returning a function that applies
     Direction Independent Effects
     """
+    have_dies = (g1_type != JONES_NOT_PRESENT and
+                 g2_type != JONES_NOT_PRESENT)
 
     # We always "have visibilities", (the output array)
-    jones_mul = jones_mul_factory(have_dies, True, jones_type, False)
+    jones_mul = jones_mul_factory(g1_type, out_type, g2_type,
+                                  out_type, False)
 
-    if have_dies and have_coh:
+    if have_dies:
         def apply_dies(time, ant1, ant2,
                        die1_jones, die2_jones,
                        tmin, out):
@@ -295,20 +457,6 @@ def apply_dies_factory(have_dies, have_coh, jones_type):
                 for c in range(out.shape[1]):
                     jones_mul(die1_jones[ti, a1, c], out[r, c],
                               die2_jones[ti, a2, c], out[r, c])
-
-    elif have_dies and not have_coh:
-        def apply_dies(time, ant1, ant2,
-                       die1_jones, die2_jones,
-                       tmin, out):
-            # Iterate over rows
-            for r, (ti, a1, a2) in enumerate(zip(time, ant1, ant2)):
-                ti -= tmin
-
-                # Iterate over channels
-                for c in range(out.shape[1]):
-                    jones_mul(die1_jones[ti, a1, c], out[r, c],
-                              die2_jones[ti, a2, c],
-                              out[r, c])
     else:
         # noop
         def apply_dies(time, ant1, ant2,
@@ -319,6 +467,14 @@ def apply_dies_factory(have_dies, have_coh, jones_type):
     return njit(nogil=True)(apply_dies)
 
 
+def _corr_count(jones):
+    """ Number of scalar or diagonal correlations in ``jones`` """
+    if is_numba_type_none(jones):
+        return lambda jones: 0
+
+    return lambda jones: jones.shape[-1]
+
+
 def predict_vis(time_index, antenna1, antenna2,
                 dde1_jones=None, source_coh=None, dde2_jones=None,
                 die1_jones=None, base_vis=None, die2_jones=None):
@@ -368,34 +524,35 @@ def predict_vis(time_index, antenna1, antenna2,
     if have_g1 and die1_jones.ndim not in (4, 5):
         raise ValueError("die1_jones.ndim %d not in (4, 5)" % die1_jones.ndim)
 
-    # if have_coh and have_coh.ndim not in (3, 4):
-    #     raise ValueError("have_coh.ndim %d not in (3, 4)" % have_coh.ndim)
+    if have_coh and base_vis.ndim not in (3, 4):
+        raise ValueError("base_vis.ndim %d not in (3, 4)" % base_vis.ndim)
 
     if have_g2 and die2_jones.ndim not in (4, 5):
         raise ValueError("die2_jones.ndim %d not in (4, 5)" % die2_jones.ndim)
 
-    jones_types = [
-        _get_jones_types("dde1_jones", dde1_jones, 5, 6),
-        _get_jones_types("source_coh", source_coh, 4, 5),
-        _get_jones_types("dde2_jones", dde2_jones, 5, 6),
-        _get_jones_types("die1_jones", die1_jones, 4, 5),
-        _get_jones_types("die2_jones", die2_jones, 4, 5)]
+    a1_type = _get_jones_types("dde1_jones", dde1_jones, 5, 6)
+    bl_type = _get_jones_types("source_coh", source_coh, 4, 5)
+    a2_type = _get_jones_types("dde2_jones", dde2_jones, 5, 6)
+    g1_type = _get_jones_types("die1_jones", die1_jones, 4, 5)
+    coh_type = _get_jones_types("base_vis", base_vis, 3, 4)
+    g2_type = _get_jones_types("die2_jones", die2_jones, 4, 5)
 
+    jones_types = [a1_type, bl_type, a2_type, g1_type, coh_type, g2_type]
     ptypes = [t for t in jones_types if t != JONES_NOT_PRESENT]
 
-    if not all(ptypes[0] == p for p in ptypes[1:]):
-        raise ValueError("Jones Matrix Correlations were mismatched")
-
-    try:
-        jones_type = ptypes[0]
-    except IndexError:
+    if len(ptypes) == 0:
         raise ValueError("No Jones Matrices were supplied")
 
+    # Scalar, diagonal and full Jones terms may be mixed.
+    # The output is full if any of the terms are full
+    out_type = max(ptypes)
+
     # Create functions that we will use inside our predict function
-    out_fn = output_factory(have_ants, have_bl, have_dies, out_dtype)
-    sum_coh_fn = sum_coherencies_factory(have_ants, have_bl, jones_type)
-    apply_dies_fn = apply_dies_factory(have_dies, have_coh, jones_type)
-    add_coh_fn = add_coh_factory(have_coh)
+    out_fn = output_factory(have_ants, have_bl, have_dies,
+                            out_type, out_dtype)
+    sum_coh_fn = sum_coherencies_factory(a1_type, bl_type, a2_type, out_type)
+    apply_dies_fn = apply_dies_factory(g1_type, g2_type, out_type)
+    add_coh_fn = add_coh_factory(coh_type, out_type)
 
     @wraps(predict_vis)
     def _predict_vis_fn(time_index, antenna1, antenna2,
@@ -404,7 +561,7 @@ def predict_vis(time_index, antenna1, antenna2,
 
         # Get the output shape
         out = out_fn(time_index, dde1_jones, source_coh, dde2_jones,
-                     die1_jones, die2_jones)
+                     die1_jones, base_vis, die2_jones)
 
         # Minimum time index, used to normalise within function
         tmin = time_index.min()
@@ -430,6 +587,8 @@ def predict_vis(time_index, antenna1, antenna2,
 # inspect.getargspec doesn't work on a numba dispatcher object
 # so rtd fails.
 if not on_rtd():
+    _corr_count = generated_jit(nopython=True, nogil=True, cache=True)(
+                                _corr_count)
     predict_vis = generated_jit(nopython=True, nogil=True, cache=True)(
                                 predict_vis)
 
@@ -470,6 +629,12 @@ Notes
   at a particular timestep via the
   ``time_index``, ``antenna1`` and ``antenna2`` inputs.
 * The ``row`` dimension must be an increasing partial order in time.
+* Each Jones term may be scalar :code:`(1,)`, diagonal :code:`(2,)`
+  or full :code:`(2, 2)`, and these may be mixed.
+  Multiplications with the zero off-diagonal elements of
+  scalar and diagonal terms are elided.
+  The output is full if any term is full. Otherwise it is
+  diagonal if any term is diagonal, else scalar.
 $(extra_notes)
 
 
@@ -507,7 +672,7 @@ die2_jones : $(array_type), optional
     :math:`G_{ps}` Direction-Independent Jones terms for the
     second antenna of the baseline.
     with shape :code:`(time,ant,chan,corr_1,corr_2)`
-
+$(extra_params)
 Returns
 -------
 $(array_type)
@@ -518,6 +683,7 @@ $(array_type)
 try:
     predict_vis.__doc__ = PREDICT_DOCS.substitute(
                             array_type=":class:`numpy.ndarray`",
-                            extra_notes="")
+                            extra_notes="",
+                            extra_params="")
 except AttributeError:
     pass
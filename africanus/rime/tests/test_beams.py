@@ -36,6 +36,34 @@ def test_transform_sources():
 
     assert coords.shape == (3, src, time, ants, chans)
 
+    # Reference rotation, pointing error and scaling
+    pa_sin = np.sin(parangles)[None, :, :]
+    pa_cos = np.cos(parangles)[None, :, :]
+    l = lm[:, 0, None, None]
+    m = lm[:, 1, None, None]
+    l_ref = l*pa_cos - m*pa_sin + point_errors[None, :, :, 0]
+    m_ref = l*pa_sin + m*pa_cos + point_errors[None, :, :, 1]
+
+    assert np.allclose(coords[0], l_ref[..., None]*antenna_scaling)
+    assert np.allclose(coords[1], m_ref[..., None]*antenna_scaling)
+    assert np.all(coords[2] == frequency)
+
+    # Without the frequency plane
+    lm_coords = transform_sources(lm, parangles, point_errors,
+                                  antenna_scaling, frequency,
+                                  frequency_plane=False)
+
+    assert lm_coords.shape == (2, src, time, ants, chans)
+    assert np.all(lm_coords == coords[:2])
+
+    # Single precision
+    f32_coords = transform_sources(lm, parangles, point_errors,
+                                   antenna_scaling, frequency,
+                                   dtype=np.float32)
+
+    assert f32_coords.dtype == np.float32
+    assert np.allclose(f32_coords, coords, rtol=1e-5)
+
 
 def test_dask_transform_sources():
     da = pytest.importorskip("dask.array")
@@ -107,7 +135,85 @@ def test_beam_cube():
     assert ddes.shape == (src, time, ants, chans, 2, 2)
 
 
-def test_dask_beam_cube():
+@pytest.mark.parametrize("spline_order", [1, 3])
+@pytest.mark.parametrize("mode", ["nearest", "mirror"])
+def test_beam_cube_spline_order(spline_order, mode):
+    interpolation = pytest.importorskip("scipy.ndimage.interpolation")
+
+    from africanus.rime import beam_cube_dde, BeamCube
+
+    beam_lw = 10
+    beam_mh = 12
+    beam_nud = 8
+
+    beam = rc((beam_lw, beam_mh, beam_nud, 2))
+    l_grid = np.linspace(-1, 1, beam_lw)
+    m_grid = np.linspace(1, -1, beam_mh)
+    freq_grid = np.linspace(.856e9, .856e9*2, beam_nud)
+
+    # Coordinates within and around the edges of the beam cube
+    coords = np.empty((3, 20, 4))
+    coords[:2] = rf((2, 20, 4))*2.4 - 1.2
+    coords[2] = .856e9 + rf((20, 4))*.856e9
+    coords_copy = coords.copy()
+
+    cube = BeamCube(beam, l_grid, m_grid, freq_grid,
+                    spline_order=spline_order, mode=mode)
+    grid_coords = cube.grid_coordinates(coords.reshape(3, -1))
+
+    # Reference prefiltered sampling
+    re = interpolation.map_coordinates(beam[..., 0].real, grid_coords,
+                                       order=spline_order, mode=mode)
+    im = interpolation.map_coordinates(beam[..., 0].imag, grid_coords,
+                                       order=spline_order, mode=mode)
+    expected = (re + 1j*im) / np.abs(re + 1j*im)
+
+    ddes = cube.sample(coords)
+    assert ddes.shape == (20, 4, 2)
+    assert np.allclose(ddes[..., 0].ravel(), expected)
+
+    ddes = beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
+                         spline_order=spline_order, mode=mode)
+    assert np.allclose(ddes[..., 0].ravel(), expected)
+
+    # Input coordinates should not be modified
+    assert np.all(coords == coords_copy)
+
+
+def test_cached_beam_cube():
+    from africanus.rime import cached_beam_cube
+
+    beam = rc((10, 10, 10, 2, 2))
+    l_grid = np.linspace(-1, 1, 10)
+    m_grid = np.linspace(-1, 1, 10)
+    freq_grid = np.linspace(.856e9, .856e9*2, 10)
+
+    cube = cached_beam_cube(beam, l_grid, m_grid, freq_grid, spline_order=3)
+
+    assert cube is cached_beam_cube(beam.copy(), l_grid, m_grid,
+                                    freq_grid, spline_order=3)
+    assert cube is not cached_beam_cube(beam, l_grid, m_grid,
+                                        freq_grid, spline_order=1)
+    assert cube is not cached_beam_cube(beam*2, l_grid, m_grid,
+                                        freq_grid, spline_order=3)
+
+    # Tokens identify beams without hashing them
+    tcube = cached_beam_cube(beam, l_grid, m_grid, freq_grid, token="beam")
+    assert tcube is cached_beam_cube(beam*2, l_grid, m_grid,
+                                     freq_grid, token="beam")
+
+    # The least recently used beam cubes are evicted
+    from africanus.rime.beam_cubes import _BEAM_CUBE_CACHE_SIZE
+
+    for i in range(_BEAM_CUBE_CACHE_SIZE):
+        cached_beam_cube(beam, l_grid, m_grid, freq_grid, token=str(i))
+
+    assert tcube is not cached_beam_cube(beam, l_grid, m_grid,
+                                         freq_grid, token="beam")
+
+
+@pytest.mark.parametrize("spline_order", [1, 3])
+def test_dask_beam_cube(spline_order):
     da = pytest.importorskip('dask.array')
 
     beam_lw = 10
@@ -143,7 +249,8 @@ def test_dask_beam_cube():
     # compute numpy coordinates and ddes
     np_coords = np_transform_sources(lm, parangles, point_errors,
                                      antenna_scaling, freqs)
-    np_ddes = np_cube_dde(beam, np_coords, l_grid, m_grid, freq_grid)
+    np_ddes = np_cube_dde(beam, np_coords, l_grid, m_grid, freq_grid,
+                          spline_order=spline_order)
 
     from africanus.rime.dask import transform_sources
     from africanus.rime.dask import beam_cube_dde
@@ -168,7 +275,137 @@ def test_dask_beam_cube():
                                     dask_antenna_scaling, dask_freqs)
 
     ddes = beam_cube_dde(dask_beam, dask_coords,
-                         dask_l_grid, dask_m_grid, dask_freq_grid)
+                         dask_l_grid, dask_m_grid, dask_freq_grid,
+                         spline_order=spline_order)
 
     # Should agree exactly
     assert np.all(ddes.compute() == np_ddes)
+
+
+@pytest.mark.parametrize("spline_order", [1, 3])
+@pytest.mark.parametrize("l_sign", [1, -1])
+def test_transformed_beam_cube(spline_order, l_sign):
+    pytest.importorskip("scipy")
+
+    from africanus.rime import (transform_sources, beam_cube_dde,
+                                transformed_beam_cube_dde)
+
+    beam_lw = 10
+    beam_mh = 12
+    beam_nud = 8
+
+    src = 10
+    time = 5
+    ants = 4
+    chans = 8
+
+    lm = np.random.random(size=(src, 2))*.4 - .2
+    parangles = np.random.random(size=(time, ants))
+    point_errors = np.random.random(size=(time, ants, 2))*.01
+    antenna_scaling = np.random.random(size=(ants, chans)) + .5
+    # Frequencies extending beyond the beam cube
+    freqs = np.linspace(.856e9*.8, .856e9*2.2, chans)
+
+    beam = rc((beam_lw, beam_mh, beam_nud, 2, 2))
+    l_grid = np.linspace(-1, 1, beam_lw)*l_sign
+    m_grid = np.linspace(-1, 1, beam_mh)
+    freq_grid = np.linspace(.856e9, .856e9*2, beam_nud)
+
+    coords = transform_sources(lm, parangles, point_errors,
+                               antenna_scaling, freqs)
+    expected = beam_cube_dde(beam, coords, l_grid, m_grid, freq_grid,
+                             spline_order=spline_order)
+
+    ddes = transformed_beam_cube_dde(beam, lm, parangles, point_errors,
+                                     antenna_scaling, freqs,
+                                     l_grid, m_grid, freq_grid,
+                                     spline_order=spline_order)
+
+    assert ddes.shape == (src, time, ants, chans, 2, 2)
+    assert np.allclose(ddes, expected)
+
+
+def test_dask_transformed_beam_cube():
+    da = pytest.importorskip('dask.array')
+
+    from africanus.rime import transformed_beam_cube_dde as np_xform_dde
+    from africanus.rime.dask import transformed_beam_cube_dde
+
+    src_chunks = (4, 6)
+    time_chunks = (2, 3)
+    ant_chunks = (2, 2)
+    chan_chunks = (5, 3)
+
+    src = sum(src_chunks)
+    time = sum(time_chunks)
+    ants = sum(ant_chunks)
+    chans = sum(chan_chunks)
+
+    lm = np.random.random(size=(src, 2))
+    parangles = np.random.random(size=(time, ants))
+    point_errors = np.random.random(size=(time, ants, 2))
+    antenna_scaling = np.random.random(size=(ants, chans))
+    freqs = np.linspace(.856e9, .856e9*2, chans)
+
+    beam = rc((10, 10, 10, 2, 2))
+    l_grid = np.linspace(-1, 1, 10)
+    m_grid = np.linspace(-1, 1, 10)
+    freq_grid = np.linspace(.856e9, .856e9*2, 10)
+
+    np_ddes = np_xform_dde(beam, lm, parangles, point_errors,
+                           antenna_scaling, freqs,
+                           l_grid, m_grid, freq_grid)
+
+    ddes = transformed_beam_cube_dde(
+        da.from_array(beam, chunks=beam.shape),
+        da.from_array(lm, chunks=(src_chunks, 2)),
+        da.from_array(parangles, chunks=(time_chunks, ant_chunks)),
+        da.from_array(point_errors, chunks=(time_chunks, ant_chunks, 2)),
+        da.from_array(antenna_scaling, chunks=(ant_chunks, chan_chunks)),
+        da.from_array(freqs, chunks=chan_chunks),
+        da.from_array(l_grid, chunks=l_grid.shape),
+        da.from_array(m_grid, chunks=m_grid.shape),
+        da.from_array(freq_grid, chunks=freq_grid.shape))
+
+    assert np.allclose(ddes.compute(), np_ddes)
+
+
+def test_dask_transformed_beam_cube_shared(monkeypatch):
+    da = pytest.importorskip('dask.array')
+
+    import africanus.rime.beam_cubes as bc
+    from africanus.rime.dask import transformed_beam_cube_dde
+
+    cubes = []
+
+    class CountingBeamCube(bc.BeamCube):
+        def __init__(self, *args, **kwargs):
+            super(CountingBeamCube, self).__init__(*args, **kwargs)
+            cubes.append(self)
+
+    monkeypatch.setattr(bc, "BeamCube", CountingBeamCube)
+
+    src, time, ants, chans = 10, 5, 4, 8
+
+    beam = rc((10, 10, 10, 2, 2))
+    l_grid = np.linspace(-1, 1, 10)
+    m_grid = np.linspace(-1, 1, 10)
+    freq_grid = np.linspace(.856e9, .856e9*2, 10)
+
+    ddes = transformed_beam_cube_dde(
+        da.from_array(beam, chunks=beam.shape),
+        da.from_array(np.random.random(size=(src, 2)), chunks=(5, 2)),
+        da.random.random((time, ants), chunks=(2, 2)),
+        da.random.random((time, ants, 2), chunks=(2, 2, 2)),
+        da.random.random((ants, chans), chunks=(2, 4)),
+        da.from_array(np.linspace(.856e9, .856e9*2, chans), chunks=4),
+        da.from_array(l_grid, chunks=l_grid.shape),
+        da.from_array(m_grid, chunks=m_grid.shape),
+        da.from_array(freq_grid, chunks=freq_grid.shape),
+        spline_order=3)
+
+    assert ddes.npartitions > 1
+    ddes.compute(scheduler='sync')
+
+    # All blocks sample a single prefiltered beam cube
+    assert len(cubes) == 1
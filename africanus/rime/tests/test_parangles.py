@@ -68,6 +68,7 @@ def _observation_endpoints(year, month, day, hour_duration):
 
 @pytest.mark.parametrize('backend', [
     'test',
+    'numpy',
     pytest.param('casa', marks=pytest.mark.skipif(
                     no_casa,
                     reason='python-casascore not installed')),
@@ -128,6 +129,7 @@ def test_compare_astropy_and_casa(obs_and_tol, wsrt_ants):
 
 @pytest.mark.parametrize('backend', [
     'test',
+    'numpy',
     pytest.param('casa', marks=pytest.mark.skipif(
                                 no_casa,
                                 reason='python-casascore not installed')),
@@ -155,3 +157,107 @@ def test_dask_parallactic_angles(observation, wsrt_ants, backend):
     da_pa = da_parangle(da_times, da_ants, da_fc, backend=backend)
 
     assert np.all(np_pa == da_pa.compute())
+
+
+@pytest.mark.skipif(no_astropy, reason="astropy not installed")
+@pytest.mark.parametrize('obs_and_tol', [
+    ((2018, 1, 1, 4), "1m"),
+    ((2018, 2, 20, 8), "1m"),
+    ((2018, 11, 2, 4), "1m")])
+def test_compare_numpy_and_astropy(obs_and_tol, wsrt_ants):
+    """
+    Compare the analytic numpy and astropy
+    parallactic angle implementations.
+    """
+    from africanus.rime.parangles_numpy import numpy_parallactic_angles
+    from africanus.rime.parangles_astropy import astropy_parallactic_angles
+    from astropy import units
+    from astropy.coordinates import Angle
+
+    obs, rtol = obs_and_tol
+    start, end = _observation_endpoints(*obs)
+
+    time = np.linspace(start, end, 5)
+    ant = wsrt_ants[:4, :]
+    fc = np.array([0., 1.04719755], dtype=np.float64)
+
+    astro_pa = astropy_parallactic_angles(time, ant, fc)
+    numpy_pa = numpy_parallactic_angles(time, ant, fc)
+
+    astro_pa = Angle(astro_pa, unit=units.deg).wrap_at(180*units.deg)
+    numpy_pa = Angle(numpy_pa*units.rad, unit=units.deg)
+    numpy_pa = numpy_pa.wrap_at(180*units.deg)
+
+    diff = np.abs((astro_pa - numpy_pa).wrap_at(180*units.deg))
+    assert np.all(np.abs(diff) < Angle(rtol))
+
+
+@pytest.mark.parametrize('max_error', [1e-3, 1e-6])
+def test_interpolated_parallactic_angles(wsrt_ants, max_error):
+    from africanus.rime import parallactic_angles
+
+    start, end = _observation_endpoints(2018, 1, 1, 12)
+    time = np.linspace(start, end, 4000)
+    ant = wsrt_ants[:4, :]
+    fc = np.array([1.0, 0.3], dtype=np.float64)
+
+    pa = parallactic_angles(time, ant, fc, backend='numpy')
+    interp_pa = parallactic_angles(time, ant, fc, backend='numpy',
+                                   max_error=max_error)
+
+    assert interp_pa.shape == pa.shape
+    diff = np.angle(np.exp(1j*(pa - interp_pa)))
+    assert np.all(np.abs(diff) < max_error)
+
+
+# Arcseconds to radians
+_ARCSEC = np.pi / (180.0 * 3600.0)
+
+
+@pytest.mark.parametrize('years', [-10.0, 0.0, 18.0])
+@pytest.mark.parametrize('ra', [1.0, 4.0])
+@pytest.mark.parametrize('dec', [-80.0, -60.0, 0.0, 20.0])
+def test_numpy_parallactic_angles_closed_form(years, ra, dec):
+    """
+    Compare the numpy backend against the closed form parallactic
+    angle of the hour angle, declination and latitude, using
+    first order precession of the field centre from J2000.
+    """
+    from africanus.rime.parangles_numpy import numpy_parallactic_angles
+
+    # Antenna at a WGS84 geodetic latitude and longitude
+    lat, lon = np.deg2rad(-30.7), np.deg2rad(21.4)
+    a, f = 6378137.0, 1.0 / 298.257223563
+    e2 = f*(2.0 - f)
+    n = a / np.sqrt(1.0 - e2*np.sin(lat)**2)
+    ant = np.array([[n*np.cos(lat)*np.cos(lon),
+                     n*np.cos(lat)*np.sin(lon),
+                     n*(1.0 - e2)*np.sin(lat)]])
+
+    # A day of observation, years after J2000
+    jd = 2451545.0 + years*365.25 + np.linspace(0.0, 1.0, 100)
+    time = (jd - 2400000.5)*86400.0
+    fc = np.array([ra, np.deg2rad(dec)])
+
+    pa = numpy_parallactic_angles(time, ant, fc)[:, 0]
+
+    # First order precession of the J2000 field centre to the date
+    m = 3.07496*15.0*_ARCSEC*years
+    p = 20.0431*_ARCSEC*years
+    ra_date = fc[0] + m + p*np.sin(fc[0])*np.tan(fc[1])
+    dec_date = fc[1] + p*np.cos(fc[0])
+
+    # Hour angle from the Greenwich mean sidereal time
+    gmst = np.deg2rad((280.46061837 +
+                       360.98564736629*(jd - 2451545.0)) % 360.0)
+    ha = gmst + lon - ra_date
+
+    expected = np.arctan2(np.sin(ha)*np.cos(lat),
+                          np.sin(lat)*np.cos(dec_date) -
+                          np.cos(lat)*np.sin(dec_date)*np.cos(ha))
+
+    # Angles are relative to J2000 north, which precession rotates
+    expected -= p*np.sin(fc[0]) / np.cos(fc[1])
+
+    diff = np.angle(np.exp(1j*(pa - expected)))
+    assert np.all(np.abs(diff) < 30*_ARCSEC)
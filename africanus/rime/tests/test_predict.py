@@ -91,6 +91,114 @@ def test_predict_vis(corr_shape, idm, einsum_sig1, einsum_sig2,
     assert np.allclose(v, model_vis)
 
 
+_JONES_CORRS = {"scalar": (1,), "diag": (2,), "full": (2, 2)}
+_OTHER_KIND = {"scalar": "diag", "diag": "scalar", "full": "diag"}
+
+
+def _dense_jones(jones, jones_kind):
+    """ Expands scalar and diagonal jones terms to 2x2 matrices """
+    if jones_kind == "full":
+        return jones
+
+    dense = np.zeros(jones.shape[:-1] + (2, 2), dtype=jones.dtype)
+    dense[..., 0, 0] = jones[..., 0]
+    dense[..., 1, 1] = jones[..., -1]
+    return dense
+
+
+@pytest.mark.parametrize('dde_kind', ["scalar", "diag", "full"])
+@pytest.mark.parametrize('coh_kind', ["scalar", "diag", "full"])
+@pytest.mark.parametrize('die_kind,bvis_kind', [
+    ("scalar", "scalar"),
+    ("scalar", "full"),
+    ("diag", "scalar"),
+    ("full", "diag")])
+@pytest.mark.parametrize('asymmetric', [(), ("dde",), ("die",)])
+def test_mixed_jones_predict_vis(dde_kind, coh_kind, die_kind,
+                                 bvis_kind, asymmetric):
+    from africanus.rime.predict import predict_vis
+
+    s, t, a, c, r = 2, 4, 4, 5, 10
+
+    # Pair different kinds of antenna terms
+    dde2_kind = _OTHER_KIND[dde_kind] if "dde" in asymmetric else dde_kind
+    die2_kind = _OTHER_KIND[die_kind] if "die" in asymmetric else die_kind
+
+    a1_jones = rc((s, t, a, c) + _JONES_CORRS[dde_kind])
+    bl_jones = rc((s, r, c) + _JONES_CORRS[coh_kind])
+    a2_jones = rc((s, t, a, c) + _JONES_CORRS[dde2_kind])
+    g1_jones = rc((t, a, c) + _JONES_CORRS[die_kind])
+    base_vis = rc((r, c) + _JONES_CORRS[bvis_kind])
+    g2_jones = rc((t, a, c) + _JONES_CORRS[die2_kind])
+
+    time_idx = np.asarray([0, 0, 1, 1, 2, 2, 2, 2, 3, 3])
+    ant1 = np.asarray([0, 0, 0, 0, 1, 1, 1, 2, 2, 3])
+    ant2 = np.asarray([0, 1, 2, 3, 1, 2, 3, 2, 3, 3])
+
+    model_vis = predict_vis(time_idx, ant1, ant2,
+                            a1_jones, bl_jones, a2_jones,
+                            g1_jones, base_vis, g2_jones)
+
+    kinds = (dde_kind, coh_kind, dde2_kind, die_kind, bvis_kind, die2_kind)
+
+    if "full" in kinds:
+        out_kind = "full"
+    elif "diag" in kinds:
+        out_kind = "diag"
+    else:
+        out_kind = "scalar"
+
+    assert model_vis.shape == (r, c) + _JONES_CORRS[out_kind]
+
+    # Dense reference
+    a1_jones = _dense_jones(a1_jones, dde_kind)[:, time_idx, ant1]
+    bl_jones = _dense_jones(bl_jones, coh_kind)
+    a2_jones = _dense_jones(a2_jones, dde2_kind)[:, time_idx, ant2].conj()
+    g1_jones = _dense_jones(g1_jones, die_kind)[time_idx, ant1]
+    base_vis = _dense_jones(base_vis, bvis_kind)
+    g2_jones = _dense_jones(g2_jones, die2_kind)[time_idx, ant2].conj()
+
+    v = np.einsum("srcij,srcjk,srckl->rcil", a1_jones, bl_jones, a2_jones)
+    v += base_vis
+    v = np.einsum("rcij,rcjk,rckl->rcil", g1_jones, v, g2_jones)
+
+    assert np.allclose(v, _dense_jones(model_vis, out_kind))
+
+
+@pytest.mark.parametrize('blj', [True, False])
+def test_predict_vis_time_runs(blj):
+    """ Exercise staged and unstaged runs over several channel blocks """
+    from africanus.rime.predict import predict_vis
+
+    s, t, a, c = 3, 3, 4, 70
+    corr_shape = (2, 2)
+
+    # Two complete timesteps with autocorrelations, followed by
+    # a timestep with fewer baselines than antennas
+    ant1, ant2 = (x.astype(np.int32) for x in np.triu_indices(a, 0))
+    time_idx = np.repeat(np.arange(2, dtype=np.int32), ant1.size)
+    time_idx = np.concatenate([time_idx, [2, 2]])
+    ant1 = np.concatenate([ant1, ant1, [0, 1]])
+    ant2 = np.concatenate([ant2, ant2, [1, 3]])
+    r = time_idx.size
+
+    a1_jones = rc((s, t, a, c) + corr_shape)
+    bl_jones = rc((s, r, c) + corr_shape)
+    a2_jones = rc((s, t, a, c) + corr_shape)
+
+    model_vis = predict_vis(time_idx, ant1, ant2, a1_jones,
+                            bl_jones if blj else None, a2_jones)
+
+    if not blj:
+        bl_jones = np.broadcast_to(np.eye(2), bl_jones.shape)
+
+    v = np.einsum("srcij,srcjk,srckl->rcil",
+                  a1_jones[:, time_idx, ant1], bl_jones,
+                  a2_jones[:, time_idx, ant2].conj())
+
+    assert np.allclose(v, model_vis)
+
+
 @pytest.mark.parametrize('corr_shape, idm, einsum_sig1, einsum_sig2', [
     ((1,), (1,), "srci,srci,srci->rci", "rci,rci,rci->rci"),
     ((2,), (1, 1), "srci,srci,srci->rci", "rci,rci,rci->rci"),
@@ -181,3 +289,142 @@ def test_dask_predict_vis(corr_shape, idm, einsum_sig1, einsum_sig2,
             print(p, model_vis[p], np_model_vis[p])
 
     assert np.allclose(model_vis, np_model_vis)
+
+
+@pytest.mark.parametrize('dde_kind,coh_kind,die_kind,bvis_kind', [
+    ("diag", "full", "scalar", "diag"),
+    ("scalar", "diag", "full", "scalar"),
+    ("full", "scalar", "diag", "full"),
+    ("scalar", "scalar", "scalar", "scalar")])
+@pytest.mark.parametrize('asymmetric', [(), ("dde",), ("die",)])
+@pytest.mark.parametrize('ac', [(4,), (1, 2, 1)])
+def test_dask_mixed_jones_predict_vis(dde_kind, coh_kind,
+                                      die_kind, bvis_kind,
+                                      asymmetric, ac):
+    da = pytest.importorskip('dask.array')
+    from africanus.rime.predict import predict_vis as np_predict_vis
+    from africanus.rime.dask import predict_vis
+
+    sc, tc, rrc, cc = (2, 3, 4), (2, 1, 1), (4, 4, 2), (3, 2)
+    s, t, a, c, r = (sum(x) for x in (sc, tc, ac, cc, rrc))
+
+    dde2_kind = _OTHER_KIND[dde_kind] if "dde" in asymmetric else dde_kind
+    die2_kind = _OTHER_KIND[die_kind] if "die" in asymmetric else die_kind
+
+    a1_jones = rc((s, t, a, c) + _JONES_CORRS[dde_kind])
+    bl_jones = rc((s, r, c) + _JONES_CORRS[coh_kind])
+    a2_jones = rc((s, t, a, c) + _JONES_CORRS[dde2_kind])
+    g1_jones = rc((t, a, c) + _JONES_CORRS[die_kind])
+    base_vis = rc((r, c) + _JONES_CORRS[bvis_kind])
+    g2_jones = rc((t, a, c) + _JONES_CORRS[die2_kind])
+
+    time_idx = np.asarray([0, 0, 1, 1, 2, 2, 2, 2, 3, 3])
+    ant1 = np.asarray([0, 0, 0, 0, 1, 1, 1, 2, 2, 3])
+    ant2 = np.asarray([0, 1, 2, 3, 1, 2, 3, 2, 3, 3])
+
+    np_model_vis = np_predict_vis(time_idx, ant1, ant2,
+                                  a1_jones, bl_jones, a2_jones,
+                                  g1_jones, base_vis, g2_jones)
+
+    def _da(array, chunks):
+        return da.from_array(array, chunks=chunks + array.shape[len(chunks):])
+
+    model_vis = predict_vis(_da(time_idx, (rrc,)),
+                            _da(ant1, (rrc,)),
+                            _da(ant2, (rrc,)),
+                            _da(a1_jones, (sc, tc, ac, cc)),
+                            _da(bl_jones, (sc, rrc, cc)),
+                            _da(a2_jones, (sc, tc, ac, cc)),
+                            _da(g1_jones, (tc, ac, cc)),
+                            _da(base_vis, (rrc, cc)),
+                            _da(g2_jones, (tc, ac, cc)))
+
+    # Declared chunks agree with the computed blocks
+    assert model_vis.shape == np_model_vis.shape
+    assert model_vis.chunks[2:] == tuple((c,) for c in np_model_vis.shape[2:])
+    assert np.allclose(model_vis.compute(), np_model_vis)
+
+
+def test_dask_predict_vis_row_antennas():
+    da = pytest.importorskip('dask.array')
+    from africanus.rime.predict import predict_vis as np_predict_vis
+    from africanus.rime.dask import predict_vis
+
+    sc, tc, ac, rrc, cc = (2, 3), (2, 1, 1), (1, 2, 1), (4, 4, 2), (3, 2)
+    s, t, a, c, r = (sum(x) for x in (sc, tc, ac, cc, rrc))
+
+    a1_jones = rc((s, t, a, c, 2, 2))
+    bl_jones = rc((s, r, c, 2, 2))
+    a2_jones = rc((s, t, a, c, 2, 2))
+    g1_jones = rc((t, a, c, 2))
+    g2_jones = rc((t, a, c, 2))
+
+    time_idx = np.asarray([0, 0, 1, 1, 2, 2, 2, 2, 3, 3])
+    ant1 = np.asarray([0, 0, 0, 0, 1, 1, 1, 2, 2, 3])
+    ant2 = np.asarray([0, 1, 2, 3, 1, 1, 2, 2, 2, 2])
+
+    np_model_vis = np_predict_vis(time_idx, ant1, ant2,
+                                  a1_jones, bl_jones, a2_jones,
+                                  g1_jones, None, g2_jones)
+
+    def _da(array, chunks):
+        return da.from_array(array, chunks=chunks + array.shape[len(chunks):])
+
+    bounds = np.cumsum((0,) + rrc)
+    row_antennas = [np.unique(np.concatenate([ant1[s:e], ant2[s:e]]))
+                    for s, e in zip(bounds[:-1], bounds[1:])]
+
+    def _predict(row_antennas):
+        return predict_vis(_da(time_idx, (rrc,)),
+                           _da(ant1, (rrc,)),
+                           _da(ant2, (rrc,)),
+                           _da(a1_jones, (sc, tc, ac, cc)),
+                           _da(bl_jones, (sc, rrc, cc)),
+                           _da(a2_jones, (sc, tc, ac, cc)),
+                           _da(g1_jones, (tc, ac, cc)),
+                           None,
+                           _da(g2_jones, (tc, ac, cc)),
+                           row_antennas=row_antennas)
+
+    model_vis = _predict(row_antennas)
+    assert np.allclose(model_vis.compute(), np_model_vis)
+
+    # Tasks only depend on the antenna blocks of their row chunk
+    expected_bounds = [((0, 1), (1, 3), (3, 4)), ((1, 3),), ((1, 3), (3, 4))]
+
+    for key, task in dict(model_vis.__dask_graph__()).items():
+        if key[0] == model_vis.name:
+            _, dde_bounds, die_bounds = task[:3]
+            assert dde_bounds == die_bounds == expected_bounds[key[1]]
+            assert len(task[6]) == len(expected_bounds[key[1]])
+
+    # Antennas missing from row_antennas, when
+    # gathering and when offsetting into a single block
+    for r, ants in ((0, [0, 1, 2]), (2, [2])):
+        missing = list(row_antennas)
+        missing[r] = np.array(ants)
+
+        with pytest.raises(ValueError, match="row_antennas"):
+            _predict(missing).compute()
+
+    with pytest.raises(ValueError, match="row chunks"):
+        _predict(row_antennas[:2])
+
+
+def test_predict_vis_warmup():
+    from africanus.rime import warmup, PredictSignature
+    from africanus.rime.predict import predict_vis
+
+    sig = PredictSignature(np.complex64, (2,), (2, 2), None, (1,))
+    assert warmup([sig]) == [sig]
+    assert sig.index_dtype == np.int32
+
+    time_idx = np.zeros(1, dtype=np.int32)
+    jones = [np.zeros(s, dtype=np.complex64) for s in
+             [(1, 1, 1, 1, 2), (1, 1, 1, 2, 2),
+              (1, 1, 1, 1, 2), (1, 1, 1)]]
+    arg_types = tuple(numba.typeof(a) for a in
+                      [time_idx]*3 + jones[:3] + [None] +
+                      jones[3:] + [None])
+
+    assert arg_types in predict_vis.overloads
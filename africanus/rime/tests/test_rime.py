@@ -67,6 +67,69 @@ def test_feed_rotation():
     assert np.allclose(fr, np_expr.reshape(10, 5, 2, 2))
 
 
+@pytest.mark.parametrize("feed_type", ["linear", "circular"])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_feed_rotation_compact_and_out(feed_type, dtype):
+    from africanus.rime import feed_rotation
+
+    parangles = np.random.random((10, 5)).astype(dtype)
+    fr = feed_rotation(parangles, feed_type=feed_type)
+    cdtype = np.complex64 if dtype == np.float32 else np.complex128
+    assert fr.dtype == cdtype
+
+    # Write into a supplied output buffer
+    out = np.empty((10, 5, 2, 2), dtype=cdtype)
+    result = feed_rotation(parangles, feed_type=feed_type, out=out)
+    assert result is out
+    assert np.all(out == fr)
+
+    with pytest.raises(ValueError):
+        feed_rotation(parangles, feed_type=feed_type,
+                      out=np.empty((10, 5, 4), dtype=cdtype))
+
+    # Compact representation
+    compact = feed_rotation(parangles, feed_type=feed_type, compact=True)
+    assert compact.shape == (10, 5, 2)
+
+    if feed_type == "linear":
+        assert compact.dtype == dtype
+        assert np.all(compact[..., 0] == fr[..., 0, 0].real)
+        assert np.all(compact[..., 1] == fr[..., 0, 1].real)
+    else:
+        assert compact.dtype == cdtype
+        assert np.all(compact[..., 0] == fr[..., 0, 0])
+        assert np.all(compact[..., 1] == fr[..., 1, 1])
+
+
+# Seconds within which africanus.rime must be imported
+_IMPORT_BUDGET = 0.5
+
+
+def test_lazy_import():
+    import json
+    import subprocess
+    import sys
+
+    script = "\n".join([
+        "import json, sys, time",
+        "start = time.time()",
+        "import africanus.rime",
+        "elapsed = time.time() - start",
+        "modules = [m for m in ('numba', 'scipy', 'astropy',",
+        "                       'dask', 'pyrap', 'pytest')",
+        "           if m in sys.modules]",
+        "africanus.rime.feed_rotation",
+        "print(json.dumps([elapsed, modules, 'numba' in sys.modules]))"])
+
+    output = subprocess.check_output([sys.executable, "-c", script])
+    elapsed, modules, numba_loaded = json.loads(output.decode())
+
+    assert modules == []
+    assert elapsed < _IMPORT_BUDGET
+    # Attribute access imports the submodule
+    assert numba_loaded
+
+
 def test_dask_phase_delay():
     da = pytest.importorskip('dask.array')
     from africanus.rime import phase_delay as np_phase_delay
@@ -102,3 +165,8 @@ def test_dask_feed_rotation():
 
     np_fr = np_feed_rotation(parangles, feed_type='circular')
     assert np.all(np_fr == feed_rotation(dask_parangles, feed_type='circular'))
+
+    np_fr = np_feed_rotation(parangles, feed_type='linear', compact=True)
+    da_fr = feed_rotation(dask_parangles, feed_type='linear', compact=True)
+    assert da_fr.dtype == np_fr.dtype
+    assert np.all(np_fr == da_fr)
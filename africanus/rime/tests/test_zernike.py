@@ -946,3 +946,80 @@ def eidos_data_yy():
           0. + 0.00000000e+00j,  0. + 0.00000000e+00j,
           0. + 0.00000000e+00j,  0. + 0.00000000e+00j,
           0. + 0.00000000e+00j]])
+
+
+def test_noll_to_nm():
+    from africanus.rime.zernike import noll_to_nm, zernike_tables
+
+    # Zero-based Noll indices
+    expected = [(0, 0), (1, 1), (1, -1), (2, 0), (2, -2), (2, 2),
+                (3, -1), (3, 1), (3, -3), (3, 3), (4, 0)]
+
+    assert [noll_to_nm(j) for j in range(len(expected))] == expected
+
+    # Radial polynomials R_2^0 = 2r^2 - 1 and R_4^0 = 6r^4 - 6r^2 + 1
+    inverse, azimuth, radial = zernike_tables(np.array([[10, 3], [3, 3]]))
+    assert np.all(inverse == [[1, 0], [0, 0]])
+    assert np.all(azimuth == [0, 0])
+    assert np.all(radial == [[-1, 0, 2, 0, 0], [1, 0, -6, 0, 6]])
+
+
+def _reference_zernike(j, rho, phi):
+    """ Direct evaluation of the Zernike polynomial with Noll index j """
+    from math import factorial
+    from africanus.rime.zernike import noll_to_nm
+
+    if rho > 1:
+        return 0.0
+
+    n, m = noll_to_nm(j)
+    am = abs(m)
+
+    radial = sum(float((-1)**k * factorial(n - k)) /
+                 (factorial(k) * factorial((n + am) // 2 - k) *
+                  factorial((n - am) // 2 - k)) * rho**(n - 2*k)
+                 for k in range((n - am) // 2 + 1))
+
+    if m > 0:
+        return radial * np.cos(m * phi)
+    elif m < 0:
+        return radial * np.sin(am * phi)
+
+    return radial
+
+
+def test_zernike_dde_reference():
+    """ Tests zernike_dde against direct polynomial evaluation """
+    from africanus.rime.zernike import zernike_dde
+
+    nsrc, ntime, na, nchan = 10, 2, 3, 4
+    npoly = 25
+
+    # Include coordinates outside the unit circle and the origin
+    coords = np.random.random((3, nsrc, ntime, na, nchan))*2.4 - 1.2
+    coords[:2, 0] = 0
+
+    coeffs = (np.random.random((na, nchan, 2, 2, npoly)) +
+              np.random.random((na, nchan, 2, 2, npoly))*1j)
+    noll_index = np.random.randint(0, 40, size=(na, nchan, 2, 2, npoly))
+
+    ddes = zernike_dde(coords, coeffs, noll_index)
+    assert ddes.shape == (nsrc, ntime, na, nchan, 2, 2)
+
+    expected = np.zeros_like(ddes)
+
+    for s in range(nsrc):
+        for t in range(ntime):
+            for a in range(na):
+                for c in range(nchan):
+                    l, m = coords[:2, s, t, a, c]
+                    rho, phi = np.sqrt(l**2 + m**2), np.arctan2(l, m)
+
+                    for idx in np.ndindex(2, 2):
+                        for p in range(npoly):
+                            z = _reference_zernike(
+                                noll_index[(a, c) + idx + (p,)], rho, phi)
+                            coeff = coeffs[(a, c) + idx + (p,)]
+                            expected[(s, t, a, c) + idx] += coeff*z
+
+    assert np.allclose(ddes, expected)
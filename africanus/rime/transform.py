@@ -11,42 +11,54 @@ import numba
 import numpy as np
 
 
-@numba.jit(nopython=True, nogil=True, cache=True)
+@numba.jit(nopython=True, nogil=True, cache=True, parallel=True)
 def _nb_transform_sources(lm, parallactic_angles, pointing_errors,
                           antenna_scaling, frequency, coords):
     """
     numba implementation of
-    :func:`~africanus.rime.transform_sources`
+    :func:`~africanus.rime.transform_sources`.
+
+    ``coords`` may have 2 or 3 components. The frequency
+    component is only written in the latter case.
     """
-    _, nsrc, ntime, na, nchan = coords.shape
+    ncomp, nsrc, ntime, na, nchan = coords.shape
+
+    # Parallelise over each (time, antenna) pair
+    for ta in numba.prange(ntime*na):
+        t = ta // na
+        a = ta - t*na
+
+        pa_sin = math.sin(parallactic_angles[t, a])
+        pa_cos = math.cos(parallactic_angles[t, a])
+        l_error = pointing_errors[t, a, 0]
+        m_error = pointing_errors[t, a, 1]
 
-    for t in range(ntime):
-        for a in range(na):
-            pa_sin = math.sin(parallactic_angles[t, a])
-            pa_cos = math.cos(parallactic_angles[t, a])
+        for s in range(nsrc):
+            l = lm[s, 0]
+            m = lm[s, 1]
 
-            for s in range(nsrc):
-                l, m = lm[s]
+            # Rotate source coordinate by parallactic angle
+            # and add pointing errors
+            rl = l*pa_cos - m*pa_sin + l_error
+            rm = l*pa_sin + m*pa_cos + m_error
 
-                # Rotate source coordinate by parallactic angle
-                l = l*pa_cos - m*pa_sin
-                m = l*pa_sin + m*pa_cos
+            # Scale by antenna scaling factors
+            for c in range(nchan):
+                coords[0, s, t, a, c] = rl*antenna_scaling[a, c]
 
-                # Add pointing errors
-                l += pointing_errors[t, a, 0]
-                m += pointing_errors[t, a, 1]
+            for c in range(nchan):
+                coords[1, s, t, a, c] = rm*antenna_scaling[a, c]
 
-                # Scale by antenna scaling factors
+            if ncomp == 3:
                 for c in range(nchan):
-                    coords[0, s, t, a, c] = l*antenna_scaling[a, c]
-                    coords[1, s, t, a, c] = m*antenna_scaling[a, c]
                     coords[2, s, t, a, c] = frequency[c]
 
     return coords
 
 
 def transform_sources(lm, parallactic_angles, pointing_errors,
-                      antenna_scaling, frequency, dtype=None):
+                      antenna_scaling, frequency, dtype=None,
+                      frequency_plane=True):
     """
     Creates beam sampling coordinates suitable for use
     in :func:`~africanus.rime.beam_cube_dde` by:
@@ -55,6 +67,9 @@ def transform_sources(lm, parallactic_angles, pointing_errors,
     2. Adding ``pointing_errors``
     3. Scaling by ``antenna_scaling``
 
+    Coordinates are computed in parallel over each
+    (time, antenna) pair.
+
     Parameters
     ----------
     lm : :class:`numpy.ndarray`
@@ -75,7 +90,10 @@ def transform_sources(lm, parallactic_angles, pointing_errors,
     dtype : :class:`numpy.dtype`, optional
         Numpy dtype of result array. Should be float32 or float64.
         Defaults to float64
-
+    frequency_plane : bool, optional
+        If False, the **frequency** component, which
+        is simply ``frequency`` broadcast to every source, time and
+        antenna, is not created. Defaults to True.
 
     Returns
     -------
@@ -83,6 +101,8 @@ def transform_sources(lm, parallactic_angles, pointing_errors,
         coordinates of shape :code:`(3, src, time, antenna, chan)`
         where each coordinate component represents **l**, **m** and
         **frequency**, respectively.
+        If ``frequency_plane`` is False, the shape is
+        :code:`(2, src, time, antenna, chan)`.
     """
 
     ntime, na = parallactic_angles.shape
@@ -92,7 +112,8 @@ def transform_sources(lm, parallactic_angles, pointing_errors,
     assert nchan == frequency.shape[0]
 
     dtype = np.float64 if dtype is None else dtype
-    coords = np.empty((3, nsrc, ntime, na, nchan), dtype=dtype)
+    ncomp = 3 if frequency_plane else 2
+    coords = np.empty((ncomp, nsrc, ntime, na, nchan), dtype=dtype)
 
     return _nb_transform_sources(lm, parallactic_angles, pointing_errors,
                                  antenna_scaling, frequency, coords)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from collections import namedtuple
+import itertools
+
+import numpy as np
+
+from .predict import predict_vis
+
+
+PredictSignature = namedtuple("PredictSignature",
+                              ["dtype", "dde_corrs", "coh_corrs",
+                               "die_corrs", "base_vis_corrs",
+                               "index_dtype"])
+"""
+:class:`collections.namedtuple` describing a
+:func:`~africanus.rime.predict_vis` specialisation.
+Correlation shapes are :code:`(1,)`, :code:`(2,)` or :code:`(2, 2)`,
+or ``None`` if the associated input is absent.
+
+.. attribute:: dtype
+
+    Complex dtype of the Jones terms
+
+.. attribute:: dde_corrs
+
+    Correlation shape of ``dde1_jones`` and ``dde2_jones``
+
+.. attribute:: coh_corrs
+
+    Correlation shape of ``source_coh``
+
+.. attribute:: die_corrs
+
+    Correlation shape of ``die1_jones`` and ``die2_jones``
+
+.. attribute:: base_vis_corrs
+
+    Correlation shape of ``base_vis``
+
+.. attribute:: index_dtype
+
+    Integer dtype of ``time_index``, ``antenna1`` and ``antenna2``.
+    Defaults to :class:`numpy.int32`.
+"""
+
+PredictSignature.__new__.__defaults__ = (np.int32,)
+
+
+def _default_signatures():
+    dtypes = (np.complex64, np.complex128)
+    corrs = ((1,), (2,), (2, 2))
+
+    for dtype, c in itertools.product(dtypes, corrs):
+        # Direction dependent and independent effects
+        yield PredictSignature(dtype, c, c, c, None)
+        # Direction dependent effects only
+        yield PredictSignature(dtype, c, c, None, None)
+        # Coherencies only
+        yield PredictSignature(dtype, None, c, None, None)
+
+
+def _jones(shape, corrs, dtype):
+    return None if corrs is None else np.zeros(shape + corrs, dtype=dtype)
+
+
+def warmup(signatures=None):
+    """
+    Compiles :func:`~africanus.rime.predict_vis` specialisations ahead of
+    their first use, for example at the start of a dask worker:
+
+    .. code-block:: python
+
+        from africanus.rime import warmup
+
+        client.run(warmup)
+
+    Compiled specialisations are cached on disk, so
+    that other processes load rather than compile them.
+
+    Parameters
+    ----------
+    signatures : iterable of :class:`PredictSignature`, optional
+        Specialisations to compile. Defaults to :class:`numpy.complex64`
+        and :class:`numpy.complex128` scalar, diagonal and full Jones
+        terms with (1) direction dependent and independent effects,
+        (2) direction dependent effects only and (3) coherencies only.
+
+    Returns
+    -------
+    list of :class:`PredictSignature`
+        The compiled specialisations
+    """
+    if signatures is None:
+        signatures = _default_signatures()
+
+    compiled = []
+
+    for sig in signatures:
+        sig = PredictSignature(*sig)
+        index = np.zeros(1, dtype=sig.index_dtype)
+
+        predict_vis(index, index, index,
+                    _jones((1, 1, 1, 1), sig.dde_corrs, sig.dtype),
+                    _jones((1, 1, 1), sig.coh_corrs, sig.dtype),
+                    _jones((1, 1, 1, 1), sig.dde_corrs, sig.dtype),
+                    _jones((1, 1, 1), sig.die_corrs, sig.dtype),
+                    _jones((1, 1), sig.base_vis_corrs, sig.dtype),
+                    _jones((1, 1, 1), sig.die_corrs, sig.dtype))
+
+        compiled.append(sig)
+
+    return compiled
@@ -3,80 +3,178 @@ import numpy as np
 import math
 
 
-@numba.jit(nogil=True, nopython=True, cache=True)
-def fac(x):
-    if x < 0:
-        raise ValueError("Factorial input is negative.")
-    if x == 0:
-        return 1
-    factorial = 1
-    for i in range(1, x + 1):
-        factorial *= i
-    return factorial
+def noll_to_nm(j):
+    """
+    Decomposes the zero-based Noll index ``j`` into
+    radial order ``n`` and signed azimuthal frequency ``m``.
+    """
+    j = int(j) + 1
+    n = 0
+    j1 = j - 1
+
+    while j1 > n:
+        n += 1
+        j1 -= n
 
+    m = (-1)**j * ((n % 2) + 2 * int((j1 + ((n + 1) % 2)) / 2.0))
+    return n, m
 
-@numba.jit(nogil=True, nopython=True, cache=True)
-def pre_fac(k, n, m):
-    numerator = (-1.0)**k * fac(n-k)
-    denominator = (fac(k) * fac((n+m)/2.0 - k) * fac((n-m)/2.0 - k))
-    return numerator / denominator
 
+def zernike_tables(noll_index):
+    """
+    Precomputes tables for evaluating the Zernike polynomials
+    associated with the unique Noll indices in ``noll_index``.
+
+    Parameters
+    ----------
+    noll_index : :class:`numpy.ndarray`
+        Noll indices of any shape.
 
-@numba.jit(nogil=True, nopython=True, cache=True)
-def zernike_rad(m, n, rho):
-    if (n < 0 or m < 0 or abs(m) > n):
-        raise ValueError("m and n values are incorrect.")
-    radial_component = 0
-    for k in range((n-m)/2+1):
-        radial_component += pre_fac(k, n, m) * rho ** (n - 2.0 * k)
-    return radial_component
+    Returns
+    -------
+    tuple
+        ``(inverse, azimuth, radial)`` where
+
+        * ``inverse`` has the shape of ``noll_index`` and maps each
+          Noll index onto a unique Noll index.
+        * ``azimuth`` has shape :code:`(nunique,)` and contains the
+          signed azimuthal frequency ``m`` of each unique Noll index.
+        * ``radial`` has shape :code:`(nunique, nmax + 1)` and contains
+          the coefficients of the powers of rho in the radial
+          polynomial of each unique Noll index.
+    """
+    unique, inverse = np.unique(noll_index.astype(np.intp),
+                                return_inverse=True)
+
+    nm = [noll_to_nm(j) for j in unique]
+    nmax = max(n for n, _ in nm) if len(nm) > 0 else 0
+
+    azimuth = np.empty(len(nm), dtype=np.intp)
+    radial = np.zeros((len(nm), nmax + 1), dtype=np.float64)
+
+    for u, (n, m) in enumerate(nm):
+        am = abs(m)
+        azimuth[u] = m
+
+        for k in range((n - am) // 2 + 1):
+            numerator = (-1)**k * math.factorial(n - k)
+            denominator = (math.factorial(k) *
+                           math.factorial((n + am) // 2 - k) *
+                           math.factorial((n - am) // 2 - k))
+            radial[u, n - 2*k] = float(numerator) / denominator
+
+    return inverse.reshape(noll_index.shape), azimuth, radial
 
 
 @numba.jit(nogil=True, nopython=True, cache=True)
-def zernike(j, rho, phi):
+def _zernike_basis(l, m, azimuth, radial, cos_mphi, sin_mphi, basis):
+    """
+    Evaluates each unique Zernike polynomial at (l, m) into ``basis``.
+    ``cos_mphi`` and ``sin_mphi`` are scratch space for
+    :code:`cos(k*phi)` and :code:`sin(k*phi)`.
+    """
+    rho = math.sqrt(l**2 + m**2)
+
+    # Zernike polynomials are zero outside the unit circle
     if rho > 1:
-        return 0 + 0j
-    j += 1
-    n = 0
-    j1 = j-1
-    while (j1 > n):
-        n += 1
-        j1 -= n
-    m = (-1)**j * ((n % 2) + 2 * int((j1+((n+1) % 2)) / 2.0))
-    if (m > 0):
-        return zernike_rad(m, n, rho) * np.cos(m * phi)
-    if (m < 0):
-        return zernike_rad(-m, n, rho) * np.sin(-m * phi)
-    return zernike_rad(0, n, rho)
+        basis[:] = 0
+        return
 
+    # phi = arctan2(l, m) so that
+    # cos(phi) = m / rho and sin(phi) = l / rho
+    if rho == 0.0:
+        cos_phi = 1.0
+        sin_phi = 0.0
+    else:
+        cos_phi = m / rho
+        sin_phi = l / rho
 
-@numba.jit(nogil=True, nopython=True, cache=True)
-def _convert_coords(l, m):
-    rho, phi = (l**2 + m ** 2) ** 0.5, np.arctan2(l, m)
-    return rho, phi
+    # Chebyshev recurrences for cos(k*phi) and sin(k*phi)
+    kmax = cos_mphi.shape[0]
+    cos_mphi[0] = 1.0
+    sin_mphi[0] = 0.0
 
+    if kmax > 1:
+        cos_mphi[1] = cos_phi
+        sin_mphi[1] = sin_phi
 
-@numba.jit(nogil=True, nopython=True, cache=True)
-def nb_zernike_dde(coords, coeffs, noll_index, out):
+    for k in range(2, kmax):
+        cos_mphi[k] = 2.0*cos_phi*cos_mphi[k - 1] - cos_mphi[k - 2]
+        sin_mphi[k] = 2.0*cos_phi*sin_mphi[k - 1] - sin_mphi[k - 2]
+
+    npowers = radial.shape[1]
+
+    for u in range(azimuth.shape[0]):
+        # Horner evaluation of the radial polynomial
+        value = 0.0
+
+        for p in range(npowers - 1, -1, -1):
+            value = value*rho + radial[u, p]
+
+        az = azimuth[u]
+
+        if az > 0:
+            value *= cos_mphi[az]
+        elif az < 0:
+            value *= sin_mphi[-az]
+
+        basis[u] = value
+
+
+# Number of sources in each block of coordinates
+_SOURCE_BLOCK = 32
+
+
+@numba.jit(nogil=True, nopython=True, cache=True, parallel=True)
+def nb_zernike_dde(coords, coeffs, azimuth, radial, out):
+    """
+    Evaluates the Zernike polynomials in parallel over blocks of
+    (time, source). ``coeffs`` has shape
+    :code:`(ant, chan, corr, nunique)` and holds the coefficient of
+    each unique polynomial, so that the unique polynomials are
+    evaluated once per coordinate and combined for all correlations.
+    """
     sources, times, ants, chans, corrs = out.shape
-    npoly = coeffs.shape[-1]
+    nunique = azimuth.shape[0]
+    kmax = 1
+
+    for u in range(nunique):
+        kmax = max(kmax, abs(azimuth[u]) + 1)
+
+    nsblocks = (sources + _SOURCE_BLOCK - 1) // _SOURCE_BLOCK
 
-    for s in range(sources):
-        for t in range(times):
-            for a in range(ants):
-                for c in range(chans):
-                    l, m, freq = coords[:, s, t, a, c]
-                    rho, phi = _convert_coords(l, m)
+    for tb in numba.prange(times*nsblocks):
+        t = tb // nsblocks
+        s_start = (tb - t*nsblocks)*_SOURCE_BLOCK
+        s_end = min(s_start + _SOURCE_BLOCK, sources)
+        nsrc = s_end - s_start
 
-                    for co in range(corrs):
-                        zernike_sum = 0
+        basis = np.empty((_SOURCE_BLOCK, nunique), dtype=np.float64)
+        cos_mphi = np.empty(kmax, dtype=np.float64)
+        sin_mphi = np.empty(kmax, dtype=np.float64)
+        zernike_sum = np.empty(_SOURCE_BLOCK, dtype=out.dtype)
 
-                        for p in range(npoly):
-                            zc = coeffs[a, c, co, p]
-                            zn = noll_index[a, c, co, p]
-                            zernike_sum += zc * zernike(zn, rho, phi)
+        for a in range(ants):
+            for c in range(chans):
+                # Evaluate unique polynomials for the source block
+                for i in range(nsrc):
+                    _zernike_basis(coords[0, s_start + i, t, a, c],
+                                   coords[1, s_start + i, t, a, c],
+                                   azimuth, radial,
+                                   cos_mphi, sin_mphi, basis[i])
 
-                        out[s, t, a, c, co] = zernike_sum
+                # (source, unique) x (unique, corr) product
+                for co in range(corrs):
+                    zernike_sum[:] = 0
+
+                    for u in range(nunique):
+                        coeff = coeffs[a, c, co, u]
+
+                        for i in range(nsrc):
+                            zernike_sum[i] += coeff*basis[i, u]
+
+                    for i in range(nsrc):
+                        out[s_start + i, t, a, c, co] = zernike_sum[i]
 
     return out
 
@@ -95,7 +193,19 @@ def zernike_dde(coords, coeffs, noll_index):
     coeffs = coeffs.reshape((ants, chans, fcorrs, npoly))
     noll_index = noll_index.reshape((ants, chans, fcorrs, npoly))
 
-    result = nb_zernike_dde(coords, coeffs, noll_index, ddes)
+    # Precompute (n, m) and radial coefficients
+    # for each unique noll index
+    inverse, azimuth, radial = zernike_tables(noll_index)
+
+    # Accumulate coefficients of each unique polynomial
+    unique_coeffs = np.zeros((ants, chans, fcorrs, azimuth.shape[0]),
+                             dtype=coeffs.dtype)
+    a = np.arange(ants)[:, None, None, None]
+    c = np.arange(chans)[None, :, None, None]
+    co = np.arange(fcorrs)[None, None, :, None]
+    np.add.at(unique_coeffs, (a, c, co, inverse), coeffs)
+
+    result = nb_zernike_dde(coords, unique_coeffs, azimuth, radial, ddes)
 
     # Reshape to full correlation size
     return result.reshape((sources, times, ants, chans) + corr_shape)
@@ -123,6 +233,9 @@ coords : :class:`numpy.ndarray`
    Has shape :code:`(3, source, time, ant, chan)`. The three components in
    the first dimension represent
    l, m and frequency coordinates, respectively.
+   The frequency component is unused and may be omitted,
+   see the ``frequency_plane`` argument of
+   :func:`~africanus.rime.transform_sources`.
 coeffs : :class:`numpy.ndarray`
   complex Zernicke polynomial coefficients.
   Has shape :code:`(ant, chan, corr_1, ..., corr_n, poly)`
@@ -24,48 +24,49 @@ except ImportError:
 @wraps(np_stokes_convert)
 def _wrapper(np_input, mapping=None, in_shape=None,
              out_shape=None, dtype_=None):
-    result = stokes_convert_impl(np_input, mapping, in_shape,
-                                 out_shape, dtype_)
-
-    # Introduce extra singleton dimension at the end of our shape
-    return result.reshape(result.shape + (1,) * len(in_shape))
+    return stokes_convert_impl(np_input, mapping, in_shape,
+                               out_shape, dtype_)
 
 
 @requires_optional("dask.array")
-def stokes_convert(input, input_schema, output_schema):
+def stokes_convert(input, input_schema, output_schema, feed_bases=None):
     mapping, in_shape, out_shape, dtype = stokes_convert_setup(
                                                 input,
                                                 input_schema,
-                                                output_schema)
+                                                output_schema,
+                                                feed_bases)
 
     n_free_dims = len(input.shape) - len(in_shape)
     free_dims = tuple("dim-%d" % i for i in range(n_free_dims))
     in_corr_dims = tuple("icorr-%d" % i for i in range(len(in_shape)))
     out_corr_dims = tuple("ocorr-%d" % i for i in range(len(out_shape)))
 
+    if not all(len(c) == 1 for c in input.chunks[n_free_dims:]):
+        raise ValueError("Correlation dimensions of input "
+                         "must consist of a single chunk. "
+                         "Rechunk the input with '%s' chunks"
+                         % (input.chunks[:n_free_dims] + in_shape,))
+
     # Output dimension are new dimensions
     new_axes = {d: s for d, s in zip(out_corr_dims, out_shape)}
 
-    # Note the dummy in_corr_dims introduced at the end of our output,
-    # We do this to prevent a contraction over the input dimensions
-    # (which can be arbitrary) within the wrapper class
-    res = da.core.atop(_wrapper, free_dims + out_corr_dims + in_corr_dims,
-                       input, free_dims + in_corr_dims,
-                       mapping=mapping,
-                       in_shape=in_shape,
-                       out_shape=out_shape,
-                       new_axes=new_axes,
-                       dtype_=dtype,
-                       dtype=dtype)
-
-    # Now contract over the dummy dimensions
-    start = len(free_dims) + len(out_corr_dims)
-    end = start + len(in_corr_dims)
-    return res.sum(axis=list(range(start, end)))
+    # Input correlations are contracted, but as they
+    # consist of a single chunk, exactly one task is
+    # produced per input block
+    return da.core.atop(_wrapper, free_dims + out_corr_dims,
+                        input, free_dims + in_corr_dims,
+                        mapping=mapping,
+                        in_shape=in_shape,
+                        out_shape=out_shape,
+                        new_axes=new_axes,
+                        concatenate=True,
+                        dtype_=dtype,
+                        dtype=dtype)
 
 
 try:
     stokes_convert.__doc__ = STOKES_DOCS.substitute(
+                                out_param="",
                                 array_type=":class:`dask.array.Array`")
 except AttributeError:
     pass
@@ -8,9 +8,11 @@ from collections import OrderedDict, deque
 from pprint import pformat
 from textwrap import fill
 
+import numba
 import numpy as np
 
 from ..compatibility import string_types
+from ..util.code import memoize_on_key
 from ..util.docs import DocstringTemplate
 
 STOKES_TYPES = [
@@ -69,28 +71,32 @@ https://casacore.github.io/casacore/classcasacore_1_1Stokes.html
 """
 
 stokes_conv = {
-    'RR': {('I', 'V'): lambda i, v: i + v + 0j},
-    'RL': {('Q', 'U'): lambda q, u: q + u*1j},
-    'LR': {('Q', 'U'): lambda q, u: q - u*1j},
-    'LL': {('I', 'V'): lambda i, v: i - v + 0j},
+    'RR': {('I', 'V'): "i + v + 0j"},
+    'RL': {('Q', 'U'): "q + u*1j"},
+    'LR': {('Q', 'U'): "q - u*1j"},
+    'LL': {('I', 'V'): "i - v + 0j"},
 
-    'XX': {('I', 'Q'): lambda i, q: i + q + 0j},
-    'XY': {('U', 'V'): lambda u, v: u + v*1j},
-    'YX': {('U', 'V'): lambda u, v: u - v*1j},
-    'YY': {('I', 'Q'): lambda i, q: i - q + 0j},
+    'XX': {('I', 'Q'): "i + q + 0j"},
+    'XY': {('U', 'V'): "u + v*1j"},
+    'YX': {('U', 'V'): "u - v*1j"},
+    'YY': {('I', 'Q'): "i - q + 0j"},
 
-    'I': {('XX', 'YY'): lambda xx, yy: (xx + yy).real / 2,
-          ('RR', 'LL'): lambda rr, ll: (rr + ll).real / 2},
+    'I': {('XX', 'YY'): "(xx + yy).real / 2",
+          ('RR', 'LL'): "(rr + ll).real / 2"},
 
-    'Q': {('XX', 'YY'): lambda xx, yy: (xx - yy).real / 2,
-          ('RL', 'LR'): lambda rl, lr: (rl + lr).real / 2},
+    'Q': {('XX', 'YY'): "(xx - yy).real / 2",
+          ('RL', 'LR'): "(rl + lr).real / 2"},
 
-    'U': {('XY', 'YX'): lambda xy, yx: (xy + yx).real / 2,
-          ('RL', 'LR'): lambda rl, lr: (rl - lr).imag / 2},
+    'U': {('XY', 'YX'): "(xy + yx).real / 2",
+          ('RL', 'LR'): "(rl - lr).imag / 2"},
 
-    'V': {('XY', 'YX'): lambda xy, yx: (xy - yx).imag / 2,
-          ('RR', 'LL'): lambda rr, ll: (rr - ll).real / 2},
+    'V': {('XY', 'YX'): "(xy - yx).imag / 2",
+          ('RR', 'LL'): "(rr - ll).real / 2"},
 }
+"""
+Maps each output to expressions producing it from pairs of inputs.
+Expressions refer to the inputs by their lower case names.
+"""
 
 
 class DimensionMismatch(Exception):
@@ -153,80 +159,255 @@ def _element_indices_and_shape(data):
     return result, tuple(shape)
 
 
-def stokes_convert_setup(input, input_schema, output_schema):
+FEED_BASES = {
+    'X': (1.0, 0.0),
+    'Y': (0.0, 1.0),
+    'R': (np.sqrt(0.5), -np.sqrt(0.5)*1j),
+    'L': (np.sqrt(0.5), np.sqrt(0.5)*1j),
+}
+r"""
+Jones vectors of each feed, in the linear ``X, Y`` basis.
+Correlations between feeds ``p`` and ``q`` are derived
+from the stokes parameters as :math:`e_p^H B e_q`,
+where :math:`B` is the linear brightness matrix
+
+.. math::
+
+    B = \begin{bmatrix}
+        I + Q & U + iV \\
+        U - iV & I - Q
+    \end{bmatrix}
+"""
+
+# Brightness matrices of I, Q, U and V in the linear basis
+_STOKES_BRIGHTNESS = np.array([[[1, 0], [0, 1]],
+                               [[1, 0], [0, -1]],
+                               [[0, 1], [1, 0]],
+                               [[0, 1j], [-1j, 0]]])
+
+_STOKES_PARAMETERS = ('I', 'Q', 'U', 'V')
+
+
+def _stokes_coefficients(name, feed_bases):
+    """
+    Returns coefficients expressing ``name`` as a linear combination
+    of the stokes parameters ``I, Q, U, V``, or None if ``name``
+    is neither a stokes parameter nor a correlation of known feeds.
+    """
+    if name in _STOKES_PARAMETERS:
+        return np.eye(4, dtype=np.complex128)[_STOKES_PARAMETERS.index(name)]
+
+    if len(name) == 2 and all(f in feed_bases for f in name):
+        ep = np.asarray(feed_bases[name[0]], dtype=np.complex128)
+        eq = np.asarray(feed_bases[name[1]], dtype=np.complex128)
+        return np.einsum("i,kij,j->k", ep.conj(), _STOKES_BRIGHTNESS, eq)
+
+    return None
+
+
+def _snap(value):
+    """ Snaps ``value`` to the nearest half, if it is close to it """
+    half = np.round(2.0*value) / 2.0
+    return half if abs(value - half) < 1e-12 else value
+
+
+def _linear_expr(coefficients, names):
+    """ Code expression for a linear combination of ``names`` """
+    terms = []
+
+    for c, name in zip(coefficients, names):
+        real, imag = _snap(c.real), _snap(c.imag)
+
+        if real == 0.0 and imag == 0.0:
+            continue
+        elif imag == 0.0:
+            coeff = "" if real == 1.0 else "%r*" % real
+        elif real == 0.0:
+            coeff = "%rj*" % imag
+        else:
+            coeff = "(%r + %rj)*" % (real, imag)
+
+        terms.append(coeff + name)
+
+    return " + ".join(terms) if len(terms) > 0 else "0.0"
+
+
+def _matrix_conversion(okey, input_indices, feed_bases):
+    """
+    Derives a conversion of all known inputs to ``okey`` from the
+    stokes coefficients of the inputs and ``okey``.
+    Returns ``(inputs, expression)`` or ``None`` if the inputs
+    cannot produce ``okey``.
+    """
+    coefficients = _stokes_coefficients(okey, feed_bases)
+
+    if coefficients is None:
+        raise ValueError("Unknown output '%s'. Known types '%s' or "
+                         "correlations of the feeds '%s'"
+                         % (okey, _STOKES_PARAMETERS, sorted(feed_bases)))
+
+    inputs = [(k, _stokes_coefficients(k, feed_bases))
+              for k in input_indices]
+    inputs = [(k, c) for k, c in inputs if c is not None]
+
+    if len(inputs) == 0:
+        return None
+
+    # Solve for the combination of inputs producing the output
+    A = np.stack([c for _, c in inputs])
+    T = coefficients.dot(np.linalg.pinv(A))
+
+    if not np.allclose(T.dot(A), coefficients, atol=1e-10):
+        return None
+
+    names = [k.lower() for k, _ in inputs]
+    expr = _linear_expr(T, names)
+
+    # Stokes parameters are real, correlations complex
+    if okey in _STOKES_PARAMETERS:
+        expr = "(%s).real" % expr
+    else:
+        expr = "(%s) + 0j" % expr
+
+    return [k for k, _ in inputs], expr
+
+
+def stokes_convert_setup(input, input_schema, output_schema,
+                         feed_bases=None):
     input_indices, input_shape = _element_indices_and_shape(input_schema)
     output_indices, output_shape = _element_indices_and_shape(output_schema)
 
     if input.shape[-len(input_shape):] != input_shape:
         raise ValueError("Last dimension of input doesn't match input schema")
 
+    bases = FEED_BASES.copy()
+
+    if feed_bases is not None:
+        bases.update(feed_bases)
+
     mapping = []
-    dummy = input.dtype.type(0)
+    # Arrays, rather than scalars, preserve single precision
+    dummy = np.zeros(1, dtype=input.dtype)
 
     # Figure out how to produce an output from available inputs
     for okey, out_idx in output_indices.items():
-        try:
-            deps = stokes_conv[okey]
-        except KeyError:
-            raise ValueError("Unknown output '%s'. Known types '%s'"
-                             % (deps, STOKES_TYPES))
-
-        found_conv = False
-
-        # Find a mapping for which we have inputs
-        for (c1, c2), fn in deps.items():
-            # Get indices for both correlations
-            try:
-                c1_idx = (Ellipsis,) + input_indices[c1]
-            except KeyError:
-                continue
-
-            try:
-                c2_idx = (Ellipsis,) + input_indices[c2]
-            except KeyError:
-                continue
-
-            found_conv = True
-            out_idx = (Ellipsis,) + out_idx
-            # Figure out the data type for this output
-            dtype = fn(dummy, dummy).dtype
-            mapping.append((c1_idx, c2_idx, out_idx, fn, dtype))
-            break
+        conversion = None
+
+        # Prefer a direct conversion from a pair of inputs
+        for (c1, c2), expr in stokes_conv.get(okey, {}).items():
+            if c1 in input_indices and c2 in input_indices:
+                conversion = [c1, c2], expr
+                break
+
+        # Otherwise derive one from the feed bases
+        if conversion is None:
+            conversion = _matrix_conversion(okey, input_indices, bases)
 
         # We must find a conversion
-        if not found_conv:
+        if conversion is None:
             raise MissingConversionInputs("None of the supplied inputs '%s' "
-                                          "can produce output '%s'. It can be "
-                                          "produced by the following "
-                                          "combinations '%s'." % (
-                                                input_schema,
-                                                okey, deps.keys()))
+                                          "can produce output '%s'."
+                                          % (input_schema, okey))
 
-    out_dtype = np.result_type(*[dt for _, _, _, _, dt in mapping])
+        keys, expr = conversion
 
-    return mapping, input_shape, output_shape, out_dtype
+        # Indices into the flattened correlations
+        inputs = tuple((k.lower(),
+                        int(np.ravel_multi_index(input_indices[k],
+                                                 input_shape)))
+                       for k in keys)
+        out_idx = int(np.ravel_multi_index(out_idx, output_shape))
 
+        # Figure out the data type for this output
+        dtype = eval(expr, {}, {name: dummy for name, _ in inputs})
+        mapping.append((inputs, out_idx, expr, np.asarray(dtype).dtype))
 
-def stokes_convert_impl(input, mapping, in_shape, out_shape, dtype):
-    # Make the output array
-    out_shape = input.shape[:-len(in_shape)] + out_shape
-    output = np.empty(out_shape, dtype=dtype)
+    out_dtype = np.result_type(*[dt for _, _, _, dt in mapping])
+
+    return mapping, input_shape, output_shape, out_dtype
 
-    for c1_idx, c2_idx, out_idx, fn, _ in mapping:
-        output[out_idx] = fn(input[c1_idx], input[c2_idx])
+
+_KERNEL_TEMPLATE = """
+def _stokes_convert_kernel(input, output):
+    for r in range(input.shape[0]):
+{loads}
+{stores}
 
     return output
+"""
+
+
+# Number of generated kernels retained. Kernels are exec'd and
+# can't be cached on disk, so bound the number held in memory
+_KERNEL_CACHE_SIZE = 32
+
+
+def _kernel_key(mapping):
+    return tuple((inputs, out_idx, expr)
+                 for inputs, out_idx, expr, _ in mapping)
+
+
+@memoize_on_key(_kernel_key, maxsize=_KERNEL_CACHE_SIZE)
+def _stokes_convert_kernel(mapping):
+    """
+    Generates a numba kernel converting :code:`(row, icorr)` inputs
+    into :code:`(row, ocorr)` outputs. Each input correlation
+    is read once and all outputs are written in a single pass.
+    """
+    # Read each input correlation used by the outputs once
+    inputs = OrderedDict((c, None) for cs, _, _, _ in mapping
+                         for c in cs)
+
+    loads = ["        %s = input[r, %d]" % (name, idx)
+             for name, idx in inputs]
+    stores = ["        output[r, %d] = %s" % (out_idx, expr)
+              for _, out_idx, expr, _ in mapping]
+
+    code = _KERNEL_TEMPLATE.format(loads="\n".join(loads),
+                                   stores="\n".join(stores))
+    namespace = {}
+    exec(compile(code, "<stokes_convert_kernel>", "exec"), namespace)
+    return numba.njit(nogil=True)(namespace["_stokes_convert_kernel"])
 
 
-def stokes_convert(input, input_schema, output_schema):
+def stokes_convert_impl(input, mapping, in_shape, out_shape, dtype,
+                        out=None):
+    # Output has the input's leading dimensions
+    leading = input.shape[:-len(in_shape)]
+    out_shape = leading + out_shape
+
+    if out is None:
+        out = np.empty(out_shape, dtype=dtype)
+    elif out.shape != out_shape:
+        raise ValueError("out shape %s != expected shape %s"
+                         % (out.shape, out_shape))
+
+    # Flatten leading and correlation dimensions
+    nrow = int(np.prod(leading))
+    flat_input = input.reshape(nrow, int(np.prod(in_shape)))
+    flat_out = out.reshape(nrow, int(np.prod(out_shape[len(leading):])))
+
+    _stokes_convert_kernel(mapping)(flat_input, flat_out)
+
+    # Copy back if out could not be flattened in place
+    if not np.may_share_memory(flat_out, out):
+        out[...] = flat_out.reshape(out_shape)
+
+    return out
+
+
+def stokes_convert(input, input_schema, output_schema,
+                   out=None, feed_bases=None):
     """ See STOKES_DOCS below """
 
     # Do the conversion
     mapping, in_shape, out_shape, dtype = stokes_convert_setup(input,
                                                                input_schema,
-                                                               output_schema)
+                                                               output_schema,
+                                                               feed_bases)
 
-    return stokes_convert_impl(input, mapping, in_shape, out_shape, dtype)
+    return stokes_convert_impl(input, mapping, in_shape,
+                               out_shape, dtype, out=out)
 
 
 STOKES_DOCS = """
@@ -260,6 +441,21 @@ Or circular correlations to stokes:
 but the appropriate inputs must be present to produce the requested
 outputs.
 
+Correlations of mixed feed bases, such as ``RX`` or ``YL``,
+are derived from the Jones vectors of the feeds in
+:data:`~africanus.stokes.stokes_conversion.FEED_BASES`.
+Feeds with other bases, such as ``P`` and ``Q``, can be
+described with ``feed_bases``:
+
+.. code-block:: python
+
+    vis = stokes_convert(stokes, ["I", "Q", "U", "V"],
+                         ["PP", "PQ", "QP", "QQ"],
+                         feed_bases={{"P": [1, 0], "Q": [0, 1]}})
+
+All outputs are computed from the inputs in a single pass
+over the data.
+
 The elements of ``input`` and ``output`` may be strings or integers
 representing stokes parameters or correlations. See the Notes
 for a full list.
@@ -268,8 +464,8 @@ for a full list.
 Notes
 -----
 
-Only stokes parameters, linear and circular correlations are
-currently handled, but the full list of id's and strings as defined
+Only stokes parameters and correlations of feeds with known
+bases are currently handled, but the full list of id's and strings as defined
 in the `CASA documentation
 <https://casacore.github.io/casacore/classcasacore_1_1Stokes.html>`_
 is:
@@ -290,6 +486,10 @@ input_schema : list
 output_schema : list
     A schema describing the :code:`ocorr_1, ..., ocorr_n`
     dimension of the return value.
+$(out_param)feed_bases : dict, optional
+    Maps feed names to their Jones vectors in the linear ``X, Y``
+    basis. Supplements or overrides the defaults in
+    :data:`~africanus.stokes.stokes_conversion.FEED_BASES`.
 
 Returns
 -------
@@ -297,6 +497,12 @@ $(array_type)
     Result of shape :code:`(dim_1, ..., dim_n, ocorr_1, ..., ocorr_m)`
     The type may be floating point or promoted to complex
     depending on the combinations in ``output``.
+    Single precision inputs produce single precision outputs.
+"""
+
+_OUT_PARAM = """out : :class:`numpy.ndarray`, optional
+    Array of shape :code:`(dim_1, ..., dim_n, ocorr_1, ..., ocorr_m)`
+    into which the result is written.
 """
 
 # Fill in the STOKES TYPES
@@ -309,6 +515,7 @@ del _map_str
 
 try:
     stokes_convert.__doc__ = STOKES_DOCS.substitute(
+                                  out_param=_OUT_PARAM,
                                   array_type=":class:`numpy.ndarray`")
 except AttributeError:
     pass
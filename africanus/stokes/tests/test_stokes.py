@@ -138,3 +138,144 @@ def test_dask_stokes_conversion(input_schema, output_schema,
     da_vis = da_stokes_convert(vis, input_schema, output_schema)
     np_vis = np_stokes_convert(vis.compute(), input_schema, output_schema)
     assert np.all(da_vis == np_vis)
+
+
+@pytest.mark.parametrize("input_schema, output_schema",
+                         _stokes_corr_cases + _stokes_corr_int_cases)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64,
+                                   np.complex64, np.complex128])
+def test_stokes_kernel(input_schema, output_schema, dtype):
+    from africanus.stokes.stokes_conversion import stokes_convert_setup
+
+    input_shape = np.asarray(input_schema).shape
+    output_shape = np.asarray(output_schema).shape
+
+    vis = np.random.random((10, 3) + input_shape)
+
+    if np.issubdtype(dtype, np.complexfloating):
+        vis = vis + np.random.random(vis.shape)*1j
+
+    vis = vis.astype(dtype)
+
+    # Reference conversion, with numpy expressions
+    mapping, _, _, out_dtype = stokes_convert_setup(vis, input_schema,
+                                                    output_schema)
+    flat_vis = vis.reshape((10, 3, -1))
+    expected = np.empty((10, 3, int(np.prod(output_shape))), out_dtype)
+
+    for inputs, out_idx, expr, _ in mapping:
+        expected[..., out_idx] = eval(expr, {}, {c: flat_vis[..., idx]
+                                                 for c, idx in inputs})
+
+    expected = expected.reshape((10, 3) + output_shape)
+
+    # Single precision is preserved
+    single = dtype in (np.float32, np.complex64)
+    assert (out_dtype in (np.float32, np.complex64)) == single
+
+    result = np_stokes_convert(vis, input_schema, output_schema)
+    assert result.dtype == out_dtype
+    assert np.allclose(result, expected)
+
+    # Write into a supplied output buffer
+    out = np.empty_like(expected)
+    assert np_stokes_convert(vis, input_schema, output_schema, out=out) is out
+    assert np.all(out == result)
+
+    # Non-contiguous output buffer
+    out = np.empty((3, 10) + output_shape, out_dtype).swapaxes(0, 1)
+    np_stokes_convert(vis, input_schema, output_schema, out=out)
+    assert np.all(out == result)
+
+    with pytest.raises(ValueError):
+        np_stokes_convert(vis, input_schema, output_schema,
+                          out=np.empty((10,) + output_shape, out_dtype))
+
+
+def test_dask_stokes_conversion_graph():
+    da = pytest.importorskip('dask.array')
+
+    from africanus.stokes.dask import stokes_convert as da_stokes_convert
+
+    vis = da.random.random((10, 8, 4), chunks=(5, 4, 4))
+    stokes = da_stokes_convert(vis, ['XX', 'XY', 'YX', 'YY'],
+                               ['I', 'Q', 'U', 'V'])
+
+    # Exactly one conversion task per input block
+    graph = dict(stokes.__dask_graph__())
+    conversion_keys = [k for k in graph if k[0] == stokes.name]
+    assert len(conversion_keys) == vis.npartitions
+    assert stokes.chunks == ((5, 5), (4, 4), (4,))
+
+    with pytest.raises(ValueError):
+        da_stokes_convert(vis.rechunk((5, 4, 2)),
+                          ['XX', 'XY', 'YX', 'YY'], ['I', 'Q', 'U', 'V'])
+
+
+def test_mixed_basis_conversion():
+    from africanus.stokes.stokes_conversion import MissingConversionInputs
+
+    I, Q, U, V = [1.0, 2.0, 3.0, 4.0]
+    stokes = np.asarray([[I, Q, U, V]])
+    schema = ['I', 'Q', 'U', 'V']
+
+    # Mixed circular and linear feeds
+    vis = np_stokes_convert(stokes, schema, ['RX', 'RY', 'LX', 'LY'])
+    h = np.sqrt(0.5)
+    assert np.allclose(vis, [[h*(I + Q + U*1j + V),
+                              h*(U + V*1j + I*1j - Q*1j),
+                              h*(I + Q - U*1j - V),
+                              h*(U + V*1j - I*1j + Q*1j)]])
+
+    # And back again
+    result = np_stokes_convert(vis, ['RX', 'RY', 'LX', 'LY'], schema)
+    assert result.dtype == np.float64
+    assert np.allclose(result, stokes)
+
+    # Correlations in one basis to another
+    linear = np_stokes_convert(stokes, schema, ['XX', 'XY', 'YX', 'YY'])
+    circular = np_stokes_convert(stokes, schema, ['RR', 'RL', 'LR', 'LL'])
+    result = np_stokes_convert(linear, ['XX', 'XY', 'YX', 'YY'],
+                               ['RR', 'RL', 'LR', 'LL'])
+    assert np.allclose(result, circular)
+
+    # Generic feeds with supplied bases
+    vis = np_stokes_convert(stokes, schema, ['PP', 'PQ', 'QP', 'QQ'],
+                            feed_bases={'P': [1, 0], 'Q': [0, 1]})
+    assert np.all(vis == linear)
+
+    # P and Q feeds have no default basis
+    with pytest.raises(ValueError):
+        np_stokes_convert(linear, ['XX', 'XY', 'YX', 'YY'], ['PP'])
+
+    with pytest.raises(MissingConversionInputs):
+        np_stokes_convert(linear[:, [0, 3]], ['XX', 'YY'], ['U'])
+
+    with pytest.raises(ValueError):
+        np_stokes_convert(linear, ['XX', 'XY', 'YX', 'YY'], ['Ptotal'])
+
+
+def test_stokes_kernel_cache():
+    from africanus.stokes.stokes_conversion import (_KERNEL_CACHE_SIZE,
+                                                    _stokes_convert_kernel,
+                                                    stokes_convert_setup)
+
+    stokes = np.random.random((10, 4))
+    schema = ['I', 'Q', 'U', 'V']
+
+    def _kernel(angle):
+        # Each rotated feed basis produces a distinct kernel
+        bases = {'P': [np.cos(angle), np.sin(angle)],
+                 'Q': [-np.sin(angle), np.cos(angle)]}
+        mapping = stokes_convert_setup(stokes, schema, ['PP', 'QQ'],
+                                       feed_bases=bases)[0]
+        return _stokes_convert_kernel(mapping)
+
+    kernel = _kernel(0.1)
+    assert kernel is _kernel(0.1)
+
+    # Least recently used kernels are evicted
+    for i in range(_KERNEL_CACHE_SIZE):
+        _kernel(0.2 + i*0.01)
+
+    assert kernel is not _kernel(0.1)
@@ -11,6 +11,9 @@ import re
 import numpy as np
 from six.moves import range
 
+from .code import memoize_on_key
+from .requirements import requires_optional
+
 
 class FitsAxes(object):
     """
@@ -33,6 +36,42 @@ class FitsAxes(object):
                        for n in axr]
 
 
+_IRREGULAR_GRID_RE = re.compile(r"^G(?P<ctype>.+?)(?P<index>\d+)$")
+
+
+def _irregular_grid_values(header, ctypes):
+    """
+    Extracts the ``G<CTYPE><index>`` irregular grid values
+    of each axis in a single pass over the ``header``.
+
+    Returns
+    -------
+    list of dict
+        Maps the FORTRAN index of each grid point
+        to its value, for each axis in ``ctypes``.
+    """
+    values = [{} for _ in ctypes]
+
+    if len(ctypes) == 0:
+        return values
+
+    axes = {}
+
+    for i, ctype in enumerate(ctypes):
+        axes.setdefault(ctype, []).append(i)
+
+    for key, value in header.items():
+        match = _IRREGULAR_GRID_RE.match(key)
+
+        if match is None or value is None:
+            continue
+
+        for i in axes.get(match.group("ctype"), ()):
+            values[i][int(match.group("index"))] = value
+
+    return values
+
+
 class BeamAxes(FitsAxes):
     """
     Describes the FITS axes of a BEAM cube.
@@ -54,13 +93,11 @@ class BeamAxes(FitsAxes):
 
         # Check for custom irregular grid format.
         # Currently only implemented for FREQ dimension.
-        irregular_grid = np.asarray([
-            [header.get('G%s%d' % (self._ctype[i], j), None)
-             for j in range(1, self._naxis[i]+1)]
-            for i in range(self._ndims)])
+        irregular_grid = _irregular_grid_values(header, self._ctype)
 
         # Irregular grids are only valid if values exist for all grid points
-        self._irreg = [all(x is not None for x in irregular_grid[i])
+        self._irreg = [all(j in irregular_grid[i]
+                           for j in range(1, self._naxis[i]+1))
                        for i in range(self._ndims)]
 
         def _regular_grid(i):
@@ -70,7 +107,8 @@ class BeamAxes(FitsAxes):
 
         # Set up the grid
         self._grid = [_regular_grid(i) if not self._irreg[i]
-                      else np.asarray(irregular_grid[i])
+                      else np.asarray([irregular_grid[i][j] for j
+                                       in range(1, self._naxis[i]+1)])
                       for i in range(self._ndims)]
 
         self._sign = [1.0]*self._ndims
@@ -125,36 +163,19 @@ class BeamAxes(FitsAxes):
         return self._sign
 
 
-def beam_grids(header):
-    """
-    Extracts the FITS indices and grids for the beam dimensions
-    in the supplied FITS ``header``.
-    Specifically the axes specified by
-
-    1. ``L`` or ``X`` CTYPE
-    2. ``M`` or ``Y`` CTYPE
-    3. ``FREQ`` CTYPE
+# Number of FITS headers whose beam grids are cached
+_GRID_CACHE_SIZE = 16
 
-    If the first two axes have a negative sign, such as ``-L``, the grid
-    will be inverted.
 
-    Any grids corresponding to axes with a CUNIT type of ``DEG``
-    will be converted to radians.
+def _readonly(array):
+    array.flags.writeable = False
+    return array
 
-    Parameters
-    ----------
-    header : :class:`~astropy.io.fits.Header` or dict
-        FITS header object.
 
-    Returns
-    -------
-    tuple
-        Returns
-        ((l_axis, l_grid), (m_axis, m_grid), (freq_axis, freq_grid))
-        where the axis is the FORTRAN indexed FITS axis (1-indexed)
-        and grid contains the values at each pixel along the axis.
-    """
-    beam_axes = BeamAxes(header)
+@memoize_on_key(lambda cards: cards, maxsize=_GRID_CACHE_SIZE)
+def _beam_grids(cards):
+    """ Extracts beam grids from a tuple of ``(keyword, value)`` cards """
+    beam_axes = BeamAxes(dict(cards))
 
     l = m = freq = None
 
@@ -190,7 +211,45 @@ def beam_grids(header):
     l_grid = np.flipud(l_grid) if l_sign == -1.0 else l_grid
     m_grid = np.flipud(m_grid) if m_sign == -1.0 else m_grid
 
-    return ((l+1, l_grid), (m+1, m_grid), (freq+1, freq_grid))
+    return ((l+1, _readonly(l_grid)), (m+1, _readonly(m_grid)),
+            (freq+1, _readonly(freq_grid)))
+
+
+def beam_grids(header):
+    """
+    Extracts the FITS indices and grids for the beam dimensions
+    in the supplied FITS ``header``.
+    Specifically the axes specified by
+
+    1. ``L`` or ``X`` CTYPE
+    2. ``M`` or ``Y`` CTYPE
+    3. ``FREQ`` CTYPE
+
+    If the first two axes have a negative sign, such as ``-L``, the grid
+    will be inverted.
+
+    Any grids corresponding to axes with a CUNIT type of ``DEG``
+    will be converted to radians.
+
+    Grids are cached on the header's cards, so that repeated calls
+    with the same header return the same read-only grids.
+
+    Parameters
+    ----------
+    header : :class:`~astropy.io.fits.Header` or dict
+        FITS header object.
+
+    Returns
+    -------
+    tuple
+        Returns
+        ((l_axis, l_grid), (m_axis, m_grid), (freq_axis, freq_grid))
+        where the axis is the FORTRAN indexed FITS axis (1-indexed)
+        and grid contains the values at each pixel along the axis.
+    """
+    # Accessing header values is expensive (e.g. astropy parses them),
+    # so read the cards once, both to key the cache and extract the grids
+    return _beam_grids(tuple(header.items()))
 
 
 class FitsFilenameTemplate(string.Template):
@@ -282,3 +341,213 @@ def beam_filenames(filename_schema, polarisation_type):
 
     return OrderedDict((c, _re_im_filenames(c, template))
                        for c in CORRELATIONS)
+
+
+# Default number of decoded frequency planes cached by a FitsBeam
+_PLANE_CACHE_SIZE = 16
+
+
+class FitsBeam(object):
+    """
+    Beam cube backed by the real and imaginary FITS images of
+    each correlation, as described by
+    :func:`~africanus.util.beams.beam_filenames`.
+
+    The FITS images are memory-mapped and frequency planes are only
+    read and decoded into complex :code:`(beam_lw, beam_mh, 2, 2)`
+    arrays when requested. The most recently used decoded planes
+    are cached.
+
+    .. code-block:: python
+
+        beam = FitsBeam("beam_$(corr)_$(reim).fits")
+        cube, l_grid, m_grid, freq_grid = beam.cube(frequency)
+
+        ddes = beam_cube_dde(cube, coords, l_grid, m_grid, freq_grid)
+
+    Beam values are flipped along the L and M axes whose grids are
+    flipped by :func:`~africanus.util.beams.beam_grids`,
+    so that they match the grids.
+
+    Parameters
+    ----------
+    filename_schema : str
+        Filename schema, for example ``beam_$(corr)_$(reim).fits``.
+    polarisation_type : {'linear', 'circular'}, optional
+        Polarisation type. Defaults to ``'linear'``.
+    cache_size : int, optional
+        Maximum number of decoded frequency planes to cache.
+    """
+    @requires_optional('astropy')
+    def __init__(self, filename_schema, polarisation_type='linear',
+                 cache_size=_PLANE_CACHE_SIZE):
+        from astropy.io import fits
+
+        self._filenames = beam_filenames(filename_schema, polarisation_type)
+        self._hdu_lists = []
+
+        try:
+            for re_file, im_file in self._filenames.values():
+                self._hdu_lists.append(fits.open(re_file, memmap=True))
+                self._hdu_lists.append(fits.open(im_file, memmap=True))
+        except Exception:
+            self.close()
+            raise
+
+        # Primary HDUs of the (re, im) images of each correlation
+        hdus = [hdu_list[0] for hdu_list in self._hdu_lists]
+        self._hdus = list(zip(hdus[::2], hdus[1::2]))
+        header = hdus[0].header
+
+        if not all(hdu.header['NAXIS'] == header['NAXIS'] and
+                   hdu.data.shape == hdus[0].data.shape for hdu in hdus):
+            self.close()
+            raise ValueError("FITS beam images have differing shapes")
+
+        (l_ax, l_grid), (m_ax, m_grid), (f_ax, freq_grid) = beam_grids(header)
+        beam_axes = BeamAxes(header)
+
+        self._l_grid = l_grid
+        self._m_grid = m_grid
+        self._freq_grid = freq_grid
+
+        # Index each frequency plane of the (reversed) FITS axes,
+        # selecting the first element of any other axes
+        ndim = header['NAXIS']
+        self._index = [0]*ndim
+        self._index[ndim - l_ax] = slice(None)
+        self._index[ndim - m_ax] = slice(None)
+        self._f_dim = ndim - f_ax
+
+        # Planes are read as (m, l) if the L axis is faster varying
+        self._transpose = l_ax < m_ax
+        self._flip = (beam_axes.sign[l_ax - 1] == -1.0,
+                      beam_axes.sign[m_ax - 1] == -1.0)
+
+        single = all(hdu.header['BITPIX'] == -32 for hdu in hdus)
+        self._dtype = np.dtype(np.complex64 if single else np.complex128)
+
+        self._plane = memoize_on_key(lambda f: f, maxsize=cache_size)(
+                                     self._read_plane)
+
+    def _read_plane(self, f):
+        """ Reads and decodes frequency plane ``f`` """
+        index = list(self._index)
+        index[self._f_dim] = f
+        index = tuple(index)
+
+        plane = np.empty(self.shape[:2] + (4,), dtype=self._dtype)
+
+        for c, (re_hdu, im_hdu) in enumerate(self._hdus):
+            data = re_hdu.data[index] + 1j*im_hdu.data[index]
+
+            if self._transpose:
+                data = data.T
+
+            plane[:, :, c] = data
+
+        if self._flip[0]:
+            plane = plane[::-1, :]
+
+        if self._flip[1]:
+            plane = plane[:, ::-1]
+
+        plane = np.ascontiguousarray(plane).reshape(self.shape[:2] + (2, 2))
+        # Shared between callers by the cache
+        plane.flags.writeable = False
+        return plane
+
+    def plane(self, f):
+        """
+        Returns the decoded complex frequency plane ``f``
+        of shape :code:`(beam_lw, beam_mh, 2, 2)`.
+        """
+        if not 0 <= f < self.shape[2]:
+            raise IndexError("Frequency plane %d is out of range [0, %d)"
+                             % (f, self.shape[2]))
+
+        return self._plane(int(f))
+
+    def frequency_planes(self, frequency):
+        """
+        Returns the indices of the frequency planes required to
+        interpolate the beam at each of the ``frequency`` values.
+        """
+        frequency = np.asarray(frequency)
+        nplanes = self._freq_grid.size
+
+        if nplanes == 1:
+            return np.zeros(1, dtype=np.intp)
+
+        # Planes bracketing each frequency.
+        # Edge planes extrapolate frequencies outside the grid
+        order = np.argsort(self._freq_grid)
+        upper = np.searchsorted(self._freq_grid[order], frequency.ravel())
+        upper = np.clip(upper, 1, nplanes - 1)
+
+        return np.unique(order[np.concatenate([upper - 1, upper])])
+
+    def cube(self, frequency=None):
+        """
+        Assembles a complex beam cube from the frequency planes
+        required to interpolate the beam at ``frequency``.
+
+        Parameters
+        ----------
+        frequency : :class:`numpy.ndarray`, optional
+            Frequencies at which the beam will be sampled.
+            If ``None``, all frequency planes are assembled.
+
+        Returns
+        -------
+        tuple
+            ``(beam, l_grid, m_grid, freq_grid)`` where ``beam``
+            has shape :code:`(beam_lw, beam_mh, beam_nud, 2, 2)`
+            and ``freq_grid`` contains the frequencies of the
+            assembled planes.
+        """
+        if frequency is None:
+            planes = np.arange(self.shape[2])
+        else:
+            planes = self.frequency_planes(frequency)
+
+        beam = np.stack([self.plane(f) for f in planes], axis=2)
+        return beam, self._l_grid, self._m_grid, self._freq_grid[planes]
+
+    def close(self):
+        """ Closes the FITS images """
+        for hdu_list in self._hdu_lists:
+            hdu_list.close()
+
+        self._hdu_lists = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, evalue, etraceback):
+        self.close()
+
+    @property
+    def filenames(self):
+        return self._filenames
+
+    @property
+    def shape(self):
+        return (self._l_grid.size, self._m_grid.size,
+                self._freq_grid.size, 2, 2)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def l_grid(self):
+        return self._l_grid
+
+    @property
+    def m_grid(self):
+        return self._m_grid
+
+    @property
+    def freq_grid(self):
+        return self._freq_grid
@@ -7,11 +7,11 @@ from __future__ import print_function
 
 import ast
 
-import __builtin__
+from ..compatibility import builtins
 
 # builtin function whitelist
 _BUILTIN_WHITELIST = frozenset(['slice'])
-_missing = _BUILTIN_WHITELIST.difference(dir(__builtin__))
+_missing = _BUILTIN_WHITELIST.difference(dir(builtins))
 if len(_missing) > 0:
     raise ValueError("'%s' are not valid builtin functions.'" % list(_missing))
 
@@ -72,7 +72,7 @@ def parse_python_assigns(assign_str):
             else:
                 kwargs = {}
 
-            return getattr(__builtin__, func_name)(*args, **kwargs)
+            return getattr(builtins, func_name)(*args, **kwargs)
         # Try a literal eval
         else:
             return ast.literal_eval(stmt_value)
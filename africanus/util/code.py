@@ -4,6 +4,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from collections import OrderedDict
 from functools import wraps
 
 try:
@@ -85,11 +86,23 @@ class memoize_on_key(object):
                                          freq_type=_type_map[frequency.dtype],
                                          ncorrs=ncorrs)
             return cp.RawKernel(code, "phase_delay")
+
+    If ``maxsize`` is supplied, the least recently used entry
+    is evicted when the cache holds more than ``maxsize`` entries.
+
+    Parameters
+    ----------
+    key_fn : callable
+        Produces a hashable key from the decorated function's arguments
+    maxsize : int, optional
+        Maximum (positive) number of cached entries.
+        Defaults to ``None``, in which case the cache is unbounded.
     """
-    def __init__(self, key_fn):
+    def __init__(self, key_fn, maxsize=None):
         self._key_fn = key_fn
+        self._maxsize = maxsize
         self._lock = Lock()
-        self._cache = {}
+        self._cache = OrderedDict()
 
     def __call__(self, fn):
         @wraps(fn)
@@ -98,9 +111,23 @@ class memoize_on_key(object):
 
             with self._lock:
                 try:
-                    return self._cache[key]
+                    entry = self._cache.pop(key)
                 except KeyError:
-                    self._cache[key] = entry = fn(*args, **kwargs)
-                    return entry
+                    entry = fn(*args, **kwargs)
+
+                    # Evict the least recently used entry
+                    if (self._maxsize is not None and
+                            len(self._cache) >= self._maxsize):
+                        self._cache.popitem(last=False)
+
+                # Most recently used entries are at the end
+                self._cache[key] = entry
+                return entry
+
+        def cache_clear():
+            with self._lock:
+                self._cache.clear()
+
+        wrapper.cache_clear = cache_clear
 
         return wrapper
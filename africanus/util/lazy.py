@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module whose public attributes are imported from
+    their submodules when they are first accessed.
+    """
+    def __init__(self, name, attributes):
+        super(LazyModule, self).__init__(name)
+        self.__dict__['_lazy_attributes'] = attributes
+
+    def _resolve(self, attr):
+        module = importlib.import_module(self._lazy_attributes[attr],
+                                         self.__name__)
+        return getattr(module, attr)
+
+    def __getattr__(self, attr):
+        if attr not in self.__dict__.get('_lazy_attributes', ()):
+            raise AttributeError("module '%s' has no attribute '%s'" %
+                                 (self.__name__, attr))
+
+        value = self._resolve(attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __setattr__(self, attr, value):
+        # Importing a submodule binds it on this module.
+        # Preserve the attribute, if the submodule shares its name
+        if (attr in self._lazy_attributes and
+                isinstance(value, types.ModuleType) and
+                value.__name__ == '.'.join((self.__name__, attr))):
+            value = getattr(value, attr)
+
+        self.__dict__[attr] = value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazy_attributes))
+
+
+def lazy_module(name, attributes):
+    """
+    Replaces module ``name`` in :data:`sys.modules` with a
+    :class:`LazyModule`, which imports ``attributes``
+    from their submodules when they are first accessed.
+    Should be called at the end of a package's ``__init__.py``:
+
+    .. code-block:: python
+
+        lazy_module(__name__, {'predict_vis': '.predict'})
+
+    Parameters
+    ----------
+    name : str
+        Module name
+    attributes : dict
+        Maps attribute names to the (relative)
+        name of the module defining them.
+    """
+    module = sys.modules[name]
+    lazy = LazyModule(name, attributes)
+    lazy.__dict__.update((k, v) for k, v in module.__dict__.items()
+                         if k != '__class__')
+    lazy.__dict__['__all__'] = sorted(attributes)
+    sys.modules[name] = lazy
@@ -12,11 +12,6 @@ from decorator import decorate
 
 from .docs import on_rtd
 
-try:
-    import pytest
-except ImportError:
-    pass
-
 
 log = logging.getLogger(__name__)
 
@@ -93,6 +88,7 @@ def requires_optional(*requirements):
             def _wrapper(f, *args, **kwargs):
                 """ Empty docstring """
                 if getattr(sys, "_called_from_test", False):
+                    import pytest
                     pytest.skip("Missing requirements %s" %
                                 missing_requirements)
                 else:
@@ -6,6 +6,8 @@ from __future__ import print_function
 
 from collections import Sequence
 
+import numpy as np
+
 
 def aggregate_chunks(chunks, max_chunks):
     """
@@ -115,3 +117,173 @@ def corr_shape(ncorr, corr_shape):
             raise ValueError("ncorr not in (1, 2, 4)")
     else:
         raise ValueError("corr_shape must be 'flat' or 'matrix'")
+
+
+# Dimensions chunked by plan_chunks
+_PLANNED_DIMS = ("row", "time", "chan")
+
+
+def _cost_coefficients(arrays):
+    """
+    Returns the per-task bytes of ``arrays`` as coefficients of
+    :code:`rows*(r0 + r1*chans) + times*(t0 + t1*chans) + (c0 + c1*chans)`
+    """
+    coeffs = {(d, c): 0 for d in ("row", "time", None) for c in (0, 1)}
+
+    for name, (shape, dtype) in arrays.items():
+        planned = [d for d in shape if d in _PLANNED_DIMS]
+
+        if len(set(planned)) != len(planned):
+            raise ValueError("Array '%s' has a repeated dimension in %s"
+                             % (name, shape))
+
+        if "row" in planned and "time" in planned:
+            raise ValueError("Array '%s' has both row and time dimensions. "
+                             "These are chunked together and cannot be "
+                             "planned independently." % name)
+
+        nbytes = np.dtype(dtype).itemsize
+
+        for d in shape:
+            if d not in _PLANNED_DIMS:
+                nbytes *= d
+
+        if "row" in planned:
+            outer = "row"
+        elif "time" in planned:
+            outer = "time"
+        else:
+            outer = None
+
+        coeffs[(outer, int("chan" in planned))] += nbytes
+
+    return coeffs
+
+
+def _chan_chunks(nchan, chan_size):
+    nfull, rem = divmod(nchan, chan_size)
+    return (chan_size,)*nfull + ((rem,) if rem > 0 else ())
+
+
+def plan_chunks(time_counts, nchan, arrays, memory_budget):
+    """
+    Plans the ``row``, ``time`` and ``chan`` chunks of ``arrays``
+    so that the inputs and outputs of each task fit within
+    ``memory_budget`` bytes, using the fewest tasks.
+
+    Rows are chunked along with the timesteps that they reference
+    so that unique timesteps are never split across row chunks,
+    as required by :func:`africanus.rime.dask.predict_vis`.
+
+    .. code-block:: python
+
+        utime, time_index, counts = np.unique(time, return_inverse=True,
+                                              return_counts=True)
+
+        chunks = plan_chunks(counts, nchan, {
+            "time_index": (("row",), time_index.dtype),
+            "uvw": (("row", 3), np.float64),
+            "vis": (("row", "chan", 2, 2), np.complex128),
+            "dde_jones": ((nsrc, "time", na, "chan", 2, 2), np.complex128),
+        }, memory_budget=512*1024**2)
+
+        time_index = da.from_array(time_index, chunks=chunks["time_index"])
+
+    Parameters
+    ----------
+    time_counts : sequence of ints
+        Number of rows associated with each unique timestep,
+        in row order.
+    nchan : int
+        Number of channels
+    arrays : dict
+        Maps array names to a ``(shape, dtype)`` tuple.
+        ``shape`` contains the ``"row"``, ``"time"`` or ``"chan"``
+        dimensions to be planned, or integer dimension sizes which
+        are not chunked. An array may not contain both
+        a ``"row"`` and a ``"time"`` dimension.
+    memory_budget : int
+        Maximum number of bytes occupied by the chunks of
+        ``arrays`` within a single task.
+
+    Returns
+    -------
+    dict
+        Maps array names to dask chunks.
+
+    Raises
+    ------
+    ValueError
+        If the chunks of a single timestep and channel
+        do not fit within ``memory_budget``.
+    """
+    counts = np.asarray(time_counts, dtype=np.int64)
+
+    if counts.ndim != 1 or counts.size == 0 or np.any(counts <= 0):
+        raise ValueError("time_counts must be a non-empty sequence "
+                         "of positive row counts")
+
+    if nchan <= 0:
+        raise ValueError("nchan must be positive")
+
+    coeffs = _cost_coefficients(arrays)
+    ntime = counts.size
+    cum_rows = np.concatenate([[0], np.cumsum(counts)])
+    steps = np.arange(ntime + 1)
+
+    def _time_chunks(chans):
+        """ Greedily packs timesteps into chunks of ``chans`` channels """
+        row_cost = coeffs[("row", 0)] + coeffs[("row", 1)]*chans
+        time_cost = coeffs[("time", 0)] + coeffs[("time", 1)]*chans
+        budget = memory_budget - coeffs[(None, 0)] - coeffs[(None, 1)]*chans
+
+        # Bytes of the first t timesteps, increasing with t
+        cost = cum_rows*row_cost + steps*time_cost
+        bounds = [0]
+
+        while bounds[-1] < ntime:
+            start = bounds[-1]
+            end = np.searchsorted(cost, cost[start] + budget,
+                                  side='right') - 1
+
+            if end <= start:
+                return None
+
+            bounds.append(end)
+
+        return np.diff(bounds)
+
+    best = None
+
+    # Try each distinct channel chunk size, largest first
+    chan_sizes = sorted(set(-(-nchan // n) for n in range(1, nchan + 1)),
+                        reverse=True)
+
+    for chans in chan_sizes:
+        time_chunks = _time_chunks(chans)
+
+        if time_chunks is None:
+            continue
+
+        chan_chunks = _chan_chunks(nchan, chans)
+        ntasks = len(time_chunks)*len(chan_chunks)
+
+        if best is None or ntasks < best[0]:
+            best = (ntasks, chan_chunks, time_chunks)
+
+    if best is None:
+        raise ValueError("The chunks of a single timestep and channel "
+                         "do not fit within a memory budget of %d bytes"
+                         % memory_budget)
+
+    _, chan_chunks, time_chunks = best
+    bounds = np.concatenate([[0], np.cumsum(time_chunks)])
+    planned = {
+        "row": tuple(np.diff(cum_rows[bounds]).tolist()),
+        "time": tuple(time_chunks.tolist()),
+        "chan": chan_chunks,
+    }
+
+    return {name: tuple(planned[d] if d in _PLANNED_DIMS else (d,)
+                        for d in shape)
+            for name, (shape, _) in arrays.items()}
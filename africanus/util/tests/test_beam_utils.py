@@ -219,3 +219,82 @@ def test_inverse_interp():
     interp = interp1d(values, grid, bounds_error=False,
                       fill_value='extrapolate')
     assert np.all(initial == np.stack((values, interp(values))))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_fits_beam(fits_header, tmpdir, dtype):
+    fits = pytest.importorskip("astropy.io.fits")
+    from africanus.util.beams import FitsBeam, beam_filenames
+
+    nl, nm, nfreq = 9, 11, 5
+    header = fits.Header([(k, v) for k, v in fits_header.items()
+                          if k not in ("SIMPLE", "BITPIX", "EXTEND")
+                          and not k.startswith("NAXIS")])
+
+    schema = str(tmpdir.join("beam_$(corr)_$(reim).fits"))
+    filenames = beam_filenames(schema, "linear")
+
+    # FITS data has reversed (freq, m, l) axes
+    data = {}
+
+    for corr, (re, im) in filenames.items():
+        data[corr] = (np.random.random((nfreq, nm, nl)) +
+                      np.random.random((nfreq, nm, nl))*1j)
+        fits.PrimaryHDU(data[corr].real.astype(dtype), header).writeto(re)
+        fits.PrimaryHDU(data[corr].imag.astype(dtype), header).writeto(im)
+
+    # (l, m, freq, corr) with M flipped, matching the -M grid
+    expected = np.stack([data[c].transpose(2, 1, 0) for c in filenames],
+                        axis=3)[:, ::-1, :, :].reshape(nl, nm, nfreq, 2, 2)
+
+    with FitsBeam(schema, "linear") as beam:
+        cdtype = np.complex64 if dtype == np.float32 else np.complex128
+        assert beam.dtype == cdtype
+        assert beam.shape == (nl, nm, nfreq, 2, 2)
+
+        cube, l_grid, m_grid, freq_grid = beam.cube()
+        assert cube.shape == beam.shape
+        assert cube.dtype == cdtype
+        assert np.allclose(cube, expected.astype(cdtype))
+
+        gfreqs = [fits_header['GFREQ%d' % (f + 1)] for f in range(nfreq)]
+        assert np.allclose(freq_grid, gfreqs)
+
+        # Decoded planes are cached
+        assert beam.plane(2) is beam.plane(2)
+
+        # Only the planes bracketing the frequencies are assembled
+        frequency = np.array([(gfreqs[1] + gfreqs[2]) / 2, gfreqs[0] - 1e6])
+        assert np.all(beam.frequency_planes(frequency) == [0, 1, 2])
+
+        cube, _, _, freq_grid = beam.cube(frequency[:1])
+        assert np.allclose(cube, expected[:, :, 1:3])
+        assert np.allclose(freq_grid, gfreqs[1:3])
+
+        with pytest.raises(IndexError):
+            beam.plane(nfreq)
+
+
+def test_beam_grids_cache(fits_header):
+    from africanus.util.beams import beam_grids
+
+    grids = beam_grids(fits_header)
+
+    # Identical headers return the same read-only grids
+    assert beam_grids(fits_header.copy()) is grids
+
+    for _, grid in grids:
+        assert not grid.flags.writeable
+
+    # A changed header produces new grids
+    header = fits_header.copy()
+    header['GFREQ1'] = 1400000000.0
+    (_, _, (_, freq_grid)) = beam_grids(header)
+    assert freq_grid[0] == 1400000000.0
+    assert np.all(freq_grid[1:] == grids[2][1][1:])
+
+    # Incomplete irregular grids fall back to the regular grid
+    del header['GFREQ33']
+    (_, _, (_, freq_grid)) = beam_grids(header)
+    assert np.all(freq_grid == fits_header['CRVAL3'] +
+                  np.arange(33)*fits_header['CDELT3'])
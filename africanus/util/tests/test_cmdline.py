@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `codex-africanus` package."""
+
+
+def test_parse_python_assigns():
+    from africanus.util.cmdline import parse_python_assigns
+
+    data = parse_python_assigns("beta=5.6; l=[2, 3]; s=slice(1, 2)")
+    assert data == {'beta': 5.6, 'l': [2, 3], 's': slice(1, 2)}
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `codex-africanus` package."""
+
+
+def test_memoize_on_key_lru():
+    from africanus.util.code import memoize_on_key
+
+    calls = []
+
+    @memoize_on_key(lambda a, b=0: (a, b), maxsize=2)
+    def fn(a, b=0):
+        calls.append((a, b))
+        return [a, b]
+
+    assert fn(1) is fn(1, b=0)
+    assert calls == [(1, 0)]
+
+    fn(2)
+    # Use (1, 0), making (2, 0) the least recently used entry
+    fn(1)
+    # Evicts (2, 0)
+    fn(3)
+    assert calls == [(1, 0), (2, 0), (3, 0)]
+
+    fn(1)
+    fn(2)
+    assert calls == [(1, 0), (2, 0), (3, 0), (2, 0)]
+
+    fn.cache_clear()
+    fn(1)
+    assert calls[-1] == (1, 0)
+    assert len(calls) == 5
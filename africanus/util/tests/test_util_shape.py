@@ -40,3 +40,84 @@ def test_aggregate_chunks():
 
     chunks, max_c = (5, 5, 5), 5
     assert aggregate_chunks(chunks, max_c) == chunks
+
+
+def test_plan_chunks():
+    import numpy as np
+    from africanus.util.shapes import plan_chunks
+
+    rs = np.random.RandomState(42)
+    counts = rs.randint(1, 20, size=50)
+    nchan, nsrc, na = 16, 3, 7
+
+    arrays = {
+        "time_index": (("row",), np.int32),
+        "uvw": (("row", 3), np.float64),
+        "vis": (("row", "chan", 2, 2), np.complex128),
+        "dde_jones": ((nsrc, "time", na, "chan", 2, 2), np.complex64),
+        "frequency": (("chan",), np.float64),
+    }
+
+    def task_bytes(r, t, c):
+        extents = {"row": r, "time": t, "chan": c}
+        total = 0
+
+        for name, (shape, dtype) in arrays.items():
+            n = np.dtype(dtype).itemsize
+
+            for d in shape:
+                n *= extents.get(d, d)
+
+            total += n
+
+        return total
+
+    budget = task_bytes(counts.max()*4, 4, 8)
+    chunks = plan_chunks(counts, nchan, arrays, budget)
+
+    row_chunks = chunks["time_index"][0]
+    time_chunks = chunks["dde_jones"][1]
+    chan_chunks = chunks["vis"][1]
+
+    assert chunks["uvw"] == (row_chunks, (3,))
+    assert chunks["vis"] == (row_chunks, chan_chunks, (2,), (2,))
+    assert chunks["dde_jones"] == ((nsrc,), time_chunks, (na,),
+                                   chan_chunks, (2,), (2,))
+    assert chunks["frequency"] == (chan_chunks,)
+    assert sum(row_chunks) == counts.sum()
+    assert sum(time_chunks) == counts.size
+    assert sum(chan_chunks) == nchan
+
+    # Row chunks contain all rows of their timesteps
+    bounds = np.cumsum((0,) + time_chunks)
+    assert row_chunks == tuple(np.add.reduceat(counts, bounds[:-1]))
+
+    # Each task fits within the budget
+    for r, t in zip(row_chunks, time_chunks):
+        assert task_bytes(r, t, max(chan_chunks)) <= budget
+
+    # No channel chunking produces fewer tasks
+    ntasks = len(time_chunks)*len(chan_chunks)
+
+    for c in range(1, nchan + 1):
+        if task_bytes(counts.max(), 1, c) > budget:
+            continue
+
+        # Greedy packing of timesteps
+        r = t = 0
+        n = 1
+
+        for count in counts:
+            if task_bytes(r + count, t + 1, c) > budget:
+                r, t, n = 0, 0, n + 1
+
+            r, t = r + count, t + 1
+
+        assert ntasks <= n*-(-nchan // c)
+
+    with pytest.raises(ValueError, match="do not fit"):
+        plan_chunks(counts, nchan, arrays, task_bytes(1, 1, 1))
+
+    with pytest.raises(ValueError, match="both row and time"):
+        plan_chunks(counts, nchan, {"bad": (("row", "time"), np.int32)},
+                    budget)
@@ -5,21 +5,28 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-try:
-    from dask.array import Array as dask_array
-except ImportError:
-    dask_array = object()
+import sys
 
 import numba
 import numpy as np
 
 
+def _is_dask_array(arg):
+    # Avoid importing dask, arg can't be a dask array if it isn't loaded
+    if 'dask.array' not in sys.modules:
+        return False
+
+    from dask.array import Array
+
+    return isinstance(arg, Array)
+
+
 def _numpy_dtype(arg):
     if isinstance(arg, np.ndarray):
         return arg.dtype
     elif isinstance(arg, numba.types.npytypes.Array):
         return np.dtype(arg.dtype.name)
-    elif isinstance(arg, dask_array):
+    elif _is_dask_array(arg):
         return arg.dtype
     else:
         raise ValueError("Unhandled type %s" % type(arg))
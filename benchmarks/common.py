@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Helpers shared by the `airspeed velocity <https://asv.readthedocs.io>`_
+benchmarks. Besides the ``time_*`` and ``peakmem_*`` benchmarks, each
+suite tracks throughput and the time taken to compile its
+:mod:`numba` kernels, which is excluded from the other benchmarks
+by calling the kernels once during ``setup``.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import timeit
+
+import numba
+import numpy as np
+
+
+def rf(*a, **kw):
+    return np.random.random(*a, **kw)
+
+
+def rc(*a, **kw):
+    return rf(*a, **kw) + 1j*rf(*a, **kw)
+
+
+def throughput(fn, items, repeat=3):
+    """
+    Returns the number of ``items`` processed
+    per second by the best of ``repeat`` calls to ``fn``.
+    """
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    return items / best
+
+
+def compile_time(dispatcher, *args):
+    """
+    Returns the time taken to compile a fresh, uncached copy of the
+    numba ``dispatcher`` for the types of ``args``.
+    """
+    options = dict(dispatcher.targetoptions)
+
+    if dispatcher._impl_kind == 'generated':
+        jitter = numba.generated_jit(**options)
+    else:
+        jitter = numba.jit(**options)
+
+    fresh = jitter(dispatcher.py_func)
+    signature = tuple(numba.typeof(a) for a in args)
+
+    start = timeit.default_timer()
+    fresh.compile(signature)
+    return timeit.default_timer() - start
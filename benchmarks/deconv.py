@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from .common import throughput, compile_time
+
+
+class HogbomClean(object):
+    params = ([65, 129], [100])
+    param_names = ['npix', 'niter']
+
+    def setup(self, npix, niter):
+        from africanus.deconv.hogbom.clean import hogbom_clean, find_peak
+
+        # Gaussian PSF and a dirty image of a few point sources
+        x = np.arange(-npix, npix)
+        psf = np.exp(-(x[:, None]**2 + x[None, :]**2) / 8.0)
+        model = np.zeros((npix, npix))
+        points = np.random.randint(0, npix, size=(2, 10))
+        model[points[0], points[1]] = np.random.random(10)
+        dirty = np.fft.irfft2(np.fft.rfft2(model, psf.shape) *
+                              np.fft.rfft2(np.fft.ifftshift(psf)),
+                              psf.shape)[:npix, :npix]
+
+        self.hogbom_clean = hogbom_clean
+        self.find_peak = find_peak
+        self.dirty = dirty
+        self.psf = psf
+        self.niter = niter
+        self.run()
+
+    def run(self):
+        return self.hogbom_clean(self.dirty, self.psf,
+                                 threshold=0.0, niter=self.niter)
+
+    def time_hogbom_clean(self, *args):
+        self.run()
+
+    def peakmem_hogbom_clean(self, *args):
+        self.run()
+
+    def track_throughput(self, npix, niter):
+        # Pixels updated per second
+        return throughput(self.run, npix*npix*niter)
+
+    track_throughput.unit = "pixels/s"
+
+    def track_compile_time(self, *args):
+        return compile_time(self.find_peak, self.dirty)
+
+    track_compile_time.unit = "s"
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from .common import rf, throughput, compile_time
+
+
+class ImToVis(object):
+    params = ([100, 1000], [1000], [16])
+    param_names = ['pixels', 'rows', 'chans']
+
+    def setup(self, pixels, rows, chans):
+        from africanus.dft import im_to_vis
+        from africanus.dft.kernels import _im_to_vis_impl
+
+        self.im_to_vis = im_to_vis
+        self.im_to_vis_impl = _im_to_vis_impl
+        self.image = rf(size=(pixels, chans))
+        self.uvw = rf(size=(rows, 3))
+        self.lm = rf(size=(pixels, 2))*0.01
+        self.frequency = np.linspace(.856e9, .856e9*2, chans)
+        self.npoints = pixels*rows*chans
+        self.run()
+
+    def run(self):
+        return self.im_to_vis(self.image, self.uvw, self.lm, self.frequency)
+
+    def time_im_to_vis(self, *args):
+        self.run()
+
+    def peakmem_im_to_vis(self, *args):
+        self.run()
+
+    def track_throughput(self, *args):
+        return throughput(self.run, self.npoints)
+
+    track_throughput.unit = "pixels/s"
+
+    def track_compile_time(self, pixels, rows, chans):
+        vis = np.zeros((rows, chans), dtype=np.complex128)
+        return compile_time(self.im_to_vis_impl, self.image, self.uvw,
+                            self.lm, self.frequency, vis)
+
+    track_compile_time.unit = "s"
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from .common import rf, rc, throughput, compile_time
+
+
+class SimpleGridding(object):
+    params = ([10000], [16], [(1,), (2, 2)], [257, 1025], [3, 7], [7, 63])
+    param_names = ['rows', 'chans', 'corrs', 'npix',
+                   'half_support', 'oversampling']
+
+    def setup(self, rows, chans, corrs, npix, half_support, oversampling):
+        from africanus.constants import c as lightspeed
+        from africanus.filters import convolution_filter
+        from africanus.gridding.simple.gridding import (numba_grid,
+                                                        numba_degrid)
+
+        fcorrs = int(np.prod(corrs))
+
+        self.numba_grid = numba_grid
+        self.numba_degrid = numba_degrid
+        self.conv_filter = convolution_filter(half_support, oversampling,
+                                              "kaiser-bessel")
+        self.cell_size = 6
+        self.wavelengths = lightspeed / np.linspace(.856e9, .856e9*2, chans)
+        self.uvw = (rf(size=(rows, 3)) - .5)*npix
+        self.vis = rc((rows, chans) + corrs)
+        self.flags = np.zeros(self.vis.shape, dtype=np.uint8)
+        self.weights = np.ones(self.vis.shape, dtype=np.float64)
+        self.grid = np.zeros((npix, npix, fcorrs), dtype=self.vis.dtype)
+        self.degrid_vis = np.zeros((rows, chans, fcorrs),
+                                   dtype=self.vis.dtype)
+        self.weights_flat = self.weights.reshape(self.degrid_vis.shape)
+        self.nvis = rows*chans
+        self.run_grid()
+        self.run_degrid()
+
+    def grid_args(self):
+        return (self.vis, self.uvw, self.flags, self.weights,
+                self.wavelengths, self.conv_filter, self.cell_size,
+                self.grid)
+
+    def degrid_args(self):
+        return (self.grid, self.uvw, self.weights_flat, self.wavelengths,
+                self.conv_filter, self.cell_size, self.degrid_vis)
+
+    def run_grid(self):
+        return self.numba_grid(*self.grid_args())
+
+    def run_degrid(self):
+        return self.numba_degrid(*self.degrid_args())
+
+    def time_grid(self, *args):
+        self.run_grid()
+
+    def time_degrid(self, *args):
+        self.run_degrid()
+
+    def peakmem_grid(self, *args):
+        self.run_grid()
+
+    def peakmem_degrid(self, *args):
+        self.run_degrid()
+
+    def track_grid_throughput(self, *args):
+        return throughput(self.run_grid, self.nvis)
+
+    track_grid_throughput.unit = "visibilities/s"
+
+    def track_degrid_throughput(self, *args):
+        return throughput(self.run_degrid, self.nvis)
+
+    track_degrid_throughput.unit = "visibilities/s"
+
+    def track_grid_compile_time(self, *args):
+        return compile_time(self.numba_grid, *self.grid_args())
+
+    track_grid_compile_time.unit = "s"
+
+    def track_degrid_compile_time(self, *args):
+        return compile_time(self.numba_degrid, *self.degrid_args())
+
+    track_degrid_compile_time.unit = "s"
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from .common import rf, rc, throughput, compile_time
+
+
+class PhaseDelay(object):
+    params = ([10, 100], [10000], [64])
+    param_names = ['sources', 'rows', 'chans']
+
+    def setup(self, sources, rows, chans):
+        from africanus.rime import phase_delay
+
+        self.phase_delay = phase_delay
+        self.lm = rf(size=(sources, 2))*0.01
+        self.uvw = rf(size=(rows, 3))
+        self.frequency = np.linspace(.856e9, .856e9*2, chans)
+        self.run()
+
+    def run(self):
+        return self.phase_delay(self.lm, self.uvw, self.frequency)
+
+    def time_phase_delay(self, *args):
+        self.run()
+
+    def peakmem_phase_delay(self, *args):
+        self.run()
+
+    def track_throughput(self, sources, rows, chans):
+        return throughput(self.run, sources*rows*chans)
+
+    track_throughput.unit = "visibilities/s"
+
+    def track_compile_time(self, *args):
+        return compile_time(self.phase_delay, self.lm,
+                            self.uvw, self.frequency)
+
+    track_compile_time.unit = "s"
+
+
+class PredictVis(object):
+    params = ([10, 100], [10000], [16], [(1,), (2,), (2, 2)])
+    param_names = ['sources', 'rows', 'chans', 'corrs']
+
+    def setup(self, sources, rows, chans, corrs):
+        from africanus.rime import predict_vis
+
+        ants = 16
+        times = rows // (ants*(ants - 1) // 2) + 1
+
+        ant1, ant2 = np.triu_indices(ants, 1)
+        bl = np.arange(rows) % ant1.size
+
+        self.predict_vis = predict_vis
+        self.args = (np.arange(rows) // ant1.size, ant1[bl], ant2[bl],
+                     rc((sources, times, ants, chans) + corrs),
+                     rc((sources, rows, chans) + corrs),
+                     rc((sources, times, ants, chans) + corrs),
+                     rc((times, ants, chans) + corrs),
+                     None,
+                     rc((times, ants, chans) + corrs))
+        self.run()
+
+    def run(self):
+        return self.predict_vis(*self.args)
+
+    def time_predict_vis(self, *args):
+        self.run()
+
+    def peakmem_predict_vis(self, *args):
+        self.run()
+
+    def track_throughput(self, sources, rows, chans, corrs):
+        return throughput(self.run, sources*rows*chans)
+
+    track_throughput.unit = "visibilities/s"
+
+    def track_compile_time(self, *args):
+        return compile_time(self.predict_vis, *self.args)
+
+    track_compile_time.unit = "s"
+
+
+class BeamCubeDDE(object):
+    params = ([100, 1000], [16], [1, 3])
+    param_names = ['sources', 'chans', 'spline_order']
+
+    def setup(self, sources, chans, spline_order):
+        from africanus.rime import beam_cube_dde
+
+        beam_lw = beam_mh = 65
+        beam_nud = 32
+        times, ants = 4, 16
+
+        self.beam_cube_dde = beam_cube_dde
+        self.beam = rc((beam_lw, beam_mh, beam_nud, 2, 2))
+        self.l_grid = np.linspace(-1, 1, beam_lw)
+        self.m_grid = np.linspace(-1, 1, beam_mh)
+        self.freq_grid = np.linspace(.856e9, .856e9*2, beam_nud)
+        self.coords = np.stack([rf(size=(sources, times, ants, chans)) - .5,
+                                rf(size=(sources, times, ants, chans)) - .5,
+                                np.broadcast_to(
+                                    np.linspace(.856e9, .856e9*2, chans),
+                                    (sources, times, ants, chans))])
+        self.spline_order = spline_order
+        self.npoints = sources*times*ants*chans
+        self.run()
+
+    def run(self):
+        return self.beam_cube_dde(self.beam, self.coords, self.l_grid,
+                                  self.m_grid, self.freq_grid,
+                                  spline_order=self.spline_order)
+
+    def time_beam_cube_dde(self, *args):
+        self.run()
+
+    def peakmem_beam_cube_dde(self, *args):
+        self.run()
+
+    def track_throughput(self, *args):
+        return throughput(self.run, self.npoints)
+
+    track_throughput.unit = "pixels/s"
+
+
+class ZernikeDDE(object):
+    params = ([100, 1000], [16], [10, 20])
+    param_names = ['sources', 'chans', 'polynomials']
+
+    def setup(self, sources, chans, polynomials):
+        from africanus.rime import zernike_dde
+        from africanus.rime.zernike import nb_zernike_dde, zernike_tables
+
+        times, ants, corrs = 4, 16, (2, 2)
+
+        self.zernike_dde = zernike_dde
+        self.coords = rf(size=(3, sources, times, ants, chans)) - .5
+        self.coeffs = rc((ants, chans) + corrs + (polynomials,))
+        self.noll_index = np.broadcast_to(np.arange(1, polynomials + 1),
+                                          self.coeffs.shape).copy()
+        self.npoints = sources*times*ants*chans
+        self.run()
+
+        # Arguments for compiling the numba kernel
+        _, azimuth, radial = zernike_tables(self.noll_index)
+        self.nb_zernike_dde = nb_zernike_dde
+        self.nb_args = (self.coords,
+                        self.coeffs.reshape((ants, chans, 4, -1)),
+                        azimuth, radial,
+                        np.empty((sources, times, ants, chans, 4),
+                                 dtype=self.coeffs.dtype))
+
+    def run(self):
+        return self.zernike_dde(self.coords, self.coeffs, self.noll_index)
+
+    def time_zernike_dde(self, *args):
+        self.run()
+
+    def peakmem_zernike_dde(self, *args):
+        self.run()
+
+    def track_throughput(self, *args):
+        return throughput(self.run, self.npoints)
+
+    track_throughput.unit = "pixels/s"
+
+    def track_compile_time(self, *args):
+        return compile_time(self.nb_zernike_dde, *self.nb_args)
+
+    track_compile_time.unit = "s"
@@ -65,7 +65,8 @@ setup(
     entry_points={
         'console_scripts': [
             'plot-filter=africanus.filters.plot_filter:main',
-            'plot-taper=africanus.filters.plot_taper:main'],
+            'plot-taper=africanus.filters.plot_taper:main',
+            'filter-accuracy=africanus.filters.filter_accuracy:main'],
     },
     extras_require=extras_require,
     install_requires=requirements,
@@ -74,7 +75,7 @@ setup(
     include_package_data=True,
     keywords='codex-africanus',
     name='codex-africanus',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     setup_requires=setup_requirements,
     test_suite='tests',
     tests_require=test_requirements,